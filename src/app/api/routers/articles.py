@@ -181,6 +181,7 @@ async def search_semantic(
             min_importance_score=request.min_importance_score,
             date_from=request.date_from.isoformat() if request.date_from else None,
             date_to=request.date_to.isoformat() if request.date_to else None,
+            full_payload=False,  # details are loaded from the DB below
         )
 
         # Convert results to response format
@@ -264,11 +265,12 @@ async def get_similar_articles(
         # Get vector operations client
         vector_ops = get_vector_operations()
 
-        # Find similar articles
+        # Find similar articles (the reference article is excluded server-side)
         results = await vector_ops.find_similar_articles(
             vector_id=article.vector_id,
-            limit=limit + 1,  # +1 to exclude self
+            limit=limit,
             score_threshold=0.7,
+            full_payload=False,  # details are loaded from the DB below
         )
 
         # Filter out the original article and convert to response
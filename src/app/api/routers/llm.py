@@ -9,6 +9,8 @@ from src.app.api.schemas import (
     ArticleAnalysisResponse,
     ArticleSummaryRequest,
     ArticleSummaryResponse,
+    BatchEmbeddingRequest,
+    BatchEmbeddingResponse,
     ChatCompletionRequest,
     ChatCompletionResponse,
     EmbeddingRequest,
@@ -82,6 +84,33 @@ async def generate_embedding(request: EmbeddingRequest) -> EmbeddingResponse:
         ) from e
 
 
+@router.post("/embeddings/batch", response_model=BatchEmbeddingResponse)
+async def generate_embeddings_batch(request: BatchEmbeddingRequest) -> BatchEmbeddingResponse:
+    """
+    Generate embedding vectors for several texts in a single provider call.
+
+    Embeddings are returned in the same order as the input texts.
+    """
+    try:
+        # Create LLM client (always use OpenAI for embeddings)
+        client = LLMClient(provider="openai")
+
+        # Generate all embeddings in one request
+        embeddings = await client.agenerate_embeddings(texts=request.texts, model=request.model)
+
+        return BatchEmbeddingResponse(
+            embeddings=embeddings,
+            dimension=len(embeddings[0]),
+            model=request.model or client.model,
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Embedding generation failed: {str(e)}",
+        ) from e
+
+
 @router.post("/summarize", response_model=ArticleSummaryResponse)
 async def summarize_article(
     request: ArticleSummaryRequest,
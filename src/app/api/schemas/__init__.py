@@ -37,6 +37,8 @@ from app.api.schemas.llm import (
     ArticleAnalysisResponse,
     ArticleSummaryRequest,
     ArticleSummaryResponse,
+    BatchEmbeddingRequest,
+    BatchEmbeddingResponse,
     ChatCompletionRequest,
     ChatCompletionResponse,
     ChatMessage,
@@ -111,6 +113,8 @@ __all__ = [
     "ChatCompletionResponse",
     "EmbeddingRequest",
     "EmbeddingResponse",
+    "BatchEmbeddingRequest",
+    "BatchEmbeddingResponse",
     "ArticleSummaryRequest",
     "ArticleSummaryResponse",
     "ArticleAnalysisRequest",
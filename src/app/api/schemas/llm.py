@@ -74,6 +74,29 @@ class EmbeddingResponse(BaseModel):
     model: str = Field(..., description="Model used for embedding")
 
 
+class BatchEmbeddingRequest(BaseModel):
+    """Request schema for batch embedding generation endpoint."""
+
+    texts: list[str] = Field(..., min_length=1, max_length=100, description="Texts to embed")
+    model: str | None = Field(default=None, description="Embedding model name (optional)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "texts": ["AI research trends in 2024", "Transformer architecture"],
+                "model": "text-embedding-3-small",
+            },
+        }
+
+
+class BatchEmbeddingResponse(BaseModel):
+    """Response schema for batch embedding generation endpoint."""
+
+    embeddings: list[list[float]] = Field(..., description="Embedding vectors, in input order")
+    dimension: int = Field(..., description="Embedding dimension")
+    model: str = Field(..., description="Model used for embedding")
+
+
 class ArticleSummaryRequest(BaseModel):
     """Request schema for article summarization."""
 
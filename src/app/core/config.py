@@ -37,11 +37,19 @@ class Settings(BaseSettings):
     # Vector Database (Qdrant)
     QDRANT_HOST: str = "localhost"
     QDRANT_PORT: int = 6333
+    QDRANT_GRPC_PORT: int = 6334
+    QDRANT_PREFER_GRPC: bool = True  # gRPC for data-plane calls, HTTP as fallback
+    QDRANT_TIMEOUT: int = 30  # seconds per request
+    QDRANT_LOCATION: str = ""  # ":memory:" for an embedded in-process instance (overrides host/port)
     QDRANT_COLLECTION_NAME: str = "research_articles"
     QDRANT_VECTOR_SIZE: int = 1536  # OpenAI embedding size
+    QDRANT_QUANTIZATION: Literal["int8", "binary", "none"] = "int8"  # for new collections
 
     # LLM Configuration
     LLM_PROVIDER: Literal["openai", "claude"] = "openai"
+    # 모델별 요청 전 사전 제한 (분당 요청/토큰 수, 0이면 제한 없음)
+    LLM_REQUESTS_PER_MINUTE: int = 0
+    LLM_TOKENS_PER_MINUTE: int = 0
 
     # OpenAI
     OPENAI_API_KEY: str = Field(default="")
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import time
+from collections import deque
 from collections.abc import Callable
 from functools import wraps
 from typing import Any, TypeVar
@@ -149,33 +150,54 @@ def with_retry(
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls."""
+    """Sliding-window rate limiter for API calls, with an optional token budget.
 
-    def __init__(self, max_calls: int, time_window: float):
+    Callers wait *before* a request would exceed the limit, instead of
+    sending it and backing off after a 429.
+    """
+
+    def __init__(self, max_calls: int, time_window: float, max_tokens: int | None = None):
         """Initialize rate limiter.
 
         Args:
             max_calls: Maximum number of calls allowed
             time_window: Time window in seconds
+            max_tokens: Maximum number of tokens allowed per window (None for no token limit)
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls: list[float] = []
-
-    async def acquire(self):
-        """Wait until a call slot is available."""
-        import time
-
-        now = time.time()
-
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
+        self.max_tokens = max_tokens
+        self.calls: deque[tuple[float, int]] = deque()  # (call time, tokens)
+        self.throttled = 0  # number of acquire() calls that had to wait
 
+    def _fits(self, tokens: int) -> bool:
         if len(self.calls) >= self.max_calls:
-            oldest_call = min(self.calls)
-            sleep_time = self.time_window - (now - oldest_call)
+            return False
+        if self.max_tokens is None or not self.calls:
+            # A request larger than the whole budget still goes through on an empty window
+            return True
+        return sum(used for _, used in self.calls) + tokens <= self.max_tokens
 
-            if sleep_time > 0:
-                logger.debug(f"Rate limit reached. Waiting {sleep_time:.2f}s...")
-                await asyncio.sleep(sleep_time)
+    async def acquire(self, tokens: int = 0):
+        """Wait until a call slot (and ``tokens`` of the token budget) is available.
 
-        self.calls.append(time.time())
+        Args:
+            tokens: Estimated tokens used by the call
+        """
+        waited = False
+        while True:
+            now = time.monotonic()
+            while self.calls and now - self.calls[0][0] >= self.time_window:
+                self.calls.popleft()
+
+            # No await between the check and the append, so concurrent callers can't overbook
+            if self._fits(tokens):
+                self.calls.append((now, tokens))
+                return
+
+            if not waited:
+                waited = True
+                self.throttled += 1
+            sleep_time = self.time_window - (now - self.calls[0][0])
+            logger.debug(f"Rate limit reached. Waiting {sleep_time:.2f}s...")
+            await asyncio.sleep(sleep_time)
@@ -1,6 +1,8 @@
 """Security utilities for authentication and authorization."""
 
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any
 
 from jose import JWTError, jwt
 
@@ -59,6 +61,26 @@ def create_access_token(email: str) -> str:
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
+# 서명 검증(HMAC)은 토큰당 한 번만 수행, 만료(exp)는 verify_token에서 매번 다시 확인
+@lru_cache(maxsize=4096)
+def _decode_token(token: str, secret_key: str, algorithm: str) -> dict[str, Any] | None:
+    """
+    Decode and verify a JWT token, caching the result per token and key.
+
+    Args:
+        token: JWT token to decode
+        secret_key: Signing key (part of the cache key, so key rotation invalidates entries)
+        algorithm: Signing algorithm
+
+    Returns:
+        Token payload, or None if the token is invalid or expired
+    """
+    try:
+        return jwt.decode(token, secret_key, algorithms=[algorithm])
+    except JWTError:
+        return None
+
+
 # 토큰을 검증하여, 사용자 식별을 위해 이메일을 리턴
 def verify_token(token: str, expected_type: str = "access") -> str | None:
     """
@@ -71,20 +93,21 @@ def verify_token(token: str, expected_type: str = "access") -> str | None:
     Returns:
         Email if token is valid, None otherwise
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
-        # payload.get()은 Any | None을 반환하므로 타입 명시 제거
-        email = payload.get("sub")
-        token_type = payload.get("type")
-
-        # None 체크 및 타입 검증
-        if email is None or token_type != expected_type:
-            return None
-
-        return email
-    except JWTError:
+    payload = _decode_token(token, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+    if payload is None:
+        return None
+
+    # 캐시된 payload는 첫 디코딩 시점에만 만료 검증되었으므로 다시 확인
+    exp = payload.get("exp")
+    if exp is not None and exp <= datetime.now(UTC).timestamp():
         return None
+
+    # payload.get()은 Any | None을 반환하므로 타입 명시 제거
+    email = payload.get("sub")
+    token_type = payload.get("type")
+
+    # None 체크 및 타입 검증
+    if email is None or token_type != expected_type:
+        return None
+
+    return email
@@ -1,25 +1,120 @@
 """Email content builder for daily research digest."""
 
+import functools
+import hashlib
+import heapq
+import json
+import logging
 import os
+from bisect import bisect_right
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, select_autoescape
 
 from app.db.models import CollectedArticle
 
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# Output of compile_templates(); when present and built from the current template
+# sources, templates load from these precompiled modules instead of being lexed and parsed
+COMPILED_TEMPLATE_DIR = Path(__file__).parent / "compiled"
+
+# Source checksums written next to the compiled modules, to detect stale builds
+COMPILED_CHECKSUMS_FILE = "checksums.json"
+
+# Importance tiers: scores >= 0.6 are medium and >= 0.8 high (bisect_right keeps the
+# cut-off itself in the upper tier); each tier is (level, stars, label)
+IMPORTANCE_CUTOFFS = (0.6, 0.8)
+IMPORTANCE_TIERS = (
+    ("low", "⭐", "낮음"),
+    ("medium", "⭐⭐", "중간"),
+    ("high", "⭐⭐⭐", "높음"),
+)
+
+# Longest summary shown per article, including the "..." suffix
+SUMMARY_MAX_LENGTH = 200
+
+_TEMPLATE_LOADER = FileSystemLoader(str(TEMPLATE_DIR))
+
+
+def _template_checksums() -> dict[str, str]:
+    """SHA-256 of every template source, keyed by template name."""
+    return {
+        name: hashlib.sha256((TEMPLATE_DIR / name).read_bytes()).hexdigest()
+        for name in _TEMPLATE_LOADER.list_templates()
+    }
+
+
+def _compiled_templates_current(compiled_dir: Path) -> bool:
+    """
+    Check that ``compiled_dir`` was compiled from the current template sources.
+
+    Args:
+        compiled_dir: Output directory of ``compile_templates``
+
+    Returns:
+        bool: True if the recorded source checksums match the template sources
+    """
+    try:
+        recorded = json.loads((compiled_dir / COMPILED_CHECKSUMS_FILE).read_text())
+    except (OSError, ValueError):
+        return False
+    return recorded == _template_checksums()
+
+
+def _build_env(compiled_dir: Path | None = None) -> Environment:
+    """
+    Create the Jinja2 environment for the email templates.
+
+    Templates are loaded from the precompiled modules in ``compiled_dir``
+    when that directory exists and was compiled from the current template
+    sources; otherwise (e.g. a template was edited after the last
+    ``compile_templates``) they load from the sources. Loaded templates are
+    cached without re-checking their source files (``auto_reload=False``),
+    so template edits need a restart.
+
+    Args:
+        compiled_dir: Output directory of ``compile_templates``
+
+    Returns:
+        Environment: Configured Jinja2 environment
+    """
+    loader = _TEMPLATE_LOADER
+    if compiled_dir is not None and compiled_dir.is_dir():
+        if _compiled_templates_current(compiled_dir):
+            loader = ChoiceLoader([ModuleLoader(str(compiled_dir)), loader])
+        else:
+            logger.warning(
+                f"Precompiled templates in {compiled_dir} are stale, loading template sources "
+                "(run `make compile-templates` to rebuild)"
+            )
+    return Environment(
+        loader=loader,
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+    )
+
+
+# Shared by every EmailBuilder, so compiled templates are cached once per process
+_ENV = _build_env(COMPILED_TEMPLATE_DIR)
+
 
 class EmailBuilder:
     """Builder class for generating HTML email content from templates."""
 
-    def __init__(self):
-        """Initialize the email builder with Jinja2 environment."""
-        template_dir = Path(__file__).parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+    env = _ENV
+    template_loader = _TEMPLATE_LOADER
+
+    @functools.cached_property
+    def available_templates(self) -> frozenset[str]:
+        """Names of the templates in the template directory, listed once per builder."""
+        # ModuleLoader cannot list templates, so ask the source loader directly
+        return frozenset(self.template_loader.list_templates())
 
     def build_daily_digest(
         self,
@@ -72,9 +167,9 @@ class EmailBuilder:
         Select top N articles based on importance score.
 
         Strategy:
-        1. Sort all articles by importance_score (descending)
+        1. Rank articles by importance_score (descending, missing scores count as 0)
         2. Try to maintain balance across categories
-        3. Select top N articles
+        3. Select top N articles (a heap keeps only N candidates, O(n log N))
 
         Args:
             articles: List of collected articles
@@ -86,11 +181,8 @@ class EmailBuilder:
         if not articles:
             return []
 
-        # Sort by importance score
-        sorted_articles = sorted(articles, key=lambda x: x.importance_score or 0.0, reverse=True)
-
-        # Select top N
-        return sorted_articles[:limit]
+        # Top N by importance score; ties keep their input order, as with a stable sort
+        return heapq.nlargest(limit, articles, key=lambda x: x.importance_score or 0.0)
 
     def _group_by_category(
         self,
@@ -105,19 +197,15 @@ class EmailBuilder:
         Returns:
             tuple: (papers, news, reports) lists
         """
-        papers = []
-        news = []
-        reports = []
+        buckets: dict[str, list[CollectedArticle]] = {"paper": [], "news": [], "report": []}
 
+        # One dict lookup per article instead of an if/elif chain; other types are dropped
         for article in articles:
-            if article.source_type == "paper":
-                papers.append(article)
-            elif article.source_type == "news":
-                news.append(article)
-            elif article.source_type == "report":
-                reports.append(article)
+            bucket = buckets.get(article.source_type)
+            if bucket is not None:
+                bucket.append(article)
 
-        return papers, news, reports
+        return buckets["paper"], buckets["news"], buckets["report"]
 
     def _format_article(self, article: CollectedArticle) -> dict[str, Any]:
         """
@@ -131,23 +219,14 @@ class EmailBuilder:
         """
         # Calculate importance level and stars
         importance_score = article.importance_score or 0.0
-        if importance_score >= 0.8:
-            importance_level = "high"
-            importance_stars = "⭐⭐⭐"
-            importance_label = "높음"
-        elif importance_score >= 0.6:
-            importance_level = "medium"
-            importance_stars = "⭐⭐"
-            importance_label = "중간"
-        else:
-            importance_level = "low"
-            importance_stars = "⭐"
-            importance_label = "낮음"
+        importance_level, importance_stars, importance_label = IMPORTANCE_TIERS[
+            bisect_right(IMPORTANCE_CUTOFFS, importance_score)
+        ]
 
-        # Truncate summary if too long
+        # Truncate summary if too long (a single slice, no scanning for word breaks)
         summary = article.summary or article.content or ""
-        if len(summary) > 200:
-            summary = summary[:197] + "..."
+        if len(summary) > SUMMARY_MAX_LENGTH:
+            summary = summary[: SUMMARY_MAX_LENGTH - 3] + "..."
 
         # Extract metadata
         metadata = article.article_metadata or {}
@@ -193,10 +272,10 @@ class EmailBuilder:
         if not authors:
             return None
 
-        if len(authors) <= 3:
-            return ", ".join(authors)
-
-        return f"{', '.join(authors[:3])} 외 {len(authors) - 3}명"
+        # One join over at most 3 names; the remainder only adds a count suffix
+        shown = ", ".join(authors[:3])
+        hidden = len(authors) - 3
+        return f"{shown} 외 {hidden}명" if hidden > 0 else shown
 
     def _get_settings_url(self) -> str:
         """Get settings page URL."""
@@ -227,6 +306,24 @@ class EmailBuilder:
         template = self.env.get_template(template_name)
         return template.render(**context)
 
+    def stream_template(self, template_name: str, context: dict[str, Any]) -> Iterator[str]:
+        """
+        Render a Jinja2 template lazily, one HTML fragment at a time.
+
+        For consumers that write the output incrementally (files, chunked HTTP
+        responses) without holding the whole document in memory. The SMTP path
+        needs a complete body for MIMEText, so it keeps using `render_template`.
+
+        Args:
+            template_name: Name of the template file
+            context: Template context data
+
+        Yields:
+            str: Consecutive fragments of the rendered HTML
+        """
+        template = self.env.get_template(template_name)
+        yield from template.generate(**context)
+
 
 # Convenience function for quick email building
 def build_daily_digest_email(
@@ -249,3 +346,27 @@ def build_daily_digest_email(
     """
     builder = EmailBuilder()
     return builder.build_daily_digest(user_name, user_email, articles, daily_limit)
+
+
+def compile_templates(target: Path = COMPILED_TEMPLATE_DIR) -> Path:
+    """
+    Precompile the email templates to Python modules.
+
+    ``EmailBuilder`` loads templates from ``COMPILED_TEMPLATE_DIR`` when it
+    exists, skipping the lexer and parser at load time. The source checksums
+    are recorded alongside; after a template is edited the compiled modules
+    are ignored until this is rerun.
+
+    Args:
+        target: Directory to write the compiled modules to
+
+    Returns:
+        Path: The target directory
+    """
+    _build_env().compile_templates(str(target), zip=None)
+    (target / COMPILED_CHECKSUMS_FILE).write_text(json.dumps(_template_checksums(), indent=2))
+    return target
+
+
+if __name__ == "__main__":
+    print(f"Compiled email templates to {compile_templates()}")
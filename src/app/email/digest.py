@@ -1,14 +1,17 @@
 """Daily digest orchestration - integrates builder, sender, and history."""
 
+import asyncio
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from app.db.models import CollectedArticle, User, UserPreference
+from app.db.models import CollectedArticle, User
 from app.email.builder import EmailBuilder
 from app.email.history import save_sent_digest
 from app.email.sender import EmailSender
@@ -28,6 +31,9 @@ class DigestOrchestrator:
         """
         self.builder = EmailBuilder()
         self.sender = email_sender or EmailSender()
+        # An AsyncSession cannot run concurrent operations, so batched digests take
+        # turns on the session while building and sending emails in parallel
+        self._session_lock = asyncio.Lock()
 
     async def send_user_digest(
         self,
@@ -35,6 +41,7 @@ class DigestOrchestrator:
         user_id: UUID | str,
         articles: list[CollectedArticle],
         subject: str | None = None,
+        user: User | None = None,
     ) -> dict[str, Any]:
         """
         Send daily digest email to a single user.
@@ -44,6 +51,8 @@ class DigestOrchestrator:
             user_id: User UUID
             articles: List of collected articles
             subject: Optional custom subject (defaults to date-based)
+            user: Already loaded user with `preference` eagerly loaded; skips the
+                database lookup (as prefetched by `send_batch_digests`)
 
         Returns:
             dict: Result with success status and digest_id
@@ -56,20 +65,25 @@ class DigestOrchestrator:
             if isinstance(user_id, str):
                 user_id = UUID(user_id)
 
-            # Load user and preferences
-            user = await self._load_user(session, user_id)
+            # Load user and preferences in one query
+            if user is None:
+                async with self._session_lock:
+                    user = await self._load_user(session, user_id)
+
             if not user:
                 raise ValueError(f"User {user_id} not found")
 
-            preferences = await self._load_user_preferences(session, user_id)
+            preferences = user.preference
             if not preferences:
                 raise ValueError(f"User {user_id} has no preferences")
 
             # Get daily limit from preferences
             daily_limit = preferences.daily_limit or 5
 
-            # Build email content
-            html_content = self.builder.build_daily_digest(
+            # Build email content in a worker thread; rendering is CPU-bound and would
+            # otherwise stall the other digests' SMTP sends on the event loop
+            html_content = await asyncio.to_thread(
+                self.builder.build_daily_digest,
                 user_name=user.name,
                 user_email=user.email,
                 articles=articles,
@@ -90,7 +104,8 @@ class DigestOrchestrator:
 
             # Save digest history
             article_ids = [str(article.id) for article in articles[:daily_limit]]
-            digest = await save_sent_digest(session, user_id, article_ids)
+            async with self._session_lock:
+                digest = await save_sent_digest(session, user_id, article_ids)
 
             logger.info(f"Successfully sent digest to user {user_id}")
 
@@ -115,34 +130,60 @@ class DigestOrchestrator:
         session: AsyncSession,
         user_articles: dict[UUID | str, list[CollectedArticle]],
         max_failures: int = 5,
+        concurrency: int = 5,
     ) -> dict[str, Any]:
         """
         Send daily digests to multiple users.
 
+        Up to `concurrency` workers send digests, each taking the next user as
+        soon as its previous send finishes. Once `max_failures` digests have
+        failed the workers stop taking users, so no further sends are started;
+        sends already in flight still finish and are reported.
+
         Args:
             session: Database session
             user_articles: Dict mapping user_id to list of articles
             max_failures: Maximum number of failures before stopping
+            concurrency: Maximum number of digests sent concurrently (default: 5)
 
         Returns:
             dict: Summary with success_count, failure_count, results
+                (results in the order of `user_articles`)
         """
+        # One query for every user and their preferences instead of one per digest
+        async with self._session_lock:
+            users = await self._load_users(session, user_articles)
+
         success_count = 0
         failure_count = 0
-        results = []
+        pending = iter(enumerate(user_articles.items()))
+        results_by_index: dict[int, dict[str, Any]] = {}
+
+        async def worker() -> None:
+            nonlocal success_count, failure_count
+            while failure_count < max_failures:
+                item = next(pending, None)
+                if item is None:
+                    return
+                index, (user_id, articles) = item
+
+                result = await self.send_user_digest(
+                    session, user_id, articles, user=users.get(_as_uuid(user_id))
+                )
+                results_by_index[index] = result
+
+                if result["success"]:
+                    success_count += 1
+                else:
+                    failure_count += 1
 
-        for user_id, articles in user_articles.items():
-            if failure_count >= max_failures:
-                logger.warning(f"Stopping batch digest send: reached max failures ({max_failures})")
-                break
+        workers = min(max(1, concurrency), len(user_articles))
+        await asyncio.gather(*(worker() for _ in range(workers)))
 
-            result = await self.send_user_digest(session, user_id, articles)
-            results.append(result)
+        if failure_count >= max_failures:
+            logger.warning(f"Stopping batch digest send: reached max failures ({max_failures})")
 
-            if result["success"]:
-                success_count += 1
-            else:
-                failure_count += 1
+        results = [results_by_index[index] for index in sorted(results_by_index)]
 
         logger.info(f"Batch digest send complete: {success_count} succeeded, {failure_count} failed")
 
@@ -153,20 +194,37 @@ class DigestOrchestrator:
         }
 
     async def _load_user(self, session: AsyncSession, user_id: UUID) -> User | None:
-        """Load user from database."""
-        stmt = select(User).where(User.id == user_id)
+        """Load user, with preferences joined in the same query, from database."""
+        stmt = select(User).options(joinedload(User.preference)).where(User.id == user_id)
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def _load_user_preferences(
+    async def _load_users(
         self,
         session: AsyncSession,
-        user_id: UUID,
-    ) -> UserPreference | None:
-        """Load user preferences from database."""
-        stmt = select(UserPreference).where(UserPreference.user_id == user_id)
+        user_ids: Iterable[UUID | str],
+    ) -> dict[UUID, User]:
+        """Load users, with preferences joined, in a single query keyed by user ID.
+
+        Invalid IDs are left out, so `send_user_digest` reports them as usual.
+        """
+        ids = {uuid for uuid in map(_as_uuid, user_ids) if uuid is not None}
+        if not ids:
+            return {}
+
+        stmt = select(User).options(joinedload(User.preference)).where(User.id.in_(ids))
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        return {user.id: user for user in result.scalars()}
+
+
+def _as_uuid(value: UUID | str) -> UUID | None:
+    """Return `value` as a UUID, or None if it is not a valid UUID string."""
+    if isinstance(value, UUID):
+        return value
+    try:
+        return UUID(value)
+    except (TypeError, ValueError):
+        return None
 
 
 async def send_daily_digest(
@@ -195,6 +253,7 @@ async def send_batch_daily_digests(
     session: AsyncSession,
     user_articles: dict[UUID | str, list[CollectedArticle]],
     max_failures: int = 5,
+    concurrency: int = 5,
 ) -> dict[str, Any]:
     """
     Convenience function to send daily digests to multiple users.
@@ -203,9 +262,12 @@ async def send_batch_daily_digests(
         session: Database session
         user_articles: Dict mapping user_id to list of articles
         max_failures: Maximum number of failures before stopping
+        concurrency: Maximum number of digests sent concurrently
 
     Returns:
         dict: Summary with success_count, failure_count, results
     """
     orchestrator = DigestOrchestrator()
-    return await orchestrator.send_batch_digests(session, user_articles, max_failures)
+    return await orchestrator.send_batch_digests(
+        session, user_articles, max_failures, concurrency=concurrency
+    )
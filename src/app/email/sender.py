@@ -1,5 +1,6 @@
 """Email sender using SMTP with retry logic."""
 
+import asyncio
 import logging
 import os
 from email.mime.multipart import MIMEMultipart
@@ -113,38 +114,58 @@ class EmailSender:
         self,
         recipients: list[dict[str, Any]],
         max_failures: int = 5,
+        max_concurrency: int = 1,
     ) -> dict[str, Any]:
         """
         Send emails to multiple recipients.
 
+        Up to `max_concurrency` workers send emails, each taking the next
+        recipient as soon as its previous send finishes. Once `max_failures`
+        emails have failed no further sends are started; sends already in
+        flight still finish and are reported.
+
         Args:
             recipients: List of dicts with keys: to_email, subject, html_content, text_content
             max_failures: Maximum number of failures before stopping
+            max_concurrency: Maximum number of emails sent concurrently (default: 1, sequential)
 
         Returns:
             dict: Summary with success_count, failure_count, failed_emails
+                (failed_emails in the order of `recipients`)
         """
         success_count = 0
         failure_count = 0
-        failed_emails = []
-
-        for recipient in recipients:
-            if failure_count >= max_failures:
-                logger.warning(f"Stopping batch send: reached max failures ({max_failures})")
-                break
-
-            try:
-                await self.send_email(
-                    to_email=recipient["to_email"],
-                    subject=recipient["subject"],
-                    html_content=recipient["html_content"],
-                    text_content=recipient.get("text_content"),
-                )
-                success_count += 1
-            except Exception as e:
-                failure_count += 1
-                failed_emails.append({"email": recipient["to_email"], "error": str(e)})
-                logger.error(f"Failed to send to {recipient['to_email']}: {e}")
+        pending = iter(enumerate(recipients))
+        failed_by_index: dict[int, dict[str, str]] = {}
+
+        async def worker() -> None:
+            nonlocal success_count, failure_count
+            while failure_count < max_failures:
+                item = next(pending, None)
+                if item is None:
+                    return
+                index, recipient = item
+
+                try:
+                    await self.send_email(
+                        to_email=recipient["to_email"],
+                        subject=recipient["subject"],
+                        html_content=recipient["html_content"],
+                        text_content=recipient.get("text_content"),
+                    )
+                    success_count += 1
+                except Exception as e:
+                    failure_count += 1
+                    failed_by_index[index] = {"email": recipient["to_email"], "error": str(e)}
+                    logger.error(f"Failed to send to {recipient['to_email']}: {e}")
+
+        workers = min(max(1, max_concurrency), len(recipients))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        if failure_count >= max_failures:
+            logger.warning(f"Stopping batch send: reached max failures ({max_failures})")
+
+        failed_emails = [failed_by_index[index] for index in sorted(failed_by_index)]
 
         logger.info(f"Batch send complete: {success_count} succeeded, {failure_count} failed")
 
@@ -1,18 +1,51 @@
 """LLM client wrapper using LiteLLM for unified API access."""
 
+import base64
 import json
+import sys
+from collections.abc import Iterable
 from functools import lru_cache
 from typing import Any, Literal
 
 import litellm
+import numpy as np
 from litellm import completion, embedding
 
 from app.core.config import settings
+from app.core.retry import RateLimiter
 
 # Disable verbose logging for litellm
 litellm.suppress_debug_info = True
 
 
+def _decode_embedding(data: str | list[float]) -> list[float]:
+    """Unpack a base64 embedding (packed little-endian float32) into a list of floats.
+
+    Providers that ignore ``encoding_format`` return plain float lists, which pass through.
+    """
+    if isinstance(data, str):
+        return np.frombuffer(base64.b64decode(data), dtype="<f4").tolist()
+    return data
+
+
+def _build_rate_limiter() -> RateLimiter | None:
+    """Rate limiter from the ``LLM_*_PER_MINUTE`` settings, or None when both are 0."""
+    requests_per_minute = settings.LLM_REQUESTS_PER_MINUTE
+    tokens_per_minute = settings.LLM_TOKENS_PER_MINUTE
+    if not requests_per_minute and not tokens_per_minute:
+        return None
+    return RateLimiter(
+        max_calls=requests_per_minute or sys.maxsize,
+        time_window=60.0,
+        max_tokens=tokens_per_minute or None,
+    )
+
+
+def _estimate_tokens(texts: Iterable[str], max_tokens: int = 0) -> int:
+    """Rough token count for rate limiting: ~4 characters per token plus the completion budget."""
+    return sum(len(text) for text in texts) // 4 + max_tokens
+
+
 class LLMClient:
     """
     Unified LLM client that supports multiple providers (OpenAI, Claude, etc.).
@@ -51,6 +84,14 @@ class LLMClient:
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
+        # Client-side RPM/TPM limit, shared by every caller of this (cached) client
+        self.rate_limiter = _build_rate_limiter()
+
+    async def _throttle(self, tokens: int) -> None:
+        """Wait until the request fits within the configured rate limits (no-op if unset)."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(tokens)
+
     def chat_completion(
         self,
         messages: list[dict[str, str]],
@@ -174,13 +215,16 @@ class LLMClient:
         embedding_model = model or settings.OPENAI_EMBEDDING_MODEL
 
         try:
-            response = embedding(model=embedding_model, input=text)
-            return response.data[0]["embedding"]
+            # base64 skips parsing 1536 JSON floats per vector; dropped for providers without it
+            response = embedding(
+                model=embedding_model, input=text, encoding_format="base64", drop_params=True
+            )
+            return _decode_embedding(response.data[0]["embedding"])
         # response 답변 구조가 다음과 같기 때문이다.
         # response = {
         #     "data": [
         #         {
-        #             "embedding": [0.123, -0.456, 0.789, ...],  # 1536개의 float
+        #             "embedding": "AAAgPw...",  # base64로 인코딩된 float32 1536개
         #             "index": 0
         #         }
         #     ],
@@ -234,6 +278,8 @@ class LLMClient:
         if response_format == "json" and self.provider == "openai":
             completion_params["response_format"] = {"type": "json_object"}
 
+        await self._throttle(_estimate_tokens((str(m.get("content", "")) for m in messages), max_tok))
+
         try:
             response = await litellm.acompletion(**completion_params)
 
@@ -271,10 +317,39 @@ class LLMClient:
             Embedding vector as list of floats
         """
         embedding_model = model or settings.OPENAI_EMBEDDING_MODEL
+        await self._throttle(_estimate_tokens([text]))
+
+        try:
+            response = await litellm.aembedding(
+                model=embedding_model, input=text, encoding_format="base64", drop_params=True
+            )
+            return _decode_embedding(response.data[0]["embedding"])
+
+        except Exception as e:
+            raise RuntimeError(f"Async embedding generation failed: {e}") from e
+
+    async def agenerate_embeddings(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        """
+        Generate embedding vectors for several texts in one request.
+
+        Args:
+            texts: Input texts to embed
+            model: Embedding model name (if None, uses default)
+
+        Returns:
+            Embedding vectors, in the same order as ``texts``
+        """
+        embedding_model = model or settings.OPENAI_EMBEDDING_MODEL
+        await self._throttle(_estimate_tokens(texts))
 
         try:
-            response = await litellm.aembedding(model=embedding_model, input=text)
-            return response.data[0]["embedding"]
+            response = await litellm.aembedding(
+                model=embedding_model, input=texts, encoding_format="base64", drop_params=True
+            )
+            data = sorted(response.data, key=lambda item: item["index"])
+            return [_decode_embedding(item["embedding"]) for item in data]
 
         except Exception as e:
             raise RuntimeError(f"Async embedding generation failed: {e}") from e
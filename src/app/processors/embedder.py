@@ -8,8 +8,12 @@ and caching for improved performance.
 import asyncio
 import hashlib
 import logging
+import os
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
+import numpy as np
 import tiktoken
 from tenacity import (
     RetryError,
@@ -25,12 +29,38 @@ from app.llm.client import get_llm_client
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Get the tiktoken encoding for a model, shared by all TextEmbedder instances.
+
+    Args:
+        model: Embedding model name
+
+    Returns:
+        Encoding for the model, or cl100k_base if tiktoken does not know it
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 class TextEmbedder:
     """Text embedding generator with caching and retry logic."""
 
     # OpenAI embedding model token limits
     MAX_TOKENS = 8191  # text-embedding-3-small max tokens
 
+    # Initial number of rows allocated for the embedding cache (doubles when full)
+    CACHE_INITIAL_CAPACITY = 256
+
+    # Maximum number of inputs / total tokens the OpenAI embeddings API accepts in one request
+    MAX_INPUTS_PER_REQUEST = 2048
+    MAX_TOKENS_PER_REQUEST = 300_000
+
+    # Below this many texts, tokenizing serially beats spinning up encode_batch's thread pool
+    PARALLEL_TOKENIZE_MIN_TEXTS = 64
+
     def __init__(
         self,
         model: str | None = None,
@@ -57,28 +87,67 @@ class TextEmbedder:
         # Get LLM client
         self.llm_client = get_llm_client(provider="openai", model=self.model)
 
-        # Initialize tokenizer for token counting
-        try:
-            self.tokenizer = tiktoken.encoding_for_model("text-embedding-3-small")
-        except KeyError:
-            # Fallback to cl100k_base encoding if model not found
-            self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        # Tokenizer for token counting (resolved once per model, shared across instances)
+        self.tokenizer = _get_encoding(self.model)
 
-        # In-memory cache
-        self._cache: dict[str, list[float]] = {}
+        # In-memory cache: 64-bit text hash -> row of a contiguous float32 matrix
+        self._cache_index: dict[int, int] = {}
+        self._cache_matrix: np.ndarray | None = None
+        self._cache_rows = 0
 
         logger.info(f"TextEmbedder initialized with model: {self.model}")
 
-    def _get_cache_key(self, text: str) -> str:
-        """Generate cache key for text using SHA-256 hash.
+    def _get_cache_key(self, text: str) -> int:
+        """Generate cache key for text using a 64-bit BLAKE2b hash.
 
         Args:
             text: Input text
 
         Returns:
-            SHA-256 hash of the text
+            64-bit integer hash of the text
         """
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+    def _cache_get(self, key: int) -> list[float] | None:
+        """Return the cached embedding for a key, or None on a miss."""
+        row = self._cache_index.get(key)
+        if row is None:
+            return None
+        return self._cache_matrix[row].tolist()
+
+    def _cache_put(self, key: int, embedding: list[float]) -> list[float]:
+        """Store an embedding as a float32 row and return it as cached.
+
+        The matrix is allocated on first use with the embedding's dimension and
+        doubles in capacity when full.
+
+        Args:
+            key: Cache key from ``_get_cache_key``
+            embedding: Embedding vector
+
+        Returns:
+            The embedding as stored (float32 precision), so cache hits and
+            misses return identical values
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        dimension = vector.shape[0]
+
+        if self._cache_matrix is None or self._cache_matrix.shape[1] != dimension:
+            self._cache_matrix = np.empty((self.CACHE_INITIAL_CAPACITY, dimension), dtype=np.float32)
+            self._cache_index.clear()
+            self._cache_rows = 0
+        elif self._cache_rows == len(self._cache_matrix):
+            grown = np.empty((2 * len(self._cache_matrix), dimension), dtype=np.float32)
+            grown[: self._cache_rows] = self._cache_matrix[: self._cache_rows]
+            self._cache_matrix = grown
+
+        row = self._cache_index.get(key)
+        if row is None:
+            row = self._cache_rows
+            self._cache_index[key] = row
+            self._cache_rows += 1
+        self._cache_matrix[row] = vector
+        return self._cache_matrix[row].tolist()
 
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in text.
@@ -97,6 +166,43 @@ class TextEmbedder:
             # Fallback: rough estimate (1 token ≈ 4 characters)
             return len(text) // 4
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Count the number of tokens in many texts at once.
+
+        Batches of at least ``PARALLEL_TOKENIZE_MIN_TEXTS`` texts use tiktoken's
+        ``encode_batch``, which tokenizes in a native thread pool without holding
+        the GIL; smaller batches are encoded serially, where the pool overhead
+        would dominate.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Number of tokens per text, in input order
+        """
+        if len(texts) < self.PARALLEL_TOKENIZE_MIN_TEXTS:
+            return [self.count_tokens(text) for text in texts]
+        try:
+            num_threads = min(len(texts), os.cpu_count() or 1)
+            encoded = self.tokenizer.encode_batch(texts, num_threads=num_threads)
+            return [len(tokens) for tokens in encoded]
+        except Exception as e:
+            logger.warning(f"Error counting tokens in batch, counting per text: {e}")
+            return [self.count_tokens(text) for text in texts]
+
+    async def _count_tokens_batch_async(self, texts: list[str]) -> list[int]:
+        """Count tokens for async callers without blocking the event loop on large batches.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Number of tokens per text, in input order
+        """
+        if len(texts) < self.PARALLEL_TOKENIZE_MIN_TEXTS:
+            return self.count_tokens_batch(texts)
+        return await asyncio.to_thread(self.count_tokens_batch, texts)
+
     def truncate_text(self, text: str, max_tokens: int | None = None) -> str:
         """Truncate text to fit within token limit.
 
@@ -108,26 +214,24 @@ class TextEmbedder:
             Truncated text
         """
         max_tokens = max_tokens or self.MAX_TOKENS
-        token_count = self.count_tokens(text)
 
-        if token_count <= max_tokens:
-            return text
-
-        # Truncate text by decoding tokens
+        # Encode once: the token IDs give both the count and the truncation point
         try:
             tokens = self.tokenizer.encode(text)
-            truncated_tokens = tokens[:max_tokens]
-            truncated_text = self.tokenizer.decode(truncated_tokens)
-            logger.warning(
-                f"Text truncated from {token_count} to {max_tokens} tokens",
-            )
-            return truncated_text
         except Exception as e:
             logger.error(f"Error truncating text: {e}")
-            # Fallback: character-based truncation (rough estimate)
+            # Fallback: character-based truncation (rough estimate, 1 token ≈ 4 characters)
             char_limit = max_tokens * 4
             return text[:char_limit]
 
+        if len(tokens) <= max_tokens:
+            return text
+
+        logger.warning(
+            f"Text truncated from {len(tokens)} to {max_tokens} tokens",
+        )
+        return self.tokenizer.decode(tokens[:max_tokens])
+
     @retry(
         retry=retry_if_exception_type((RuntimeError, ConnectionError)),
         stop=stop_after_attempt(3),
@@ -153,6 +257,30 @@ class TextEmbedder:
             logger.error(f"Error generating embedding: {e}")
             raise RuntimeError(f"Embedding generation failed: {e}") from e
 
+    @retry(
+        retry=retry_if_exception_type((RuntimeError, ConnectionError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        reraise=True,
+    )
+    async def _embed_many_with_retry(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts in one request, with automatic retry.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Embedding vectors, in input order
+
+        Raises:
+            RuntimeError: If embedding generation fails after all retries
+        """
+        try:
+            return await self.llm_client.agenerate_embeddings(texts, model=self.model)
+        except Exception as e:
+            logger.error(f"Error generating embeddings for {len(texts)} texts: {e}")
+            raise RuntimeError(f"Embedding generation failed: {e}") from e
+
     async def embed(self, text: str, truncate: bool = True) -> list[float]:
         """Generate embedding for single text.
 
@@ -173,34 +301,55 @@ class TextEmbedder:
             >>> len(embedding)
             1536
         """
+        return await self._embed(text, truncate=truncate)
+
+    async def _embed(
+        self,
+        text: str,
+        truncate: bool = True,
+        token_count: int | None = None,
+    ) -> list[float]:
+        """Generate embedding for single text, reusing a precomputed token count.
+
+        Args:
+            text: Input text
+            truncate: Automatically truncate text if exceeds token limit
+            token_count: Token count of ``text`` if already known (e.g. from
+                ``count_tokens_batch``); counted here when needed otherwise
+
+        Returns:
+            Embedding vector (list of floats)
+        """
         if not text or not text.strip():
             raise ValueError("Empty text provided for embedding")
 
         # Check cache
         if self.use_cache:
             cache_key = self._get_cache_key(text)
-            if cache_key in self._cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
                 logger.debug(f"Cache hit for text: {text[:50]}...")
-                return self._cache[cache_key]
+                return cached
 
         # Truncate if needed
         if truncate:
-            token_count = self.count_tokens(text)
+            if token_count is None:
+                token_count = self.count_tokens(text)
             if token_count > self.MAX_TOKENS:
                 text = self.truncate_text(text)
+                token_count = self.MAX_TOKENS
 
         # Generate embedding with retry
         try:
             embedding = await self._embed_with_retry(text)
 
-            # Cache result
+            # Cache result under the original (pre-truncation) text's key
             if self.use_cache:
-                cache_key = self._get_cache_key(text)
-                self._cache[cache_key] = embedding
+                embedding = self._cache_put(cache_key, embedding)
 
+            tokens = f" ({token_count} tokens)" if token_count is not None else ""
             logger.info(
-                f"Embedding generated: {len(embedding)} dimensions "
-                f"for text: {text[:50]}... ({self.count_tokens(text)} tokens)",
+                f"Embedding generated: {len(embedding)} dimensions for text: {text[:50]}...{tokens}",
             )
 
             return embedding
@@ -215,14 +364,23 @@ class TextEmbedder:
         batch_size: int = 10,
         truncate: bool = True,
         fail_on_error: bool = False,
+        max_concurrent_batches: int = 5,
     ) -> list[list[float]]:
         """Generate embeddings for multiple texts in batches.
 
+        Tokens are counted for all texts in one ``count_tokens_batch`` call, and
+        texts are sorted by token count (longest first) before batching so each
+        batch holds texts of similar size and no batch is held up by a single long
+        outlier. Batches are dispatched concurrently, with at most
+        ``max_concurrent_batches`` in flight to stay under provider rate limits.
+        Results are returned in input order.
+
         Args:
             texts: List of input texts
-            batch_size: Number of texts to process concurrently
+            batch_size: Number of texts to process concurrently within a batch
             truncate: Automatically truncate texts exceeding token limit
             fail_on_error: If True, raise exception on any error; if False, return zero vectors
+            max_concurrent_batches: Maximum number of batches embedded at the same time
 
         Returns:
             List of embedding vectors
@@ -237,39 +395,132 @@ class TextEmbedder:
             logger.warning("Empty texts list provided")
             return []
 
-        all_embeddings: list[list[float]] = []
+        token_counts = await self._count_tokens_batch_async(texts)
+        order = sorted(range(len(texts)), key=lambda i: token_counts[i], reverse=True)
+        batches = [order[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_batches))
+
+        async def embed_batch(index: int, batch: list[int]) -> list[list[float] | BaseException]:
+            async with semaphore:
+                logger.info(f"Processing batch {index + 1}/{len(batches)}: {len(batch)} texts")
+                tasks = [
+                    self._embed(texts[i], truncate=truncate, token_count=token_counts[i]) for i in batch
+                ]
+                return await asyncio.gather(*tasks, return_exceptions=True)
+
+        batch_results = await asyncio.gather(
+            *(embed_batch(index, batch) for index, batch in enumerate(batches))
+        )
+
+        all_embeddings: list[list[float]] = [[] for _ in texts]
+        failed = 0
+
+        # Scatter results back to input order
+        for i, result in zip(order, chain.from_iterable(batch_results), strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error embedding text {i}: {result}")
+                if fail_on_error:
+                    raise result
+                # Return zero vector on error
+                failed += 1
+                all_embeddings[i] = [0.0] * self.get_embedding_dimension()
+            else:
+                all_embeddings[i] = result
+
+        logger.info(
+            f"Batch embedding completed: {len(all_embeddings)} texts, "
+            f"{len(all_embeddings) - failed} succeeded",
+        )
+
+        return all_embeddings
 
-        # Process in batches to avoid rate limits
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            logger.info(f"Processing batch {i // batch_size + 1}: {len(batch)} texts")
+    def _request_chunks(self, token_counts: list[int]) -> list[tuple[int, int]]:
+        """Split inputs into ``(start, end)`` ranges that each fit in one embeddings request.
 
-            # Generate embeddings concurrently within batch
-            tasks = [self.embed(text, truncate=truncate) for text in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            token_counts: Token count of each input, in order
 
-            # Process results
-            for j, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error embedding text {i + j}: {result}")
-                    if fail_on_error:
-                        raise result
-                    # Return zero vector on error
-                    all_embeddings.append([0.0] * self.get_embedding_dimension())
-                else:
-                    all_embeddings.append(result)
+        Returns:
+            Consecutive ranges covering all inputs, each within
+            ``MAX_INPUTS_PER_REQUEST`` inputs and ``MAX_TOKENS_PER_REQUEST`` tokens
+        """
+        chunks = []
+        start = 0
+        chunk_tokens = 0
+        for i, count in enumerate(token_counts):
+            full = i - start >= self.MAX_INPUTS_PER_REQUEST
+            if i > start and (full or chunk_tokens + count > self.MAX_TOKENS_PER_REQUEST):
+                chunks.append((start, i))
+                start, chunk_tokens = i, 0
+            chunk_tokens += count
+        if start < len(token_counts):
+            chunks.append((start, len(token_counts)))
+        return chunks
+
+    async def embed_many(self, texts: list[str], truncate: bool = True) -> list[list[float]]:
+        """Generate embeddings for many texts with as few API requests as possible.
+
+        Unlike ``batch_embed``, which sends one request per text, texts missing
+        from the cache are sent together, so N texts cost one round trip instead
+        of N. Requests are split so that none exceeds ``MAX_INPUTS_PER_REQUEST``
+        inputs or ``MAX_TOKENS_PER_REQUEST`` total tokens. Any failure fails the
+        whole call.
+
+        Args:
+            texts: List of input texts
+            truncate: Automatically truncate texts exceeding token limit
 
-            # Small delay between batches to respect rate limits
-            if i + batch_size < len(texts):
-                await asyncio.sleep(0.5)
+        Returns:
+            List of embedding vectors, in input order
+
+        Raises:
+            ValueError: If any text is empty
+            RuntimeError: If embedding generation fails
+
+        Examples:
+            >>> embeddings = await embedder.embed_many(["Text 1", "Text 2", "Text 3"])
+            >>> len(embeddings)
+            3
+        """
+        if any(not text or not text.strip() for text in texts):
+            raise ValueError("Empty text provided for embedding")
+
+        embeddings: list[list[float] | None] = [None] * len(texts)
+        cache_keys = [self._get_cache_key(text) for text in texts] if self.use_cache else []
+        if self.use_cache:
+            embeddings = [self._cache_get(key) for key in cache_keys]
+
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not missing:
+            return embeddings
+
+        inputs = [texts[i] for i in missing]
+        token_counts = await self._count_tokens_batch_async(inputs)
+        if truncate:
+            inputs = [
+                self.truncate_text(text) if count > self.MAX_TOKENS else text
+                for text, count in zip(inputs, token_counts, strict=True)
+            ]
+            token_counts = [min(count, self.MAX_TOKENS) for count in token_counts]
+
+        responses = await asyncio.gather(
+            *(
+                self._embed_many_with_retry(inputs[start:end])
+                for start, end in self._request_chunks(token_counts)
+            )
+        )
+
+        for i, embedding in zip(missing, chain.from_iterable(responses), strict=True):
+            if self.use_cache:
+                embedding = self._cache_put(cache_keys[i], embedding)
+            embeddings[i] = embedding
 
         logger.info(
-            f"Batch embedding completed: {len(all_embeddings)} texts, "
-            f"{sum(1 for e in all_embeddings if e != [0.0] * self.get_embedding_dimension())} "
-            f"succeeded",
+            f"Embeddings generated: {len(missing)} texts in {len(responses)} request(s), "
+            f"{len(texts) - len(missing)} cached",
         )
 
-        return all_embeddings
+        return embeddings
 
     def prepare_article_text(
         self,
@@ -296,6 +547,21 @@ class TextEmbedder:
             ...     summary="GPT-4는 대규모 멀티모달 모델입니다."
             ... )
         """
+        # Ensure within token limit
+        return self.truncate_text(self._combine_article_fields(title, content, summary))
+
+    @staticmethod
+    def _combine_article_fields(title: str, content: str, summary: str | None = None) -> str:
+        """Join article fields into one embedding text, without truncation.
+
+        Args:
+            title: Article title
+            content: Article content
+            summary: Article summary (optional)
+
+        Returns:
+            Combined text
+        """
         parts = [f"Title: {title}"]
 
         if summary:
@@ -306,10 +572,7 @@ class TextEmbedder:
         if content_snippet:
             parts.append(f"Content: {content_snippet}")
 
-        combined_text = "\n\n".join(parts)
-
-        # Ensure within token limit
-        return self.truncate_text(combined_text)
+        return "\n\n".join(parts)
 
     async def embed_article(
         self,
@@ -334,9 +597,36 @@ class TextEmbedder:
             ...     summary="Transformer 모델을 제안합니다."
             ... )
         """
-        text = self.prepare_article_text(title, content, summary)
+        # embed() counts tokens and truncates in one pass, so skip prepare_article_text's
+        # own truncation and tokenize the combined text only once
+        text = self._combine_article_fields(title, content, summary)
         return await self.embed(text)
 
+    async def embed_articles(self, articles: list[dict[str, Any]]) -> list[list[float]]:
+        """Generate embeddings for multiple articles with a single API request.
+
+        Args:
+            articles: List of article dicts with 'title', 'content', 'summary' keys
+
+        Returns:
+            List of embedding vectors, in input order
+
+        Examples:
+            >>> embeddings = await embedder.embed_articles(
+            ...     [{"title": "Paper 1", "content": "...", "summary": "..."}]
+            ... )
+        """
+        texts = [
+            self._combine_article_fields(
+                article.get("title", ""),
+                article.get("content", ""),
+                article.get("summary"),
+            )
+            for article in articles
+        ]
+
+        return await self.embed_many(texts)
+
     async def embed_articles_batch(
         self,
         articles: list[dict[str, Any]],
@@ -358,8 +648,9 @@ class TextEmbedder:
             ... ]
             >>> embeddings = await embedder.embed_articles_batch(articles)
         """
+        # Tokens are counted (and long texts truncated) by batch_embed
         texts = [
-            self.prepare_article_text(
+            self._combine_article_fields(
                 article.get("title", ""),
                 article.get("content", ""),
                 article.get("summary"),
@@ -371,7 +662,8 @@ class TextEmbedder:
 
     def clear_cache(self) -> None:
         """Clear embedding cache."""
-        self._cache.clear()
+        self._cache_index.clear()
+        self._cache_rows = 0
         logger.info("Embedding cache cleared")
 
     def get_cache_size(self) -> int:
@@ -380,7 +672,7 @@ class TextEmbedder:
         Returns:
             Number of cached items
         """
-        return len(self._cache)
+        return self._cache_rows
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -389,7 +681,7 @@ class TextEmbedder:
             Dictionary with cache statistics
         """
         return {
-            "size": len(self._cache),
+            "size": self._cache_rows,
             "enabled": self.use_cache,
             "model": self.model,
         }
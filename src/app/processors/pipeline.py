@@ -128,59 +128,32 @@ class ProcessingPipeline:
         try:
             # Step 1: 요약, 평가, 분류 병렬 실행
             logger.info(f"Processing article: {title[:50]}...")
-
-            summary_task = self.summarizer.summarize(
+            summary, eval_result, class_result = await self._analyze(
                 title=title,
                 content=content,
-                language=self.summary_language,
-                length=self.summary_length,
-            )
-
-            eval_task = self.evaluator.evaluate(title=title, content=content, metadata=metadata)
-
-            classify_task = self.classifier.classify(
-                title=title,
-                content=content,
-                source_name=source_name,
                 url=url,
-            )
-
-            # 병렬 실행
-            summary, eval_result, class_result = await asyncio.gather(
-                summary_task,
-                eval_task,
-                classify_task,
+                source_name=source_name,
+                metadata=metadata,
             )
 
             # Step 2: 임베딩 생성 (요약 사용)
-            embedding = await self.embedder.embed_article_async(
+            embedding = await self.embedder.embed_article(
                 title=title,
                 content=content,
                 summary=summary,
             )
 
-            # 결과 객체 생성
-            processed = ProcessedArticle(
-                # 원본
+            processed = self._build_article(
                 title=title,
                 content=content,
                 url=url,
                 source_name=source_name,
                 source_type=source_type,
-                # 처리 결과
+                metadata=metadata,
                 summary=summary,
-                importance_score=eval_result["final_score"],
-                category=class_result["category"],
-                keywords=class_result.get("keywords", []),
-                research_field=class_result.get("research_field", "Other"),
+                eval_result=eval_result,
+                class_result=class_result,
                 embedding=embedding,
-                # 상세 평가
-                innovation_score=eval_result["innovation"],
-                relevance_score=eval_result["relevance"],
-                impact_score=eval_result["impact"],
-                timeliness_score=eval_result["timeliness"],
-                # 메타데이터
-                metadata=metadata,
             )
 
             elapsed = (datetime.now() - start_time).total_seconds()
@@ -195,6 +168,75 @@ class ProcessingPipeline:
             logger.error(f"Error processing article '{title[:50]}...': {e}")
             raise
 
+    async def _analyze(
+        self,
+        title: str,
+        content: str,
+        url: str,
+        source_name: str,
+        metadata: dict[str, Any],
+    ) -> tuple[str, dict[str, Any], dict[str, Any]]:
+        """요약, 평가, 분류를 병렬 실행하여 (요약, 평가 결과, 분류 결과) 반환"""
+        summary_task = self.summarizer.summarize(
+            title=title,
+            content=content,
+            language=self.summary_language,
+            length=self.summary_length,
+        )
+
+        eval_task = self.evaluator.evaluate(title=title, content=content, metadata=metadata)
+
+        classify_task = self.classifier.classify(
+            title=title,
+            content=content,
+            source_name=source_name,
+            url=url,
+        )
+
+        # 병렬 실행
+        return await asyncio.gather(
+            summary_task,
+            eval_task,
+            classify_task,
+        )
+
+    @staticmethod
+    def _build_article(
+        title: str,
+        content: str,
+        url: str,
+        source_name: str,
+        source_type: str,
+        metadata: dict[str, Any],
+        summary: str,
+        eval_result: dict[str, Any],
+        class_result: dict[str, Any],
+        embedding: list[float],
+    ) -> ProcessedArticle:
+        """프로세서 결과로 ProcessedArticle 생성"""
+        return ProcessedArticle(
+            # 원본
+            title=title,
+            content=content,
+            url=url,
+            source_name=source_name,
+            source_type=source_type,
+            # 처리 결과
+            summary=summary,
+            importance_score=eval_result["final_score"],
+            category=class_result["category"],
+            keywords=class_result.get("keywords", []),
+            research_field=class_result.get("research_field", "Other"),
+            embedding=embedding,
+            # 상세 평가
+            innovation_score=eval_result["innovation"],
+            relevance_score=eval_result["relevance"],
+            impact_score=eval_result["impact"],
+            timeliness_score=eval_result["timeliness"],
+            # 메타데이터
+            metadata=metadata,
+        )
+
     async def process_batch(
         self,
         articles: list[dict[str, Any]],
@@ -206,6 +248,7 @@ class ProcessingPipeline:
         최적화 전략:
         1. 각 아티클 내에서 요약/평가/분류 병렬 실행
         2. 여러 아티클 동시 처리 (max_concurrent 제한)
+        3. 임베딩은 성공한 아티클 전체를 한 번의 API 요청으로 생성
 
         Args:
             articles: 아티클 리스트
@@ -230,25 +273,30 @@ class ProcessingPipeline:
         # 세마포어로 동시 실행 제한
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def process_with_semaphore(article: dict[str, Any]) -> ProcessedArticle:
+        async def analyze_with_semaphore(
+            article: dict[str, Any],
+        ) -> tuple[str, dict[str, Any], dict[str, Any]]:
             async with semaphore:
-                return await self.process_article(
-                    title=article["title"],
-                    content=article["content"],
-                    url=article.get("url", ""),
-                    source_name=article.get("source_name", ""),
-                    source_type=article.get("source_type", ""),
-                    metadata=article.get("metadata"),
-                )
-
-        # 병렬 처리
+                try:
+                    return await self._analyze(
+                        title=article["title"],
+                        content=article["content"],
+                        url=article.get("url", ""),
+                        source_name=article.get("source_name", ""),
+                        metadata=article.get("metadata") or {},
+                    )
+                except Exception as e:
+                    logger.error(f"Error processing article '{article['title'][:50]}...': {e}")
+                    raise
+
+        # Step 1: 요약/평가/분류 병렬 처리
         results = await asyncio.gather(
-            *[process_with_semaphore(article) for article in articles],
+            *[analyze_with_semaphore(article) for article in articles],
             return_exceptions=True,
         )
 
         # 에러 처리
-        processed_articles = []
+        analyzed = []
         errors = 0
 
         for i, result in enumerate(results):
@@ -256,7 +304,51 @@ class ProcessingPipeline:
                 logger.error(f"Error processing article {i}: {result}")
                 errors += 1
             else:
-                processed_articles.append(result)
+                analyzed.append((articles[i], *result))
+
+        # Step 2: 임베딩 일괄 생성 (요약 사용, 아티클당 요청 대신 1회 요청)
+        embed_inputs = [
+            {"title": article["title"], "content": article["content"], "summary": summary}
+            for article, summary, _, _ in analyzed
+        ]
+        try:
+            embeddings = await self.embedder.embed_articles(embed_inputs) if analyzed else []
+        except Exception as e:
+            # 일괄 요청 실패 시 아티클별로 재시도하여 실패를 개별 집계 (같은 세마포어로 동시 실행 제한)
+            logger.warning(f"Batch embedding failed, embedding articles one by one: {e}")
+
+            async def embed_with_semaphore(embed_input: dict[str, Any]) -> list[float]:
+                async with semaphore:
+                    return await self.embedder.embed_article(**embed_input)
+
+            embeddings = await asyncio.gather(
+                *[embed_with_semaphore(embed_input) for embed_input in embed_inputs],
+                return_exceptions=True,
+            )
+
+        processed_articles = []
+
+        for (article, summary, eval_result, class_result), embedding in zip(
+            analyzed, embeddings, strict=True
+        ):
+            if isinstance(embedding, Exception):
+                logger.error(f"Error embedding article '{article['title'][:50]}...': {embedding}")
+                errors += 1
+                continue
+            processed_articles.append(
+                self._build_article(
+                    title=article["title"],
+                    content=article["content"],
+                    url=article.get("url", ""),
+                    source_name=article.get("source_name", ""),
+                    source_type=article.get("source_type", ""),
+                    metadata=article.get("metadata") or {},
+                    summary=summary,
+                    eval_result=eval_result,
+                    class_result=class_result,
+                    embedding=embedding,
+                )
+            )
 
         elapsed = (datetime.now() - start_time).total_seconds()
         success_rate = (total - errors) / total * 100 if total > 0 else 0
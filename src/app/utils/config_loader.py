@@ -1,15 +1,25 @@
+import os
+from collections.abc import Callable, Iterator, Mapping
+from functools import cache
 from typing import Any
 
 import yaml
 
 from app.utils.path import DATA_CONFIG_PATH
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _Loader
+
 
 def load_config(path: str) -> dict[str, Any]:
     """Configuration loader.
 
     Description:
         Load configuration yaml file into python dictionary.
+        Parsed files are cached until the file's modification time changes,
+        so the returned dictionary is shared and should not be mutated.
 
     Args:
         path (str): Configuration path.
@@ -17,20 +27,50 @@ def load_config(path: str) -> dict[str, Any]:
     Returns:
         (Dict[str, Any]): Dictionary of configuration.
     """
+    abs_path = os.path.abspath(path)
+    return _load_config_cached(abs_path, os.path.getmtime(abs_path))
+
+
+@cache
+def _load_config_cached(path: str, mtime: float) -> dict[str, Any]:
+    """Parse a yaml file; `mtime` is only part of the cache key."""
     config = {}
     with open(path, encoding="utf-8") as file:
-        config = yaml.load(file, Loader=yaml.FullLoader)
+        config = yaml.load(file, Loader=_Loader)
     return config
 
 
+class _LazyConfigs(Mapping):
+    """Read-only mapping that loads each configuration on first access."""
+
+    def __init__(self, sources: dict[str, tuple[Callable[[str], Any], Any]]):
+        self._sources = sources
+        self._loaded: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._loaded:
+            loader, path = self._sources[key]
+            self._loaded[key] = loader(path)
+        return self._loaded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sources)
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+
 def load_all_configs(data_type="HPMC"):
     """
     Load various configuration files required for data processing and model training.
     Depending on the data_type, different training configuration paths are used.
+    Each configuration is only parsed when it is first accessed.
     """
 
-    configs = {
-        "data": load_config(path=DATA_CONFIG_PATH),
-    }
+    configs = _LazyConfigs(
+        {
+            "data": (load_config, DATA_CONFIG_PATH),
+        },
+    )
 
     return configs
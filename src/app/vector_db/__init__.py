@@ -4,18 +4,24 @@ from app.vector_db.client import QdrantClientWrapper, get_qdrant_client
 from app.vector_db.operations import VectorOperations, get_vector_operations
 from app.vector_db.schema import (
     CollectionSchema,
+    ensure_payload_indexes,
+    finalize_bulk_upload,
     initialize_vector_db,
     setup_collection,
     verify_collection_schema,
+    warmup_collection,
 )
 
 __all__ = [
     "QdrantClientWrapper",
     "get_qdrant_client",
     "CollectionSchema",
+    "ensure_payload_indexes",
+    "finalize_bulk_upload",
     "initialize_vector_db",
     "setup_collection",
     "verify_collection_schema",
+    "warmup_collection",
     "VectorOperations",
     "get_vector_operations",
 ]
@@ -14,22 +14,40 @@ logger = logging.getLogger(__name__)
 class QdrantClientWrapper:
     """Wrapper for Qdrant client with connection management and utility methods."""
 
+    # Keep the single gRPC channel warm between calls so idle gaps don't cost a reconnect
+    GRPC_OPTIONS = {
+        "grpc.keepalive_time_ms": 10_000,
+        "grpc.keepalive_permit_without_calls": 1,
+        "grpc.http2.max_pings_without_data": 0,
+    }
+
     def __init__(
         self,
         host: str | None = None,
         port: int | None = None,
         collection_name: str | None = None,
+        grpc_port: int | None = None,
+        prefer_grpc: bool | None = None,
+        location: str | None = None,
     ) -> None:
         """Initialize Qdrant client.
 
         Args:
             host: Qdrant server host (defaults to settings.QDRANT_HOST)
-            port: Qdrant server port (defaults to settings.QDRANT_PORT)
+            port: Qdrant server HTTP port (defaults to settings.QDRANT_PORT)
             collection_name: Default collection name (defaults to settings.QDRANT_COLLECTION_NAME)
+            grpc_port: Qdrant server gRPC port (defaults to settings.QDRANT_GRPC_PORT)
+            prefer_grpc: Use gRPC where supported, falling back to HTTP
+                (defaults to settings.QDRANT_PREFER_GRPC)
+            location: ":memory:" for an embedded in-process instance, used instead of
+                host/port when set (defaults to settings.QDRANT_LOCATION)
         """
         self.host = host or settings.QDRANT_HOST
         self.port = port or settings.QDRANT_PORT
+        self.grpc_port = grpc_port or settings.QDRANT_GRPC_PORT
+        self.prefer_grpc = settings.QDRANT_PREFER_GRPC if prefer_grpc is None else prefer_grpc
         self.collection_name = collection_name or settings.QDRANT_COLLECTION_NAME
+        self.location = settings.QDRANT_LOCATION if location is None else location
         self._client: QdrantClient | None = None
 
     @property
@@ -44,8 +62,22 @@ class QdrantClientWrapper:
         """
         if self._client is None:
             try:
-                self._client = QdrantClient(host=self.host, port=self.port)
-                logger.info(f"Connected to Qdrant at {self.host}:{self.port}")
+                if self.location:
+                    self._client = QdrantClient(location=self.location)
+                    logger.info(f"Using embedded Qdrant ({self.location})")
+                else:
+                    self._client = QdrantClient(
+                        host=self.host,
+                        port=self.port,
+                        grpc_port=self.grpc_port,
+                        prefer_grpc=self.prefer_grpc,
+                        grpc_options=dict(self.GRPC_OPTIONS),  # the client adds to it in place
+                        timeout=settings.QDRANT_TIMEOUT,
+                    )
+                    logger.info(
+                        f"Connected to Qdrant at {self.host}:{self.port} "
+                        f"(gRPC: {self.grpc_port if self.prefer_grpc else 'disabled'})",
+                    )
             except Exception as e:
                 logger.error(f"Failed to connect to Qdrant: {e}")
                 raise ConnectionError(f"Unable to connect to Qdrant at {self.host}:{self.port}") from e
@@ -108,6 +140,11 @@ class QdrantClientWrapper:
         vector_size: int | None = None,
         distance: models.Distance = models.Distance.COSINE,
         on_disk_payload: bool = True,
+        optimizers_config: models.OptimizersConfigDiff | None = None,
+        quantization_config: models.QuantizationConfig | None = None,
+        on_disk_vectors: bool = False,
+        hnsw_config: models.HnswConfigDiff | None = None,
+        datatype: models.Datatype | None = None,
     ) -> bool:
         """Create a new collection in Qdrant.
 
@@ -116,6 +153,11 @@ class QdrantClientWrapper:
             vector_size: Size of the embedding vectors (defaults to settings.QDRANT_VECTOR_SIZE)
             distance: Distance metric for similarity (default: COSINE)
             on_disk_payload: Store payload on disk to save memory (default: True)
+            optimizers_config: Optimizer overrides, e.g. indexing_threshold=0 for bulk upload
+            quantization_config: Vector quantization config, e.g. int8 scalar quantization
+            on_disk_vectors: Store original vectors on disk (default: False)
+            hnsw_config: HNSW index overrides (m, ef_construct, ...); Qdrant defaults if None
+            datatype: Storage datatype of the original vectors (float32 if None)
 
         Returns:
             bool: True if collection was created successfully, False otherwise
@@ -137,8 +179,13 @@ class QdrantClientWrapper:
                 vectors_config=models.VectorParams(
                     size=size,
                     distance=distance,
+                    on_disk=on_disk_vectors,
+                    datatype=datatype,
                 ),
                 on_disk_payload=on_disk_payload,
+                optimizers_config=optimizers_config,
+                quantization_config=quantization_config,
+                hnsw_config=hnsw_config,
             )
             logger.info(f"Successfully created collection '{name}' with vector size {size}")
             return True
@@ -207,6 +254,11 @@ class QdrantClientWrapper:
         collection_name: str | None = None,
         vector_size: int | None = None,
         distance: models.Distance = models.Distance.COSINE,
+        optimizers_config: models.OptimizersConfigDiff | None = None,
+        quantization_config: models.QuantizationConfig | None = None,
+        on_disk_vectors: bool = False,
+        hnsw_config: models.HnswConfigDiff | None = None,
+        datatype: models.Datatype | None = None,
     ) -> bool:
         """Recreate a collection (delete if exists, then create new).
 
@@ -214,6 +266,11 @@ class QdrantClientWrapper:
             collection_name: Name of the collection (defaults to self.collection_name)
             vector_size: Size of the embedding vectors (defaults to settings.QDRANT_VECTOR_SIZE)
             distance: Distance metric for similarity (default: COSINE)
+            optimizers_config: Optimizer overrides, e.g. indexing_threshold=0 for bulk upload
+            quantization_config: Vector quantization config, e.g. int8 scalar quantization
+            on_disk_vectors: Store original vectors on disk (default: False)
+            hnsw_config: HNSW index overrides (m, ef_construct, ...); Qdrant defaults if None
+            datatype: Storage datatype of the original vectors (float32 if None)
 
         Returns:
             bool: True if collection was recreated successfully, False otherwise
@@ -228,7 +285,16 @@ class QdrantClientWrapper:
 
         # Create new collection
         try:
-            return self.create_collection(name, vector_size, distance)
+            return self.create_collection(
+                name,
+                vector_size,
+                distance,
+                optimizers_config=optimizers_config,
+                quantization_config=quantization_config,
+                on_disk_vectors=on_disk_vectors,
+                hnsw_config=hnsw_config,
+                datatype=datatype,
+            )
         except ValueError:
             # Should not happen since we just deleted it
             logger.error(f"Unexpected error: collection '{name}' exists after deletion")
@@ -4,12 +4,21 @@ This module provides functions to insert, update, delete, and search
 article embeddings in Qdrant vector database.
 """
 
+import asyncio
 import logging
-import uuid
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 from qdrant_client.http import models
+from uuid_extensions import uuid7
 
 from app.processors.embedder import TextEmbedder, get_embedder
 from app.vector_db.client import QdrantClientWrapper, get_qdrant_client
@@ -18,9 +27,51 @@ from app.vector_db.schema import CollectionSchema
 logger = logging.getLogger(__name__)
 
 
+def cos_topk(
+    query: np.ndarray,
+    candidates: np.ndarray,
+    k: int,
+    normalized: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Select the top-k candidates by cosine similarity to the query.
+
+    Scores are a single matrix-vector product over a contiguous float32 matrix.
+
+    Args:
+        query: Query vector of shape (dim,)
+        candidates: Candidate vectors of shape (n, dim)
+        k: Number of candidates to keep
+        normalized: Candidates are already unit-length (e.g. vectors returned by a
+            COSINE collection), so only the query is normalized (default: False)
+
+    Returns:
+        Tuple of (candidate indices, scores), sorted by descending score
+    """
+    query = np.ascontiguousarray(query, dtype=np.float32)
+    candidates = np.ascontiguousarray(candidates, dtype=np.float32)
+
+    scores = candidates @ (query / (np.linalg.norm(query) + 1e-12))
+    if not normalized:
+        scores /= np.linalg.norm(candidates, axis=1) + 1e-12
+
+    if k < len(scores):
+        idx = np.argpartition(-scores, k)[:k]
+    else:
+        idx = np.arange(len(scores))
+    idx = idx[np.argsort(-scores[idx])]
+
+    return idx, scores[idx]
+
+
 class VectorOperations:
     """Vector database operations for article embeddings."""
 
+    # Seconds an approximate count_articles() result is reused
+    COUNT_CACHE_TTL = 5.0
+
+    # Candidate multiplier when search results are rescored locally
+    RESCORE_OVERSAMPLING = 3
+
     def __init__(
         self,
         qdrant_client: QdrantClientWrapper | None = None,
@@ -32,14 +83,34 @@ class VectorOperations:
         Args:
             qdrant_client: Qdrant client instance (defaults to global client)
             embedder: Text embedder instance (defaults to global embedder)
-            collection_name: Collection name (defaults to CollectionSchema.COLLECTION_NAME)
+            collection_name: Collection name (defaults to CollectionSchema.collection_name())
         """
         self.qdrant_client = qdrant_client or get_qdrant_client()
         self.embedder = embedder or get_embedder()
-        self.collection_name = collection_name or CollectionSchema.COLLECTION_NAME
+        self.collection_name = collection_name or CollectionSchema.collection_name()
+        self._count_cache: tuple[float, int] | None = None
+        self.search_params = CollectionSchema.search_params()
 
         logger.info(f"VectorOperations initialized for collection: {self.collection_name}")
 
+    @contextmanager
+    def bulk_ingest(self) -> Iterator["VectorOperations"]:
+        """Use `CollectionSchema.search_params(bulk_ingest=True)` for searches while ingesting.
+
+        Searches then skip segments that are not indexed yet instead of scanning
+        them, which avoids long-tail latency during a bulk upload.
+
+        Examples:
+            >>> with ops.bulk_ingest():
+            ...     await ops.bulk_insert_articles(articles)
+        """
+        previous = self.search_params
+        self.search_params = CollectionSchema.search_params(bulk_ingest=True)
+        try:
+            yield self
+        finally:
+            self.search_params = previous
+
     async def insert_article(
         self,
         article_id: str,
@@ -89,8 +160,8 @@ class VectorOperations:
                 summary=summary,
             )
 
-            # Generate vector ID
-            vector_id = str(uuid.uuid4())
+            # Generate time-ordered vector ID (UUIDv7)
+            vector_id = str(uuid7())
 
             # Prepare payload
             payload = {
@@ -116,6 +187,8 @@ class VectorOperations:
                 ],
             )
 
+            self._count_cache = None
+
             logger.info(
                 f"Inserted article '{title[:50]}...' "
                 f"(article_id={article_id}, vector_id={vector_id})",
@@ -131,9 +204,16 @@ class VectorOperations:
         self,
         articles: list[dict[str, Any]],
         batch_size: int = 10,
+        upsert_batch_size: int = 64,
+        wait: bool = True,
     ) -> list[str]:
         """Insert multiple articles in batch.
 
+        Points are upserted in chunks of `upsert_batch_size`. Every chunk but the
+        last is sent with `wait=False`, so the server applies them while the next
+        chunk is on the wire; Qdrant applies updates in order, so waiting on the
+        last chunk means the whole batch is readable when this returns.
+
         Args:
             articles: List of article dicts with keys:
                 - article_id: UUID string
@@ -144,7 +224,10 @@ class VectorOperations:
                 - category: str (optional, default: "AI")
                 - importance_score: float (optional, default: 0.5)
                 - metadata: dict (optional)
-            batch_size: Number of articles to process at once
+            batch_size: Maximum number of articles embedded concurrently
+            upsert_batch_size: Number of points per upsert request (default: 64)
+            wait: If False, do not wait for the last chunk either; the points become
+                visible shortly after this returns (default: True)
 
         Returns:
             List of vector IDs
@@ -169,51 +252,23 @@ class VectorOperations:
             return []
 
         try:
-            # Generate embeddings for all articles in batch
-            embeddings = await self.embedder.embed_articles_batch(
-                articles=[
-                    {
-                        "title": a.get("title", ""),
-                        "content": a.get("content", ""),
-                        "summary": a.get("summary"),
-                    }
-                    for a in articles
-                ],
-                batch_size=batch_size,
-            )
+            vector_ids, vectors, payloads = await self._prepare_article_batch(articles, batch_size)
 
-            # Prepare points for Qdrant
-            points = []
-            vector_ids = []
-
-            for article, embedding in zip(articles, embeddings, strict=False):
-                vector_id = str(uuid.uuid4())
-                vector_ids.append(vector_id)
-
-                payload = {
-                    "article_id": article.get("article_id", ""),
-                    "title": article.get("title", ""),
-                    "summary": article.get("summary", ""),
-                    "source_type": article.get("source_type", "paper"),
-                    "category": article.get("category", "AI"),
-                    "importance_score": article.get("importance_score", 0.5),
-                    "collected_at": datetime.utcnow().isoformat(),
-                    "metadata": article.get("metadata", {}),
-                }
-
-                points.append(
-                    models.PointStruct(
-                        id=vector_id,
-                        vector=embedding,
-                        payload=payload,
+            # Columnar upserts: one Batch per chunk instead of a PointStruct per article.
+            # Only the last chunk waits for the server to apply the batch.
+            for start in range(0, len(vector_ids), upsert_batch_size):
+                end = start + upsert_batch_size
+                self.qdrant_client.client.upsert(
+                    collection_name=self.collection_name,
+                    points=models.Batch(
+                        ids=vector_ids[start:end],
+                        vectors=vectors[start:end],
+                        payloads=payloads[start:end],
                     ),
+                    wait=wait and end >= len(vector_ids),
                 )
 
-            # Insert all points
-            self.qdrant_client.client.upsert(
-                collection_name=self.collection_name,
-                points=points,
-            )
+            self._count_cache = None
 
             logger.info(f"Batch inserted {len(articles)} articles into Qdrant")
 
@@ -223,6 +278,152 @@ class VectorOperations:
             logger.error(f"Failed to batch insert articles: {e}")
             raise RuntimeError(f"Batch insertion failed: {e}") from e
 
+    async def bulk_insert_articles(
+        self,
+        articles: list[dict[str, Any]],
+        embed_batch_size: int = 10,
+        upload_batch_size: int = 64,
+        parallel: int | None = None,
+        wait: bool = False,
+    ) -> list[str]:
+        """Insert many articles through Qdrant's parallel bulk upload path.
+
+        Intended for backfills; pair with `setup_collection(bulk_mode=True)` and
+        `finalize_bulk_upload()` so HNSW is built once after the upload.
+
+        Args:
+            articles: List of article dicts (same keys as `insert_articles_batch`)
+            embed_batch_size: Maximum number of articles embedded concurrently
+            upload_batch_size: Number of points per upload request
+            parallel: Number of upload workers (defaults to CPU count)
+            wait: If True, wait until Qdrant has applied all points
+
+        Returns:
+            List of vector IDs
+
+        Raises:
+            RuntimeError: If the upload fails
+
+        Examples:
+            >>> vector_ids = await ops.bulk_insert_articles(articles, wait=True)
+        """
+        if not articles:
+            logger.warning("Empty articles list provided")
+            return []
+
+        try:
+            vector_ids, points = await self._prepare_article_points(articles, embed_batch_size)
+        except Exception as e:
+            logger.error(f"Failed to prepare articles for bulk upload: {e}")
+            raise RuntimeError(f"Bulk insertion failed: {e}") from e
+
+        self.bulk_upload(points, parallel=parallel, batch_size=upload_batch_size, wait=wait)
+        return vector_ids
+
+    def bulk_upload(
+        self,
+        points: Iterable[models.PointStruct],
+        parallel: int | None = None,
+        batch_size: int = 64,
+        wait: bool = False,
+    ) -> None:
+        """Upload points with `upload_points`, batching and parallelizing client-side.
+
+        Args:
+            points: Points to upload (any iterable, consumed lazily)
+            parallel: Number of upload workers (defaults to CPU count)
+            batch_size: Number of points per upload request
+            wait: If True, wait until Qdrant has applied all points
+
+        Raises:
+            RuntimeError: If the upload fails
+        """
+        try:
+            self.qdrant_client.client.upload_points(
+                collection_name=self.collection_name,
+                points=points,
+                batch_size=batch_size,
+                parallel=parallel or os.cpu_count() or 1,
+                wait=wait,
+            )
+
+            self._count_cache = None
+            logger.info(f"Bulk uploaded points into '{self.collection_name}'")
+
+        except Exception as e:
+            logger.error(f"Failed to bulk upload points: {e}")
+            raise RuntimeError(f"Bulk upload failed: {e}") from e
+
+    async def _prepare_article_points(
+        self,
+        articles: list[dict[str, Any]],
+        batch_size: int,
+    ) -> tuple[list[str], list[models.PointStruct]]:
+        """Embed articles and build their Qdrant points (see `_prepare_article_batch`).
+
+        Returns:
+            Tuple of (vector IDs, points)
+        """
+        vector_ids, vectors, payloads = await self._prepare_article_batch(articles, batch_size)
+        points = [
+            models.PointStruct(id=vector_id, vector=vector.tolist(), payload=payload)
+            for vector_id, vector, payload in zip(vector_ids, vectors, payloads, strict=True)
+        ]
+        return vector_ids, points
+
+    async def _prepare_article_batch(
+        self,
+        articles: list[dict[str, Any]],
+        batch_size: int,
+    ) -> tuple[list[str], np.ndarray, list[dict[str, Any]]]:
+        """Embed articles and build their IDs, vectors and payloads column-wise.
+
+        All embedding requests are dispatched at once; a semaphore caps the
+        number in flight so the embedding API rate limit is respected.
+
+        Args:
+            articles: List of article dicts (same keys as `insert_articles_batch`)
+            batch_size: Maximum number of concurrent embedding requests
+
+        Returns:
+            Tuple of (vector IDs, L2-normalized float32 matrix with one row per
+            article, payloads)
+        """
+        semaphore = asyncio.Semaphore(max(1, batch_size))
+
+        async def embed_one(article: dict[str, Any]) -> list[float]:
+            async with semaphore:
+                return await self.embedder.embed_article(
+                    title=article.get("title", ""),
+                    content=article.get("content", ""),
+                    summary=article.get("summary"),
+                )
+
+        embeddings = await asyncio.gather(*(embed_one(a) for a in articles))
+
+        # Cast once to float32 and L2-normalize all rows in a single vectorized pass
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.maximum(norms, 1e-12)
+
+        vector_ids = [str(uuid7()) for _ in articles]
+        collected_at = datetime.utcnow().isoformat()
+        payloads = [
+            {
+                "article_id": article.get("article_id", ""),
+                "title": article.get("title", ""),
+                "summary": article.get("summary", ""),
+                "source_type": article.get("source_type", "paper"),
+                "category": article.get("category", "AI"),
+                "importance_score": article.get("importance_score", 0.5),
+                "collected_at": collected_at,
+                "metadata": article.get("metadata", {}),
+            }
+            for article in articles
+        ]
+
+        return vector_ids, vectors, payloads
+
     async def update_article(
         self,
         vector_id: str,
@@ -259,66 +460,76 @@ class VectorOperations:
             ... )
         """
         try:
-            # Get current point
-            current = self.qdrant_client.client.retrieve(
-                collection_name=self.collection_name,
-                ids=[vector_id],
-            )
-
-            if not current:
-                logger.error(f"Vector ID {vector_id} not found")
-                return False
-
-            current_payload = current[0].payload
-
-            # Update payload fields
-            updated_payload = dict(current_payload)
-
-            if title is not None:
-                updated_payload["title"] = title
-            if summary is not None:
-                updated_payload["summary"] = summary
-            if source_type is not None:
-                updated_payload["source_type"] = source_type
-            if category is not None:
-                updated_payload["category"] = category
-            if importance_score is not None:
-                updated_payload["importance_score"] = importance_score
-            if metadata is not None:
-                updated_payload["metadata"] = metadata
+            # Only send the changed fields; set_payload merges them server-side
+            delta_payload = {
+                key: value
+                for key, value in (
+                    ("title", title),
+                    ("summary", summary),
+                    ("source_type", source_type),
+                    ("category", category),
+                    ("importance_score", importance_score),
+                    ("metadata", metadata),
+                )
+                if value is not None
+            }
 
             # Regenerate embedding if needed
             if regenerate_embedding and (
                 title is not None or content is not None or summary is not None
             ):
-                new_title = title or current_payload.get("title", "")
-                new_content = content or ""
-                new_summary = summary or current_payload.get("summary")
+                new_title = title
+                new_summary = summary
+                if new_title is None or new_summary is None:
+                    # Fetch only the fields needed to rebuild the embedding text
+                    current = self.qdrant_client.client.retrieve(
+                        collection_name=self.collection_name,
+                        ids=[vector_id],
+                        with_payload=["title", "summary"],
+                        with_vectors=False,
+                    )
+
+                    if not current:
+                        logger.error(f"Vector ID {vector_id} not found")
+                        return False
+
+                    current_payload = current[0].payload
+                    new_title = title or current_payload.get("title", "")
+                    new_summary = summary or current_payload.get("summary")
 
                 new_embedding = await self.embedder.embed_article(
                     title=new_title,
-                    content=new_content,
+                    content=content or "",
                     summary=new_summary,
                 )
 
-                # Update with new embedding
-                self.qdrant_client.client.upsert(
-                    collection_name=self.collection_name,
-                    points=[
-                        models.PointStruct(
-                            id=vector_id,
-                            vector=new_embedding,
-                            payload=updated_payload,
+                # Update vector and changed payload fields concurrently
+                updates = [
+                    asyncio.to_thread(
+                        self.qdrant_client.client.update_vectors,
+                        collection_name=self.collection_name,
+                        points=[models.PointVectors(id=vector_id, vector=new_embedding)],
+                    ),
+                ]
+                if delta_payload:
+                    updates.append(
+                        asyncio.to_thread(
+                            self.qdrant_client.client.set_payload,
+                            collection_name=self.collection_name,
+                            payload=delta_payload,
+                            points=[vector_id],
                         ),
-                    ],
-                )
-            else:
+                    )
+                await asyncio.gather(*updates)
+            elif delta_payload:
                 # Update payload only
                 self.qdrant_client.client.set_payload(
                     collection_name=self.collection_name,
-                    payload=updated_payload,
+                    payload=delta_payload,
                     points=[vector_id],
                 )
+            else:
+                logger.warning(f"No fields to update for vector_id={vector_id}")
 
             logger.info(f"Updated article with vector_id={vector_id}")
             return True
@@ -345,6 +556,8 @@ class VectorOperations:
                 points_selector=models.PointIdsList(points=[vector_id]),
             )
 
+            self._count_cache = None
+
             logger.info(f"Deleted article with vector_id={vector_id}")
             return True
 
@@ -352,30 +565,64 @@ class VectorOperations:
             logger.error(f"Failed to delete article: {e}")
             return False
 
-    def delete_articles_batch(self, vector_ids: list[str]) -> bool:
-        """Delete multiple articles in batch.
+    def delete_articles_batch(
+        self,
+        vector_ids: list[str],
+        chunk_size: int = 1000,
+        max_workers: int = 4,
+    ) -> dict[str, Any]:
+        """Delete multiple articles in chunks.
+
+        Chunks are deleted concurrently and independently, so a failed chunk does not
+        abort the rest and can be retried on its own.
 
         Args:
             vector_ids: List of vector IDs
+            chunk_size: Number of IDs per delete request (default: 1000)
+            max_workers: Maximum number of concurrent delete requests (default: 4)
 
         Returns:
-            True if deletion successful, False otherwise
+            Dict with `deleted` (number of IDs in successful chunks) and
+            `failed_chunks` (list of ID lists that failed to delete)
 
         Examples:
-            >>> success = ops.delete_articles_batch(["id1", "id2", "id3"])
+            >>> result = ops.delete_articles_batch(["id1", "id2", "id3"])
+            >>> if result["failed_chunks"]:
+            ...     for chunk in result["failed_chunks"]:
+            ...         ops.delete_articles_batch(chunk)
         """
-        try:
+        chunks = [vector_ids[i : i + chunk_size] for i in range(0, len(vector_ids), chunk_size)]
+        if not chunks:
+            return {"deleted": 0, "failed_chunks": []}
+
+        def delete_chunk(chunk: list[str]) -> None:
             self.qdrant_client.client.delete(
                 collection_name=self.collection_name,
-                points_selector=models.PointIdsList(points=vector_ids),
+                points_selector=models.PointIdsList(points=chunk),
             )
 
-            logger.info(f"Batch deleted {len(vector_ids)} articles")
-            return True
+        deleted = 0
+        failed_chunks = []
 
-        except Exception as e:
-            logger.error(f"Failed to batch delete articles: {e}")
-            return False
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            futures = {executor.submit(delete_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    future.result()
+                    deleted += len(chunk)
+                except Exception as e:
+                    logger.error(f"Failed to delete chunk of {len(chunk)} articles: {e}")
+                    failed_chunks.append(chunk)
+
+        self._count_cache = None
+
+        logger.info(
+            f"Batch deleted {deleted}/{len(vector_ids)} articles "
+            f"({len(failed_chunks)} failed chunks)",
+        )
+
+        return {"deleted": deleted, "failed_chunks": failed_chunks}
 
     def get_article(self, vector_id: str) -> dict[str, Any] | None:
         """Retrieve article by vector ID.
@@ -412,11 +659,21 @@ class VectorOperations:
             logger.error(f"Failed to get article: {e}")
             return None
 
-    def get_articles_batch(self, vector_ids: list[str]) -> list[dict[str, Any]]:
+    def get_articles_batch(
+        self,
+        vector_ids: list[str],
+        chunk_size: int = 16,
+        concurrency: int = 2,
+    ) -> list[dict[str, Any]]:
         """Retrieve multiple articles by vector IDs.
 
+        Large requests are split into chunks of `chunk_size` IDs retrieved with
+        bounded concurrency; latency per request grows steeply past ~16 IDs.
+
         Args:
             vector_ids: List of vector IDs
+            chunk_size: Number of IDs per retrieve request (default: 16)
+            concurrency: Number of retrieve requests in flight (default: 2)
 
         Returns:
             List of article data dicts
@@ -424,22 +681,18 @@ class VectorOperations:
         Examples:
             >>> articles = ops.get_articles_batch(["id1", "id2", "id3"])
         """
-        try:
-            results = self.qdrant_client.client.retrieve(
-                collection_name=self.collection_name,
-                ids=vector_ids,
-                with_payload=True,
-                with_vectors=False,
-            )
+        chunks = [vector_ids[i : i + chunk_size] for i in range(0, len(vector_ids), chunk_size)]
 
-            articles = []
-            for point in results:
-                articles.append(
-                    {
-                        "vector_id": point.id,
-                        **point.payload,
-                    },
-                )
+        try:
+            if len(chunks) <= 1:
+                articles = self._retrieve_articles(vector_ids)
+            else:
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    articles = [
+                        article
+                        for chunk_articles in executor.map(self._retrieve_articles, chunks)
+                        for article in chunk_articles
+                    ]
 
             logger.info(f"Retrieved {len(articles)} articles")
             return articles
@@ -448,19 +701,103 @@ class VectorOperations:
             logger.error(f"Failed to get articles: {e}")
             return []
 
-    def count_articles(self) -> int:
+    async def get_articles_batch_stream(
+        self,
+        vector_ids: list[str],
+        chunk_size: int = 16,
+        concurrency: int = 2,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream articles by vector IDs, one retrieved chunk at a time.
+
+        Chunks are yielded as they complete, so the caller never holds the full
+        result list and results are not in input order.
+
+        Args:
+            vector_ids: List of vector IDs
+            chunk_size: Number of IDs per retrieve request (default: 16)
+            concurrency: Number of retrieve requests in flight (default: 2)
+
+        Yields:
+            Article data dict
+
+        Examples:
+            >>> async for article in ops.get_articles_batch_stream(vector_ids):
+            ...     print(article["title"])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def retrieve_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._retrieve_articles, chunk)
+
+        tasks = [
+            asyncio.create_task(retrieve_chunk(vector_ids[i : i + chunk_size]))
+            for i in range(0, len(vector_ids), chunk_size)
+        ]
+
+        try:
+            for next_chunk in asyncio.as_completed(tasks):
+                try:
+                    chunk_articles = await next_chunk
+                except Exception as e:
+                    logger.error(f"Failed to get articles chunk: {e}")
+                    continue
+
+                for article in chunk_articles:
+                    yield article
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _retrieve_articles(self, vector_ids: list[str]) -> list[dict[str, Any]]:
+        """Retrieve articles for one chunk of vector IDs.
+
+        Args:
+            vector_ids: List of vector IDs
+
+        Returns:
+            List of article data dicts
+        """
+        results = self.qdrant_client.client.retrieve(
+            collection_name=self.collection_name,
+            ids=vector_ids,
+            with_payload=True,
+            with_vectors=False,
+        )
+
+        return [{"vector_id": point.id, **point.payload} for point in results]
+
+    def count_articles(self, exact: bool = False) -> int:
         """Count total number of articles in collection.
 
+        The count is cached for `COUNT_CACHE_TTL` seconds, so polling dashboards
+        do not hit Qdrant on every request. Exact counts refresh the cache, and
+        writes through this instance invalidate it.
+
+        Args:
+            exact: If True, run an exact count instead of reading the cache (default: False)
+
         Returns:
             Number of articles
 
         Examples:
             >>> count = ops.count_articles()
             >>> print(f"Total articles: {count}")
+            >>> exact_count = ops.count_articles(exact=True)
         """
+        if not exact and self._count_cache is not None:
+            cached_at, cached_count = self._count_cache
+            if time.monotonic() - cached_at < self.COUNT_CACHE_TTL:
+                return cached_count
+
         try:
-            info = self.qdrant_client.get_collection_info(self.collection_name)
-            return info["points_count"] if info else 0
+            count = self.qdrant_client.client.count(
+                collection_name=self.collection_name,
+                exact=exact,
+            ).count
+
+            self._count_cache = (time.monotonic(), count)
+            return count
 
         except Exception as e:
             logger.error(f"Failed to count articles: {e}")
@@ -476,6 +813,11 @@ class VectorOperations:
         min_importance_score: float | None = None,
         date_from: str | None = None,
         date_to: str | None = None,
+        exclude_vector_ids: list[str] | None = None,
+        rescore: bool = False,
+        full_payload: bool = True,
+        search_params: models.SearchParams | None = None,
+        ef: int | None = None,
     ) -> list[dict[str, Any]]:
         """Search for similar articles using natural language query.
 
@@ -488,6 +830,15 @@ class VectorOperations:
             min_importance_score: Minimum importance score (0.0 - 1.0)
             date_from: Filter articles from this date (ISO format)
             date_to: Filter articles until this date (ISO format)
+            exclude_vector_ids: Vector IDs to exclude from results (applied server-side)
+            rescore: If True, over-fetch `RESCORE_OVERSAMPLING` x `limit` candidates and
+                re-rank them locally by exact cosine similarity (default: False)
+            full_payload: If False, only fetch `CollectionSchema.SEARCH_DEFAULT_PAYLOAD`
+                fields; hydrate the rest later with `get_articles_batch` (default: True)
+            search_params: Search parameter override (defaults to the instance's
+                `search_params`, i.e. `CollectionSchema.search_params()`)
+            ef: HNSW beam width for this query, overriding the search params' `hnsw_ef`
+                (128). Higher values trade latency for recall (optional)
 
         Returns:
             List of similar articles with scores
@@ -502,6 +853,60 @@ class VectorOperations:
             ...     min_importance_score=0.9
             ... )
         """
+        results = [
+            hit
+            async for hit in self.search_similar_articles_stream(
+                query=query,
+                limit=limit,
+                score_threshold=score_threshold,
+                source_type=source_type,
+                category=category,
+                min_importance_score=min_importance_score,
+                date_from=date_from,
+                date_to=date_to,
+                exclude_vector_ids=exclude_vector_ids,
+                rescore=rescore,
+                full_payload=full_payload,
+                search_params=search_params,
+                ef=ef,
+            )
+        ]
+
+        logger.info(
+            f"Search query '{query[:50]}...' returned {len(results)} results "
+            f"(threshold: {score_threshold})",
+        )
+
+        return results
+
+    async def search_similar_articles_stream(
+        self,
+        query: str,
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        source_type: list[str] | None = None,
+        category: list[str] | None = None,
+        min_importance_score: float | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        exclude_vector_ids: list[str] | None = None,
+        rescore: bool = False,
+        full_payload: bool = True,
+        search_params: models.SearchParams | None = None,
+        ef: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream similar articles for a natural language query.
+
+        Same arguments as `search_similar_articles`, but yields each hit as soon as
+        it is formatted so callers that stop early (e.g. re-rankers) skip the rest.
+
+        Yields:
+            Article payload dict with `vector_id` and `score` keys
+
+        Examples:
+            >>> async for hit in ops.search_similar_articles_stream("LLM agents", limit=5):
+            ...     print(hit["title"], hit["score"])
+        """
         try:
             # Generate query embedding
             query_embedding = await self.embedder.embed(query)
@@ -513,40 +918,188 @@ class VectorOperations:
                 min_importance_score=min_importance_score,
                 date_from=date_from,
                 date_to=date_to,
+                exclude_vector_ids=exclude_vector_ids,
             )
 
+            params = search_params or self.search_params
+            if ef is not None:
+                params = params.model_copy(update={"hnsw_ef": ef})
+
             # Search in Qdrant using query_points
             search_results = self.qdrant_client.client.query_points(
                 collection_name=self.collection_name,
                 query=query_embedding,
-                limit=limit,
+                limit=limit * self.RESCORE_OVERSAMPLING if rescore else limit,
                 score_threshold=score_threshold,
                 query_filter=query_filter if query_filter else None,
-                with_payload=True,
-                with_vectors=False,
+                search_params=params,
+                with_payload=self._payload_selector(full_payload),
+                with_vectors=rescore,
             ).points
 
-            # Format results
-            results = []
-            for hit in search_results:
-                result = {
-                    "vector_id": hit.id,
-                    "score": hit.score,
-                    **hit.payload,
-                }
-                results.append(result)
+            if rescore and search_results:
+                # Re-rank the over-fetched candidates by exact cosine similarity;
+                # a COSINE collection stores (and returns) unit-length vectors
+                top_idx, top_scores = cos_topk(
+                    np.asarray(query_embedding, dtype=np.float32),
+                    np.asarray([hit.vector for hit in search_results], dtype=np.float32),
+                    limit,
+                    normalized=CollectionSchema.DISTANCE_METRIC == models.Distance.COSINE,
+                )
+                reranked = []
+                for idx, score in zip(top_idx, top_scores, strict=True):
+                    hit = search_results[idx]
+                    hit.score = float(score)
+                    reranked.append(hit)
+                search_results = reranked
+
+        except Exception as e:
+            logger.error(f"Failed to search articles: {e}")
+            return
+
+        for hit in search_results:
+            yield self._format_hit(hit)
 
-            logger.info(
-                f"Search query '{query[:50]}...' returned {len(results)} results "
-                f"(threshold: {score_threshold})",
+    async def search_grouped(
+        self,
+        query: str,
+        group_by: str = "source_type",
+        limit_per_group: int = 3,
+        limit_groups: int = 10,
+        score_threshold: float = 0.7,
+        source_type: list[str] | None = None,
+        category: list[str] | None = None,
+        min_importance_score: float | None = None,
+        full_payload: bool = True,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Search for similar articles and return the top hits per payload value.
+
+        One `query_points_groups` request replaces a search per facet value
+        (e.g. top papers, top news, top reports): Qdrant groups hits during a
+        single HNSW traversal.
+
+        Args:
+            query: Search query text
+            group_by: Keyword payload field to group by (default: "source_type")
+            limit_per_group: Maximum number of hits per group (default: 3)
+            limit_groups: Maximum number of groups (default: 10)
+            score_threshold: Minimum similarity score (default: 0.7)
+            source_type: Filter by source types
+            category: Filter by categories
+            min_importance_score: Minimum importance score
+            full_payload: If False, only fetch `CollectionSchema.SEARCH_DEFAULT_PAYLOAD`
+                fields (default: True)
+
+        Returns:
+            Dict mapping each group value to its hits, best group first.
+            Empty on failure.
+
+        Examples:
+            >>> groups = await ops.search_grouped("LLM agents", limit_per_group=2)
+            >>> for source_type, hits in groups.items():
+            ...     print(source_type, [hit["title"] for hit in hits])
+        """
+        try:
+            query_embedding = await self.embedder.embed(query)
+
+            query_filter = self._build_search_filter(
+                source_type=source_type,
+                category=category,
+                min_importance_score=min_importance_score,
             )
 
-            return results
+            groups = self.qdrant_client.client.query_points_groups(
+                collection_name=self.collection_name,
+                group_by=group_by,
+                query=query_embedding,
+                group_size=limit_per_group,
+                limit=limit_groups,
+                score_threshold=score_threshold,
+                query_filter=query_filter if query_filter else None,
+                search_params=self.search_params,
+                with_payload=self._payload_selector(full_payload),
+                with_vectors=False,
+            ).groups
 
         except Exception as e:
-            logger.error(f"Failed to search articles: {e}")
+            logger.error(f"Failed to run grouped search: {e}")
+            return {}
+
+        results = {str(group.id): [self._format_hit(hit) for hit in group.hits] for group in groups}
+        logger.info(f"Grouped search by '{group_by}' returned {len(results)} groups")
+        return results
+
+    def batch_search(
+        self,
+        query_vectors: list[list[float]],
+        query_filter: models.Filter | None = None,
+        limit: int = 10,
+        score_threshold: float | None = None,
+        batch_size: int = 16,
+        concurrency: int = 2,
+        search_params: models.SearchParams | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Run many vector searches with batched `query_batch_points` requests.
+
+        One batched request amortizes filter parsing and request overhead across
+        queries, which is much faster than dispatching single searches. Batches of
+        about 16 queries with 2 in flight per worker are a good default.
+
+        Args:
+            query_vectors: Query embeddings
+            query_filter: Optional filter applied to every query
+            limit: Maximum number of results per query (default: 10)
+            score_threshold: Minimum similarity score (optional)
+            batch_size: Number of queries per batch request (default: 16)
+            concurrency: Number of batch requests in flight (default: 2)
+            search_params: Search parameter override (defaults to the instance's
+                `search_params`)
+
+        Returns:
+            List of result lists, one per query vector and in the same order.
+            A failed batch yields empty lists for its queries.
+
+        Examples:
+            >>> embeddings = await ops.embedder.batch_embed(["RAG", "LLM agents"])
+            >>> results = ops.batch_search(embeddings, limit=5)
+        """
+        batches = [
+            query_vectors[i : i + batch_size] for i in range(0, len(query_vectors), batch_size)
+        ]
+        if not batches:
             return []
 
+        params = search_params or self.search_params
+
+        def search_batch(vectors: list[list[float]]) -> list[list[dict[str, Any]]]:
+            try:
+                responses = self.qdrant_client.client.query_batch_points(
+                    collection_name=self.collection_name,
+                    requests=[
+                        models.QueryRequest(
+                            query=vector,
+                            filter=query_filter,
+                            params=params,
+                            limit=limit,
+                            score_threshold=score_threshold,
+                            with_payload=True,
+                            with_vector=False,
+                        )
+                        for vector in vectors
+                    ],
+                )
+                return [[self._format_hit(hit) for hit in response.points] for response in responses]
+
+            except Exception as e:
+                logger.error(f"Failed to batch search {len(vectors)} queries: {e}")
+                return [[] for _ in vectors]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(batches)))) as executor:
+            results = [hits for batch in executor.map(search_batch, batches) for hits in batch]
+
+        logger.info(f"Batch search ran {len(query_vectors)} queries in {len(batches)} requests")
+        return results
+
     async def find_similar_articles(
         self,
         article_id: str | None = None,
@@ -555,9 +1108,13 @@ class VectorOperations:
         score_threshold: float = 0.7,
         source_type: list[str] | None = None,
         category: list[str] | None = None,
+        full_payload: bool = True,
     ) -> list[dict[str, Any]]:
         """Find articles similar to a given article.
 
+        Runs as a single recommend query: Qdrant looks up the reference vector
+        and excludes the reference point itself, so the vector never crosses the wire.
+
         Args:
             article_id: Article ID (from PostgreSQL) to find similar to
             vector_id: Vector ID (from Qdrant) to find similar to
@@ -565,6 +1122,8 @@ class VectorOperations:
             score_threshold: Minimum similarity score (default: 0.7)
             source_type: Filter by source types
             category: Filter by categories
+            full_payload: If False, only fetch `CollectionSchema.SEARCH_DEFAULT_PAYLOAD`
+                fields (default: True)
 
         Returns:
             List of similar articles with scores
@@ -576,54 +1135,58 @@ class VectorOperations:
             ...     score_threshold=0.8
             ... )
         """
-        try:
-            # Get the reference article
-            if vector_id:
-                ref_article = self.get_article(vector_id)
-                if not ref_article:
-                    logger.error(f"Reference article with vector_id={vector_id} not found")
-                    return []
-            elif article_id:
-                # Search by article_id in payload
-                # First, we need to find the vector_id by article_id
-                search_by_id = self.qdrant_client.client.scroll(
-                    collection_name=self.collection_name,
-                    scroll_filter=models.Filter(
-                        must=[
-                            models.FieldCondition(
-                                key="article_id",
-                                match=models.MatchValue(value=article_id),
-                            ),
-                        ],
-                    ),
-                    limit=1,
-                    with_payload=True,
-                    with_vectors=True,
-                )
+        results = [
+            hit
+            async for hit in self.find_similar_articles_stream(
+                article_id=article_id,
+                vector_id=vector_id,
+                limit=limit,
+                score_threshold=score_threshold,
+                source_type=source_type,
+                category=category,
+                full_payload=full_payload,
+            )
+        ]
 
-                if not search_by_id[0]:
-                    logger.error(f"Reference article with article_id={article_id} not found")
-                    return []
+        logger.info(
+            f"Found {len(results)} similar articles "
+            f"(vector_id={vector_id}, article_id={article_id})",
+        )
 
-                ref_point = search_by_id[0][0]
-                vector_id = ref_point.id
-                query_vector = ref_point.vector
-            else:
-                logger.error("Either article_id or vector_id must be provided")
-                return []
+        return results
 
-            # Get vector for the reference article
-            ref_points = self.qdrant_client.client.retrieve(
-                collection_name=self.collection_name,
-                ids=[vector_id],
-                with_vectors=True,
-            )
+    async def find_similar_articles_stream(
+        self,
+        article_id: str | None = None,
+        vector_id: str | None = None,
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        source_type: list[str] | None = None,
+        category: list[str] | None = None,
+        full_payload: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream articles similar to a given article.
 
-            if not ref_points:
-                logger.error(f"Vector not found for vector_id={vector_id}")
-                return []
+        Same arguments as `find_similar_articles`, but yields each hit as soon as
+        it is formatted.
 
-            query_vector = ref_points[0].vector
+        Yields:
+            Article payload dict with `vector_id` and `score` keys
+
+        Examples:
+            >>> async for hit in ops.find_similar_articles_stream(vector_id="vector-id-123"):
+            ...     print(hit["title"])
+        """
+        try:
+            # Resolve the reference point id (article_id lives in the payload)
+            if not vector_id and article_id:
+                vector_id = (await self.resolve_vector_ids([article_id])).get(article_id)
+                if not vector_id:
+                    logger.error(f"Reference article with article_id={article_id} not found")
+                    return
+            elif not vector_id:
+                logger.error("Either article_id or vector_id must be provided")
+                return
 
             # Build filters
             query_filter = self._build_search_filter(
@@ -631,38 +1194,199 @@ class VectorOperations:
                 category=category,
             )
 
-            # Search similar articles using query_points
+            # Recommend API looks up the reference vector and excludes it server-side
             search_results = self.qdrant_client.client.query_points(
                 collection_name=self.collection_name,
-                query=query_vector,
-                limit=limit + 1,  # +1 to exclude self
+                query=models.RecommendQuery(
+                    recommend=models.RecommendInput(positive=[vector_id]),
+                ),
+                limit=limit,
                 score_threshold=score_threshold,
                 query_filter=query_filter if query_filter else None,
-                with_payload=True,
+                search_params=self.search_params,
+                with_payload=self._payload_selector(full_payload),
                 with_vectors=False,
             ).points
 
-            # Format results and exclude the reference article itself
-            results = []
-            for hit in search_results:
-                if hit.id != vector_id:  # Exclude self
-                    result = {
-                        "vector_id": hit.id,
-                        "score": hit.score,
-                        **hit.payload,
-                    }
-                    results.append(result)
+        except Exception as e:
+            logger.error(f"Failed to find similar articles: {e}")
+            return
+
+        for hit in search_results:
+            yield self._format_hit(hit)
+
+    async def find_similar_articles_batch(
+        self,
+        article_ids: list[str] | None = None,
+        vector_ids: list[str] | None = None,
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        source_type: list[str] | None = None,
+        category: list[str] | None = None,
+        full_payload: bool = True,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Find similar articles for many reference articles at once.
+
+        Resolves all article IDs with a single scroll and sends every recommend
+        query in one batch request, instead of one scroll and one search per article.
 
-            # Limit to requested number
-            results = results[:limit]
+        Args:
+            article_ids: Article IDs (from PostgreSQL) to find similar to
+            vector_ids: Vector IDs (from Qdrant) to find similar to
+            limit: Maximum number of results per reference article (default: 10)
+            score_threshold: Minimum similarity score (default: 0.7)
+            source_type: Filter by source types
+            category: Filter by categories
+            full_payload: If False, only fetch `CollectionSchema.SEARCH_DEFAULT_PAYLOAD`
+                fields (default: True)
+
+        Returns:
+            Dict mapping each reference ID (article_id or vector_id, as given) to its
+            list of similar articles. Unresolved references are omitted.
+
+        Examples:
+            >>> related = await ops.find_similar_articles_batch(
+            ...     article_ids=["uuid-1", "uuid-2"],
+            ...     limit=3,
+            ... )
+            >>> related["uuid-1"][0]["title"]
+        """
+        try:
+            if article_ids:
+                ref_to_vector = await self.resolve_vector_ids(article_ids)
+            else:
+                ref_to_vector = {vid: vid for vid in vector_ids or []}
 
-            logger.info(f"Found {len(results)} similar articles for vector_id={vector_id}")
+            if not ref_to_vector:
+                logger.warning("No reference articles resolved for batch similarity search")
+                return {}
 
+            query_filter = self._build_search_filter(
+                source_type=source_type,
+                category=category,
+            )
+
+            responses = self.qdrant_client.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=[
+                    models.QueryRequest(
+                        query=models.RecommendQuery(
+                            recommend=models.RecommendInput(positive=[vector_id]),
+                        ),
+                        filter=query_filter,
+                        params=self.search_params,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        with_payload=self._payload_selector(full_payload),
+                        with_vector=False,
+                    )
+                    for vector_id in ref_to_vector.values()
+                ],
+            )
+
+            results = {
+                ref_id: [self._format_hit(hit) for hit in response.points]
+                for ref_id, response in zip(ref_to_vector, responses, strict=True)
+            }
+
+            logger.info(f"Found similar articles for {len(results)} reference articles")
             return results
 
         except Exception as e:
-            logger.error(f"Failed to find similar articles: {e}")
-            return []
+            logger.error(f"Failed to batch find similar articles: {e}")
+            return {}
+
+    async def resolve_vector_ids(self, article_ids: list[str]) -> dict[str, str]:
+        """Resolve article IDs to vector IDs with as few scrolls as possible.
+
+        Re-inserting an article creates a new point, so one article_id can have
+        several points. The scroll pages with ``next_page_offset`` until every
+        requested ID is resolved or the matching points are exhausted, so
+        duplicates of one article can't crowd the others out of the mapping.
+
+        Args:
+            article_ids: Article IDs (from PostgreSQL)
+
+        Returns:
+            Dict mapping article_id to vector_id (first point found; missing articles are omitted)
+
+        Examples:
+            >>> mapping = await ops.resolve_vector_ids(["uuid-1", "uuid-2"])
+        """
+        pending = set(article_ids)
+        if not pending:
+            return {}
+
+        mapping: dict[str, str] = {}
+        offset = None
+
+        try:
+            while pending:
+                points, offset = self.qdrant_client.client.scroll(
+                    collection_name=self.collection_name,
+                    scroll_filter=models.Filter(
+                        must=[
+                            models.FieldCondition(
+                                key="article_id",
+                                match=models.MatchAny(any=list(pending)),
+                            ),
+                        ],
+                    ),
+                    limit=len(pending),
+                    offset=offset,
+                    with_payload=["article_id"],
+                    with_vectors=False,
+                )
+
+                for point in points:
+                    article_id = point.payload["article_id"]
+                    if article_id in pending:
+                        mapping[article_id] = point.id
+                        pending.discard(article_id)
+
+                if offset is None:
+                    break
+
+            return mapping
+
+        except Exception as e:
+            logger.error(f"Failed to resolve vector IDs: {e}")
+            return {}
+
+    @staticmethod
+    def _payload_selector(full_payload: bool) -> bool | models.PayloadSelectorInclude:
+        """Return the `with_payload` value for search requests.
+
+        Payload fetching dominates search latency on large collections, so slim
+        searches only return the fields needed to identify and rank hits.
+
+        Args:
+            full_payload: If True, fetch the whole payload
+
+        Returns:
+            True, or a selector including only `CollectionSchema.SEARCH_DEFAULT_PAYLOAD`
+        """
+        if full_payload:
+            return True
+        return models.PayloadSelectorInclude(include=CollectionSchema.SEARCH_DEFAULT_PAYLOAD)
+
+    @staticmethod
+    def _format_hit(hit: models.ScoredPoint) -> dict[str, Any]:
+        """Format a scored point as an article dict.
+
+        Reuses the payload dict already allocated by the client instead of
+        copying it into a new one.
+
+        Args:
+            hit: Scored point returned by Qdrant
+
+        Returns:
+            Article payload dict with `vector_id` and `score` keys
+        """
+        result = hit.payload if hit.payload is not None else {}
+        result["vector_id"] = hit.id
+        result["score"] = hit.score
+        return result
 
     def _build_search_filter(
         self,
@@ -671,72 +1395,106 @@ class VectorOperations:
         min_importance_score: float | None = None,
         date_from: str | None = None,
         date_to: str | None = None,
+        exclude_vector_ids: list[str] | None = None,
     ) -> models.Filter | None:
         """Build Qdrant filter for search queries.
 
+        Filters are memoized on their normalized arguments; the returned Filter is
+        shared between calls and must not be mutated.
+
         Args:
             source_type: Filter by source types
             category: Filter by categories
             min_importance_score: Minimum importance score
             date_from: Filter from this date
             date_to: Filter until this date
+            exclude_vector_ids: Vector IDs to exclude via a must_not condition
 
         Returns:
             Qdrant Filter object or None if no filters
         """
-        must_conditions = []
-
-        # Source type filter
-        if source_type:
-            must_conditions.append(
-                models.FieldCondition(
-                    key="source_type",
-                    match=models.MatchAny(any=source_type),
-                ),
-            )
-
-        # Category filter
-        if category:
-            must_conditions.append(
-                models.FieldCondition(
-                    key="category",
-                    match=models.MatchAny(any=category),
-                ),
-            )
-
-        # Importance score filter
-        if min_importance_score is not None:
-            must_conditions.append(
-                models.FieldCondition(
-                    key="importance_score",
-                    range=models.Range(gte=min_importance_score),
-                ),
-            )
-
-        # Date range filter
-        if date_from or date_to:
-            range_params = {}
-            if date_from:
-                range_params["gte"] = date_from
-            if date_to:
-                range_params["lte"] = date_to
-
-            must_conditions.append(
-                models.FieldCondition(
-                    key="collected_at",
-                    range=models.Range(**range_params),
-                ),
-            )
-
-        # Return filter if any conditions exist
-        if must_conditions:
-            return models.Filter(must=must_conditions)
-
-        return None
+        return _build_cached_search_filter(
+            source_type=tuple(sorted(set(source_type))) if source_type else (),
+            category=tuple(sorted(set(category))) if category else (),
+            min_importance_score=min_importance_score,
+            date_from=date_from,
+            date_to=date_to,
+            exclude_vector_ids=tuple(sorted(set(exclude_vector_ids))) if exclude_vector_ids else (),
+        )
+
+
+@lru_cache(maxsize=256)
+def _build_cached_search_filter(
+    source_type: tuple[str, ...],
+    category: tuple[str, ...],
+    min_importance_score: float | None,
+    date_from: str | None,
+    date_to: str | None,
+    exclude_vector_ids: tuple[str, ...],
+) -> models.Filter | None:
+    """Build Qdrant filter from hashable search arguments (see `_build_search_filter`)."""
+    must_conditions = []
+
+    # Source type filter
+    if source_type:
+        must_conditions.append(
+            models.FieldCondition(
+                key="source_type",
+                match=models.MatchAny(any=list(source_type)),
+            ),
+        )
+
+    # Category filter
+    if category:
+        must_conditions.append(
+            models.FieldCondition(
+                key="category",
+                match=models.MatchAny(any=list(category)),
+            ),
+        )
+
+    # Importance score filter
+    if min_importance_score is not None:
+        must_conditions.append(
+            models.FieldCondition(
+                key="importance_score",
+                range=models.Range(gte=min_importance_score),
+            ),
+        )
+
+    # Date range filter
+    if date_from or date_to:
+        range_params = {}
+        if date_from:
+            range_params["gte"] = date_from
+        if date_to:
+            range_params["lte"] = date_to
+
+        must_conditions.append(
+            models.FieldCondition(
+                key="collected_at",
+                range=models.Range(**range_params),
+            ),
+        )
+
+    # Exclude specific points server-side instead of filtering hits afterwards
+    must_not_conditions = []
+    if exclude_vector_ids:
+        must_not_conditions.append(models.HasIdCondition(has_id=list(exclude_vector_ids)))
+
+    # Return filter if any conditions exist
+    if must_conditions or must_not_conditions:
+        return models.Filter(
+            must=must_conditions or None,
+            must_not=must_not_conditions or None,
+        )
+
+    return None
 
 
 # Global operations instance
 _vector_ops: VectorOperations | None = None
+_vector_ops_lock = threading.Lock()
 
 
 def get_vector_operations() -> VectorOperations:
@@ -747,5 +1505,8 @@ def get_vector_operations() -> VectorOperations:
     """
     global _vector_ops
     if _vector_ops is None:
-        _vector_ops = VectorOperations()
+        # Double-checked locking so concurrent startup builds a single instance
+        with _vector_ops_lock:
+            if _vector_ops is None:
+                _vector_ops = VectorOperations()
     return _vector_ops
@@ -1,11 +1,16 @@
 """Qdrant collection schema definitions and setup utilities."""
 
 import logging
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
 from qdrant_client.http import models
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.vector_db.client import QdrantClientWrapper, get_qdrant_client
 
 logger = logging.getLogger(__name__)
@@ -14,11 +19,43 @@ logger = logging.getLogger(__name__)
 class CollectionSchema:
     """Schema definition for research_articles collection."""
 
-    # Collection metadata
-    COLLECTION_NAME = settings.QDRANT_COLLECTION_NAME
-    VECTOR_SIZE = settings.QDRANT_VECTOR_SIZE
+    # Collection metadata (name and vector size are read from settings on access)
     DISTANCE_METRIC = models.Distance.COSINE
 
+    # int8 scalar quantization (QDRANT_QUANTIZATION=int8, default): quantized vectors stay
+    # in RAM for candidate scoring while the original float32 vectors live on disk.
+    # Searches over-fetch 2x candidates on int8 and rescore them with the float32 vectors
+    QUANTIZATION_CONFIG = models.ScalarQuantization(
+        scalar=models.ScalarQuantizationConfig(
+            type=models.ScalarType.INT8,
+            quantile=0.99,
+            always_ram=True,
+        ),
+    )
+    QUANTIZATION_SEARCH = models.QuantizationSearchParams(ignore=False, rescore=True, oversampling=2.0)
+
+    # 1-bit binary quantization (QDRANT_QUANTIZATION=binary): each vector is reduced to its
+    # sign bits (1536 dims -> 192 bytes, 32x smaller than float32) and candidates are ranked
+    # by Hamming distance (XOR + popcount). Too lossy on its own, so searches over-fetch
+    # candidates and rescore them with the original vectors (BINARY_QUANTIZATION_SEARCH)
+    BINARY_QUANTIZATION_CONFIG = models.BinaryQuantization(
+        binary=models.BinaryQuantizationConfig(always_ram=True),
+    )
+    BINARY_QUANTIZATION_SEARCH = models.QuantizationSearchParams(
+        ignore=False, rescore=True, oversampling=3.0
+    )
+
+    # Original vectors are stored as float16: half the disk reads when quantized candidates
+    # are rescored, at well below embedding noise. Clients still send float32
+    VECTOR_DATATYPE = models.Datatype.FLOAT16
+
+    # HNSW graph: more links per node (m) and a wider build-time beam (ef_construct) than
+    # Qdrant's defaults (16/100) for better recall; the query-time beam is hnsw_ef below
+    HNSW_CONFIG = models.HnswConfigDiff(m=24, ef_construct=200, full_scan_threshold=10000)
+
+    # HNSW indexing threshold (KB of vectors per segment) restored after a bulk upload
+    DEFAULT_INDEXING_THRESHOLD = 20000
+
     # Payload schema (for reference and validation)
     PAYLOAD_SCHEMA = {
         "article_id": "string (UUID)",  # Reference to PostgreSQL CollectedArticle.id
@@ -31,58 +68,144 @@ class CollectionSchema:
         "metadata": "object",  # Additional metadata (authors, citations, etc.)
     }
 
+    # Search parameters. Never go near hnsw_ef=1, which makes queries pathologically slow;
+    # indexed_only skips segments that are still unindexed during an active bulk upload
+    DEFAULT_SEARCH_PARAMS = models.SearchParams(hnsw_ef=128, exact=False, indexed_only=False)
+    BULK_INGEST_SEARCH_PARAMS = models.SearchParams(hnsw_ef=128, exact=False, indexed_only=True)
+
+    # Payload fields returned by slim searches (full_payload=False). Fetching the
+    # whole payload per candidate is the main search cost on large collections;
+    # hydrate selected hits afterwards with VectorOperations.get_articles_batch
+    SEARCH_DEFAULT_PAYLOAD = ["article_id", "title"]
+
     # Index configuration for optimized filtering
-    PAYLOAD_INDEXES = [
-        # Create index on source_type for filtering by paper/news/report
-        {
-            "field_name": "source_type",
-            "field_schema": models.PayloadSchemaType.KEYWORD,
-        },
-        # Create index on category for filtering by research category
-        {
-            "field_name": "category",
-            "field_schema": models.PayloadSchemaType.KEYWORD,
-        },
-        # Create index on importance_score for filtering by score threshold
-        {
-            "field_name": "importance_score",
-            "field_schema": models.PayloadSchemaType.FLOAT,
-        },
-        # Create index on collected_at for date range filtering
-        {
-            "field_name": "collected_at",
-            "field_schema": models.PayloadSchemaType.KEYWORD,
-        },
-    ]
+    PAYLOAD_INDEXES: dict[str, models.PayloadSchemaType] = {
+        "article_id": models.PayloadSchemaType.KEYWORD,  # lookups/dedup by PostgreSQL article ID
+        "source_type": models.PayloadSchemaType.KEYWORD,  # filtering by paper/news/report
+        "category": models.PayloadSchemaType.KEYWORD,  # filtering by research category
+        "importance_score": models.PayloadSchemaType.FLOAT,  # filtering by score threshold
+        "collected_at": models.PayloadSchemaType.KEYWORD,  # date range filtering
+    }
+
+    # Read-only {"field", "type"} summary of PAYLOAD_INDEXES, computed once
+    PAYLOAD_INDEXES_SUMMARY = tuple(
+        MappingProxyType({"field": field_name, "type": field_schema.value})
+        for field_name, field_schema in PAYLOAD_INDEXES.items()
+    )
 
     @classmethod
-    def get_schema_info(cls) -> dict[str, Any]:
+    def collection_name(cls) -> str:
+        """Get the collection name from settings.
+
+        Returns:
+            str: Qdrant collection name
+        """
+        return get_settings().QDRANT_COLLECTION_NAME
+
+    @classmethod
+    def vector_size(cls) -> int:
+        """Get the embedding vector size from settings.
+
+        Returns:
+            int: Embedding vector dimension
+        """
+        return get_settings().QDRANT_VECTOR_SIZE
+
+    @classmethod
+    def quantization_config(cls) -> models.QuantizationConfig | None:
+        """Get the quantization config selected by settings.QDRANT_QUANTIZATION.
+
+        Returns:
+            QuantizationConfig | None: int8 scalar, binary, or None for no quantization
+        """
+        mode = get_settings().QDRANT_QUANTIZATION
+        if mode == "binary":
+            return cls.BINARY_QUANTIZATION_CONFIG
+        if mode == "none":
+            return None
+        return cls.QUANTIZATION_CONFIG
+
+    @classmethod
+    def vectors_on_disk(cls) -> bool:
+        """Whether the original vectors are stored on disk.
+
+        Only when a quantized copy is kept in RAM for candidate scoring; with
+        QDRANT_QUANTIZATION=none every search scores the originals, so they stay in RAM.
+
+        Returns:
+            bool: True if the configured mode quantizes vectors
+        """
+        return cls.quantization_config() is not None
+
+    @classmethod
+    def search_params(cls, bulk_ingest: bool = False) -> models.SearchParams:
+        """Get the search parameters matching the configured quantization.
+
+        Args:
+            bulk_ingest: Use `BULK_INGEST_SEARCH_PARAMS` instead of `DEFAULT_SEARCH_PARAMS`
+
+        Returns:
+            SearchParams: With the oversampling/rescore parameters of the active
+            quantization mode (`QUANTIZATION_SEARCH` or `BINARY_QUANTIZATION_SEARCH`)
+        """
+        params = cls.BULK_INGEST_SEARCH_PARAMS if bulk_ingest else cls.DEFAULT_SEARCH_PARAMS
+        quantization = {
+            "int8": cls.QUANTIZATION_SEARCH,
+            "binary": cls.BINARY_QUANTIZATION_SEARCH,
+        }.get(get_settings().QDRANT_QUANTIZATION)
+        if quantization is not None:
+            params = params.model_copy(update={"quantization": quantization})
+        return params
+
+    @classmethod
+    def get_schema_info(cls) -> Mapping[str, Any]:
         """Get complete schema information.
 
+        The static part of the schema is built once; the settings-driven fields
+        (collection name, vector size, quantization) are read on every call so
+        runtime settings changes are reflected.
+
         Returns:
-            dict: Schema information including collection name, vector size, and payload schema
+            Mapping: Schema information including collection name, vector size, and payload schema
         """
-        return {
-            "collection_name": cls.COLLECTION_NAME,
-            "vector_size": cls.VECTOR_SIZE,
-            "distance_metric": cls.DISTANCE_METRIC.value,
-            "payload_schema": cls.PAYLOAD_SCHEMA,
-            "payload_indexes": [
-                {"field": idx["field_name"], "type": idx["field_schema"].value}
-                for idx in cls.PAYLOAD_INDEXES
-            ],
-        }
+        return MappingProxyType(
+            {
+                "collection_name": cls.collection_name(),
+                "vector_size": cls.vector_size(),
+                "quantization": get_settings().QDRANT_QUANTIZATION,
+                **_build_static_schema_info(cls),
+            },
+        )
+
+
+@cache
+def _build_static_schema_info(schema: type[CollectionSchema]) -> Mapping[str, Any]:
+    """Build the read-only, settings-independent part of `CollectionSchema.get_schema_info`."""
+    return MappingProxyType(
+        {
+            "distance_metric": schema.DISTANCE_METRIC.value,
+            "storage_dtype": schema.VECTOR_DATATYPE.value,
+            "hnsw": MappingProxyType(schema.HNSW_CONFIG.model_dump(exclude_none=True)),
+            "payload_schema": MappingProxyType(dict(schema.PAYLOAD_SCHEMA)),
+            "payload_indexes": schema.PAYLOAD_INDEXES_SUMMARY,
+        },
+    )
 
 
 def setup_collection(
     client: QdrantClientWrapper | None = None,
     recreate: bool = False,
+    bulk_mode: bool = False,
 ) -> bool:
     """Setup the research_articles collection with proper schema and indexes.
 
     Args:
         client: Qdrant client instance (defaults to global client)
         recreate: If True, delete existing collection and create new one (default: False)
+        bulk_mode: If True, create the collection with HNSW indexing disabled so a bulk
+            upload only appends to segments. If the collection already exists and is
+            kept, indexing is disabled on it instead. Call `finalize_bulk_upload`
+            afterwards to build the index once (default: False)
 
     Returns:
         bool: True if setup was successful, False otherwise
@@ -93,7 +216,7 @@ def setup_collection(
     if client is None:
         client = get_qdrant_client()
 
-    collection_name = CollectionSchema.COLLECTION_NAME
+    collection_name = CollectionSchema.collection_name()
 
     try:
         # Check if collection exists
@@ -101,44 +224,55 @@ def setup_collection(
 
         if exists and not recreate:
             logger.info(f"Collection '{collection_name}' already exists. Skipping creation.")
+            if bulk_mode:
+                # Disable HNSW indexing on the existing collection until the bulk upload is finalized
+                client.client.update_collection(
+                    collection_name=collection_name,
+                    optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0),
+                )
+                logger.info(f"Disabled indexing on collection '{collection_name}' for bulk upload")
+            # Still reconcile indexes so fields added to the schema later get indexed
+            ensure_payload_indexes(client)
             info = client.get_collection_info(collection_name)
             if info:
                 logger.info(f"Collection info: {info}")
             return True
 
+        # Disable HNSW indexing until the bulk upload is finalized
+        optimizers_config = models.OptimizersConfigDiff(indexing_threshold=0) if bulk_mode else None
+
         # Recreate or create collection
         if recreate:
             logger.info(f"Recreating collection '{collection_name}'...")
             success = client.recreate_collection(
                 collection_name=collection_name,
-                vector_size=CollectionSchema.VECTOR_SIZE,
+                vector_size=CollectionSchema.vector_size(),
                 distance=CollectionSchema.DISTANCE_METRIC,
+                optimizers_config=optimizers_config,
+                quantization_config=CollectionSchema.quantization_config(),
+                on_disk_vectors=CollectionSchema.vectors_on_disk(),
+                hnsw_config=CollectionSchema.HNSW_CONFIG,
+                datatype=CollectionSchema.VECTOR_DATATYPE,
             )
         else:
             logger.info(f"Creating collection '{collection_name}'...")
             success = client.create_collection(
                 collection_name=collection_name,
-                vector_size=CollectionSchema.VECTOR_SIZE,
+                vector_size=CollectionSchema.vector_size(),
                 distance=CollectionSchema.DISTANCE_METRIC,
+                optimizers_config=optimizers_config,
+                quantization_config=CollectionSchema.quantization_config(),
+                on_disk_vectors=CollectionSchema.vectors_on_disk(),
+                hnsw_config=CollectionSchema.HNSW_CONFIG,
+                datatype=CollectionSchema.VECTOR_DATATYPE,
             )
 
         if not success:
             logger.error(f"Failed to create collection '{collection_name}'")
             return False
 
-        # Create payload indexes for optimized filtering
-        logger.info("Creating payload indexes...")
-        for index_config in CollectionSchema.PAYLOAD_INDEXES:
-            try:
-                client.client.create_payload_index(
-                    collection_name=collection_name,
-                    field_name=index_config["field_name"],
-                    field_schema=index_config["field_schema"],
-                )
-                logger.info(f"Created index on '{index_config['field_name']}'")
-            except Exception as e:
-                logger.warning(f"Failed to create index on '{index_config['field_name']}': {e}")
-                # Continue with other indexes even if one fails
+        # Create payload indexes before any points are inserted
+        ensure_payload_indexes(client)
 
         # Verify collection setup
         info = client.get_collection_info(collection_name)
@@ -154,6 +288,154 @@ def setup_collection(
         return False
 
 
+def ensure_payload_indexes(client: QdrantClientWrapper | None = None) -> list[str]:
+    """Create any payload indexes from the schema that the collection is missing.
+
+    Call this at startup, before inserting points, so new indexes are never built
+    over an already populated collection.
+
+    Args:
+        client: Qdrant client instance (defaults to global client)
+
+    Returns:
+        list[str]: Names of the fields that were newly indexed
+    """
+    if client is None:
+        client = get_qdrant_client()
+
+    collection_name = CollectionSchema.collection_name()
+
+    try:
+        existing = client.client.get_collection(collection_name).payload_schema or {}
+    except Exception as e:
+        logger.error(f"Failed to fetch payload indexes for '{collection_name}': {e}")
+        return []
+
+    missing = {
+        field_name: field_schema
+        for field_name, field_schema in CollectionSchema.PAYLOAD_INDEXES.items()
+        if field_name not in existing
+    }
+    if not missing:
+        logger.info("All payload indexes already exist")
+        return []
+
+    created = []
+    logger.info(f"Creating {len(missing)} payload indexes...")
+
+    # Each index is a separate round-trip, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+        futures = {
+            executor.submit(
+                client.client.create_payload_index,
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=field_schema,
+            ): field_name
+            for field_name, field_schema in missing.items()
+        }
+        for future in as_completed(futures):
+            field_name = futures[future]
+            error = future.exception()
+            if error is not None:
+                # Continue with other indexes even if one fails
+                logger.warning(f"Failed to create index on '{field_name}': {error}")
+                continue
+            created.append(field_name)
+            logger.info(f"Created index on '{field_name}'")
+
+    return created
+
+
+def finalize_bulk_upload(
+    client: QdrantClientWrapper | None = None,
+    indexing_threshold: int = CollectionSchema.DEFAULT_INDEXING_THRESHOLD,
+) -> bool:
+    """Re-enable HNSW indexing after a bulk upload into a `bulk_mode` collection.
+
+    Qdrant then builds the index in a single background optimization pass
+    instead of incrementally during every batch insert.
+
+    Args:
+        client: Qdrant client instance (defaults to global client)
+        indexing_threshold: Indexing threshold to restore (default: 20000)
+
+    Returns:
+        bool: True if the collection was updated, False otherwise
+
+    Examples:
+        >>> setup_collection(recreate=True, bulk_mode=True)
+        >>> await ops.insert_articles_batch(articles)
+        >>> finalize_bulk_upload()
+    """
+    if client is None:
+        client = get_qdrant_client()
+
+    collection_name = CollectionSchema.collection_name()
+
+    try:
+        client.client.update_collection(
+            collection_name=collection_name,
+            optimizers_config=models.OptimizersConfigDiff(indexing_threshold=indexing_threshold),
+        )
+        logger.info(
+            f"Restored indexing_threshold={indexing_threshold} on collection '{collection_name}'",
+        )
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to finalize bulk upload: {e}")
+        return False
+
+
+def warmup_collection(
+    client: QdrantClientWrapper | None = None,
+    num_queries: int = 8,
+    ef: int = 256,
+) -> int:
+    """Prime the HNSW graph and vector pages with throwaway searches.
+
+    Random-vector queries with a wide `ef` touch a large part of the graph, so
+    the first real search after startup does not pay for page faults on the
+    on-disk vectors and graph links. All queries go out in one batch request.
+    Skipped for embedded (`QDRANT_LOCATION`) instances, which search exhaustively.
+
+    Args:
+        client: Qdrant client instance (defaults to global client)
+        num_queries: Number of warmup queries (default: 8)
+        ef: HNSW `ef` used for the warmup queries (default: 256)
+
+    Returns:
+        int: Number of warmup queries run (0 if skipped or failed)
+    """
+    if client is None:
+        client = get_qdrant_client()
+
+    if client.location or num_queries <= 0:
+        return 0
+
+    collection_name = CollectionSchema.collection_name()
+    params = CollectionSchema.search_params().model_copy(update={"hnsw_ef": ef})
+    queries = np.random.default_rng().standard_normal(
+        (num_queries, CollectionSchema.vector_size()), dtype=np.float32
+    )
+
+    try:
+        client.client.query_batch_points(
+            collection_name=collection_name,
+            requests=[
+                models.QueryRequest(query=query.tolist(), limit=10, params=params, with_payload=False)
+                for query in queries
+            ],
+        )
+        logger.info(f"Warmed up collection '{collection_name}' with {num_queries} queries")
+        return num_queries
+
+    except Exception as e:
+        logger.warning(f"Collection warmup failed: {e}")
+        return 0
+
+
 def verify_collection_schema(client: QdrantClientWrapper | None = None) -> dict[str, Any]:
     """Verify that the collection exists and has the correct schema.
 
@@ -170,7 +452,7 @@ def verify_collection_schema(client: QdrantClientWrapper | None = None) -> dict[
     if client is None:
         client = get_qdrant_client()
 
-    collection_name = CollectionSchema.COLLECTION_NAME
+    collection_name = CollectionSchema.collection_name()
     result = {
         "exists": False,
         "schema_valid": False,
@@ -194,9 +476,9 @@ def verify_collection_schema(client: QdrantClientWrapper | None = None) -> dict[
     result["info"] = info
 
     # Validate vector size
-    if info["vector_size"] != CollectionSchema.VECTOR_SIZE:
+    if info["vector_size"] != CollectionSchema.vector_size():
         result["errors"].append(
-            f"Vector size mismatch: expected {CollectionSchema.VECTOR_SIZE}, "
+            f"Vector size mismatch: expected {CollectionSchema.vector_size()}, "
             f"got {info['vector_size']}",
         )
     else:
@@ -205,7 +487,11 @@ def verify_collection_schema(client: QdrantClientWrapper | None = None) -> dict[
     return result
 
 
-def initialize_vector_db(recreate: bool = False) -> bool:
+def initialize_vector_db(
+    recreate: bool = False,
+    bulk_mode: bool = False,
+    warmup: bool = True,
+) -> bool:
     """Initialize the vector database (main entry point).
 
     This function should be called during application startup to ensure
@@ -213,6 +499,10 @@ def initialize_vector_db(recreate: bool = False) -> bool:
 
     Args:
         recreate: If True, recreate the collection even if it exists (default: False)
+        bulk_mode: If True, create the collection with indexing disabled for a bulk
+            upload; call `finalize_bulk_upload` when it is done (default: False)
+        warmup: If True and the collection has points, prime it with
+            `warmup_collection` (default: True)
 
     Returns:
         bool: True if initialization was successful, False otherwise
@@ -233,7 +523,7 @@ def initialize_vector_db(recreate: bool = False) -> bool:
         logger.info(f"Available collections: {health.get('collections', [])}")
 
         # Setup collection
-        success = setup_collection(client, recreate=recreate)
+        success = setup_collection(client, recreate=recreate, bulk_mode=bulk_mode)
         if not success:
             logger.error("Failed to setup collection")
             return False
@@ -248,6 +538,9 @@ def initialize_vector_db(recreate: bool = False) -> bool:
             logger.error(f"Schema validation failed: {verification['errors']}")
             return False
 
+        if warmup and verification["info"]["points_count"]:
+            warmup_collection(client)
+
         logger.info("Vector database initialization complete!")
         return True
 
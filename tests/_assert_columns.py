@@ -0,0 +1,34 @@
+"""Column-wise assertions over lists of search result dicts."""
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+
+def assert_column(
+    results: list[dict[str, Any]],
+    key: str,
+    predicate: Callable[[np.ndarray], np.ndarray],
+    message: str = "",
+) -> None:
+    """Assert that ``predicate`` holds for every value of ``key`` in ``results``.
+
+    The column is gathered into a single ndarray so the check runs as one
+    vectorized comparison; on failure the offending values are reported.
+
+    Args:
+        results: Result dicts (e.g. from ``search_similar_articles``)
+        key: Field to check in every result
+        predicate: Vectorized check returning a boolean array, e.g. ``lambda a: a >= 0.9``
+        message: Assertion message prefix
+
+    Examples:
+        >>> assert_column(results, "score", lambda a: a >= 0.85, "Scores below threshold")
+    """
+    if not results:
+        return
+
+    column = np.array([r[key] for r in results])
+    passed = np.asarray(predicate(column), dtype=bool)
+    assert passed.all(), f"{message} ({key} values failing check: {column[~passed].tolist()})"
@@ -0,0 +1,82 @@
+"""Columnar article fixtures for the semantic search tests.
+
+The articles are stored as ``tests/data/test_articles.parquet`` and loaded
+with pyarrow, so the payload is decoded column-wise in C instead of being
+rebuilt as Python dict literals on every run. The file is (re)built from
+``TEST_ARTICLES`` on first use; run this module to rebuild it explicitly
+after editing the list::
+
+    python tests/_build_fixtures.py
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DATA_DIR = Path(__file__).parent / "data"
+TEST_ARTICLES_PATH = DATA_DIR / "test_articles.parquet"
+
+TEST_ARTICLES_SCHEMA = pa.schema(
+    [
+        ("article_id", pa.string()),
+        ("title", pa.string()),
+        ("content", pa.string()),
+        ("summary", pa.string()),
+        ("source_type", pa.string()),
+        ("category", pa.string()),
+        ("importance_score", pa.float64()),
+    ]
+)
+
+TEST_ARTICLES = [
+    {
+        "article_id": "uuid-1",
+        "title": "Attention Is All You Need",
+        "content": "The dominant sequence transduction models are based on "
+        "complex recurrent or convolutional neural networks. "
+        "We propose the Transformer, based solely on attention mechanisms.",
+        "summary": "Transformer 아키텍처를 소개하는 혁신적인 논문입니다.",
+        "source_type": "paper",
+        "category": "NLP",
+        "importance_score": 0.95,
+    },
+    {
+        "article_id": "uuid-2",
+        "title": "BERT: Pre-training of Deep Bidirectional Transformers",
+        "content": "We introduce BERT, a new language representation model.",
+        "summary": "BERT 모델을 소개합니다.",
+        "source_type": "paper",
+        "category": "NLP",
+        "importance_score": 0.92,
+    },
+    {
+        "article_id": "uuid-3",
+        "title": "GPT-4 Technical Report",
+        "content": "GPT-4 is a large-scale, multimodal model.",
+        "summary": "GPT-4의 기술적 세부사항을 다룹니다.",
+        "source_type": "report",
+        "category": "AI",
+        "importance_score": 0.98,
+    },
+]
+
+
+def build_test_articles(path: Path = TEST_ARTICLES_PATH) -> Path:
+    """Write ``TEST_ARTICLES`` to a parquet file and return its path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pylist(TEST_ARTICLES, schema=TEST_ARTICLES_SCHEMA)
+    pq.write_table(table, path)
+    return path
+
+
+def load_test_articles(path: Path = TEST_ARTICLES_PATH) -> list[dict[str, Any]]:
+    """Load the test articles, building the parquet file if it does not exist."""
+    if not path.exists():
+        build_test_articles(path)
+    return pq.read_table(path).to_pylist()
+
+
+if __name__ == "__main__":
+    print(f"Wrote {build_test_articles()}")
@@ -0,0 +1,36 @@
+"""On-disk embedding cache for the test suite.
+
+Embeddings are stored as ``.npy`` files keyed by SHA-256(model + text) under
+``tests/.embedding_cache/`` so repeated test runs (locally and in CI) load
+vectors from disk instead of calling the embedding API again.
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR = Path(__file__).parent / ".embedding_cache"
+
+
+def cache_path(text: str, model: str) -> Path:
+    """Return the cache file path for a text/model pair."""
+    key = hashlib.sha256(f"{model}:{text}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.npy"
+
+
+def load_embedding(text: str, model: str) -> list[float] | None:
+    """Load a cached embedding, or None if it has not been stored yet."""
+    path = cache_path(text, model)
+    if not path.exists():
+        return None
+    return np.load(path).tolist()
+
+
+def store_embedding(text: str, model: str, embedding: list[float]) -> None:
+    """Persist an embedding to the cache directory."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = cache_path(text, model)
+    tmp_path = path.with_suffix(".tmp.npy")
+    np.save(tmp_path, np.asarray(embedding, dtype=np.float32))
+    tmp_path.replace(path)
@@ -0,0 +1,30 @@
+"""Event loop selection for the test suite.
+
+Uses ``uvloop`` when it is installed (it is not available on Windows) and
+falls back to the default asyncio loop otherwise.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
+LOOP_NAME = "uvloop" if uvloop is not None else "asyncio"
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop, preferring uvloop."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Drop-in replacement for ``asyncio.run`` that runs ``main`` on uvloop when available."""
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] = new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
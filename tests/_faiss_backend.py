@@ -0,0 +1,238 @@
+"""In-process stand-in for ``VectorOperations`` used by search tests.
+
+Enabled with ``USE_FAISS_STUB=1``. Embeddings are stored column-wise: one
+contiguous, L2-normalized ``float32`` matrix of shape ``(n, d)`` plus parallel
+metadata arrays. A query is a single matrix-vector product (BLAS) followed by
+vectorized filter masks and ``argpartition`` top-k, equivalent to an exact
+FAISS ``IndexFlatIP`` and to Qdrant's cosine distance, without a server.
+
+With ``quantizer="int8"`` rows are scalar-quantized to int8 codes with
+per-dimension scales trained on the first inserted batch (the equivalent of
+``faiss.IndexScalarQuantizer(QT_8bit)``), mirroring the int8 quantization
+used by the production collection. Scores are then approximate, so the
+score threshold is relaxed by ``INT8_SCORE_TOLERANCE``.
+"""
+
+from typing import Any, Literal
+
+import numpy as np
+from uuid_extensions import uuid7
+
+from app.vector_db import CollectionSchema
+
+
+class FAISSVectorOperations:
+    """Subset of the ``VectorOperations`` search API backed by NumPy arrays."""
+
+    INT8_SCORE_TOLERANCE = 0.02
+
+    def __init__(
+        self,
+        embedder: Any,
+        dimension: int | None = None,
+        quantizer: Literal["fp32", "int8"] = "fp32",
+    ):
+        self.embedder = embedder
+        self.dimension = dimension or CollectionSchema.vector_size()
+        self.quantizer = quantizer
+        self.score_tolerance = self.INT8_SCORE_TOLERANCE if quantizer == "int8" else 0.0
+
+        # float32 rows, or int8 codes with per-dimension scales when quantized
+        dtype = np.int8 if quantizer == "int8" else np.float32
+        self.vectors: np.ndarray = np.empty((0, self.dimension), dtype=dtype)
+        self.scales: np.ndarray | None = None
+
+        # Metadata columns, row-aligned with ``self.vectors``
+        self.vector_ids: list[str] = []
+        self.article_ids: list[str] = []
+        self.titles: list[str] = []
+        self.summaries: list[str] = []
+        self.metadata: list[dict[str, Any]] = []
+        self.source_types: np.ndarray = np.empty(0, dtype=object)
+        self.categories: np.ndarray = np.empty(0, dtype=object)
+        self.importance_scores: np.ndarray = np.empty(0, dtype=np.float64)
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _encode(self, batch: np.ndarray) -> np.ndarray:
+        """Return rows in storage format, training the int8 scales on first use."""
+        if self.quantizer != "int8":
+            return batch
+        if self.scales is None:
+            self.scales = 127.0 / np.maximum(np.abs(batch).max(axis=0), 1e-12)
+        return np.clip(np.rint(batch * self.scales), -127, 127).astype(np.int8)
+
+    def _scores(self, query_vector: np.ndarray) -> np.ndarray:
+        if self.quantizer != "int8":
+            return self.vectors @ query_vector
+        # codes / scales ≈ vectors, so fold the scales into the query instead of decoding rows
+        return self.vectors.astype(np.float32) @ (query_vector / self.scales)
+
+    def _decode_row(self, idx: int) -> np.ndarray:
+        if self.quantizer != "int8":
+            return self.vectors[idx]
+        return self._normalize(self.vectors[idx] / self.scales).astype(np.float32)
+
+    async def insert_articles_batch(
+        self,
+        articles: list[dict[str, Any]],
+        batch_size: int = 10,
+    ) -> list[str]:
+        """Embed articles and append them to the store."""
+        if not articles:
+            return []
+
+        embeddings = await self.embedder.embed_articles_batch(articles, batch_size=batch_size)
+        batch = self._normalize(np.asarray(embeddings, dtype=np.float32))
+        self.vectors = np.vstack([self.vectors, self._encode(batch)])
+
+        vector_ids = [str(uuid7()) for _ in articles]
+        self.vector_ids.extend(vector_ids)
+        self.article_ids.extend(a.get("article_id", "") for a in articles)
+        self.titles.extend(a.get("title", "") for a in articles)
+        self.summaries.extend(a.get("summary", "") for a in articles)
+        self.metadata.extend(a.get("metadata", {}) for a in articles)
+        self.source_types = np.concatenate(
+            [
+                self.source_types,
+                np.array([a.get("source_type", "paper") for a in articles], dtype=object),
+            ]
+        )
+        self.categories = np.concatenate(
+            [self.categories, np.array([a.get("category", "AI") for a in articles], dtype=object)]
+        )
+        self.importance_scores = np.concatenate(
+            [
+                self.importance_scores,
+                np.array([a.get("importance_score", 0.5) for a in articles], dtype=np.float64),
+            ]
+        )
+        return vector_ids
+
+    def _row(self, idx: int, score: float) -> dict[str, Any]:
+        return {
+            "vector_id": self.vector_ids[idx],
+            "article_id": self.article_ids[idx],
+            "title": self.titles[idx],
+            "summary": self.summaries[idx],
+            "source_type": self.source_types[idx],
+            "category": self.categories[idx],
+            "importance_score": float(self.importance_scores[idx]),
+            "metadata": self.metadata[idx],
+            "score": score,
+        }
+
+    def _search_vector(
+        self,
+        query_vector: np.ndarray,
+        limit: int,
+        score_threshold: float,
+        source_type: list[str] | None = None,
+        category: list[str] | None = None,
+        min_importance_score: float | None = None,
+        exclude_rows: list[int] | None = None,
+    ) -> list[dict[str, Any]]:
+        if len(self.vectors) == 0 or limit <= 0:
+            return []
+
+        scores = self._scores(query_vector)
+
+        mask = scores >= score_threshold - self.score_tolerance
+        if source_type:
+            mask &= np.isin(self.source_types, source_type)
+        if category:
+            mask &= np.isin(self.categories, category)
+        if min_importance_score is not None:
+            mask &= self.importance_scores >= min_importance_score
+        if exclude_rows:
+            mask[exclude_rows] = False
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(-scores[candidates])]
+
+        return [self._row(idx, float(scores[idx])) for idx in candidates]
+
+    async def search_similar_articles(
+        self,
+        query: str,
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        source_type: list[str] | None = None,
+        category: list[str] | None = None,
+        min_importance_score: float | None = None,
+        exclude_vector_ids: list[str] | None = None,
+        **_: Any,
+    ) -> list[dict[str, Any]]:
+        """Search for articles similar to a query string."""
+        query_vector = self._normalize(np.asarray(await self.embedder.embed(query), dtype=np.float32))
+        excluded = set(exclude_vector_ids or ())
+        return self._search_vector(
+            query_vector,
+            limit=limit,
+            score_threshold=score_threshold,
+            source_type=source_type,
+            category=category,
+            min_importance_score=min_importance_score,
+            exclude_rows=[i for i, vid in enumerate(self.vector_ids) if vid in excluded],
+        )
+
+    async def search_grouped(
+        self,
+        query: str,
+        group_by: str = "source_type",
+        limit_per_group: int = 3,
+        limit_groups: int = 10,
+        score_threshold: float = 0.7,
+        source_type: list[str] | None = None,
+        category: list[str] | None = None,
+        min_importance_score: float | None = None,
+        **_: Any,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Top hits per ``group_by`` value, best group first (like ``query_points_groups``)."""
+        query_vector = self._normalize(np.asarray(await self.embedder.embed(query), dtype=np.float32))
+        hits = self._search_vector(
+            query_vector,
+            limit=len(self.vectors),
+            score_threshold=score_threshold,
+            source_type=source_type,
+            category=category,
+            min_importance_score=min_importance_score,
+        )
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for hit in hits:
+            group = groups.setdefault(str(hit[group_by]), [])
+            if len(group) < limit_per_group:
+                group.append(hit)
+        return dict(list(groups.items())[:limit_groups])
+
+    async def find_similar_articles(
+        self,
+        article_id: str | None = None,
+        vector_id: str | None = None,
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        source_type: list[str] | None = None,
+        category: list[str] | None = None,
+        **_: Any,
+    ) -> list[dict[str, Any]]:
+        """Find articles similar to a stored article, excluding the article itself."""
+        ids = self.vector_ids if vector_id else self.article_ids
+        try:
+            ref = ids.index(vector_id or article_id)
+        except ValueError:
+            return []
+
+        return self._search_vector(
+            self._decode_row(ref),
+            limit=limit,
+            score_threshold=score_threshold,
+            source_type=source_type,
+            category=category,
+            exclude_rows=[ref],
+        )
@@ -0,0 +1,367 @@
+"""Shared pytest fixtures.
+
+Expensive resources (Qdrant client, embedder) are created once per test
+session and reused by every test module. API tests talk to the FastAPI app
+in-process through ``aclient``, an ``httpx.AsyncClient`` on ``ASGITransport``.
+
+Set ``USE_FAISS_STUB=1`` to run the semantic search tests against an
+in-process FAISS index instead of a Qdrant server, and
+``TEST_EMBEDDING_PROVIDER=minilm`` to embed with a local 384-dim
+``all-MiniLM-L6-v2`` model instead of the OpenAI embedding API.
+
+Qdrant runs embedded in-process (``QDRANT_LOCATION=:memory:``) unless
+``QDRANT_LOCATION`` is already set; set it to an empty string to test against
+the Qdrant server configured by ``QDRANT_HOST``/``QDRANT_PORT``.
+
+Async tests and fixtures share one session-wide event loop, running on
+``uvloop`` when it is installed (see tests/_event_loop.py).
+
+Host names are resolved once per session (``socket.getaddrinfo`` is memoized).
+
+Email templates are compiled once into an on-disk Jinja bytecode cache in the
+system temp directory and reused by later builders, workers and runs.
+
+Tests marked ``integration`` call real external APIs and are skipped unless
+``RUN_INTEGRATION=1``; in that mode ``fake_llm`` also stands down so the API
+tests exercise the real providers.
+"""
+
+import asyncio
+import functools
+import importlib
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Must be set before app settings are first loaded
+os.environ.setdefault("QDRANT_LOCATION", ":memory:")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+import pytest_asyncio  # noqa: E402
+from _embed_cache import load_embedding, store_embedding
+from _event_loop import LOOP_NAME, new_event_loop
+from fakes import FakeLLMClient, fake_embedding, get_fake_encoding, get_fake_llm_client
+from filelock import FileLock
+from jinja2 import FileSystemBytecodeCache
+
+from app.api.main import app
+from app.core.config import settings
+from app.processors.embedder import TextEmbedder
+from app.vector_db import VectorOperations, get_qdrant_client, initialize_vector_db
+
+MINILM_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+USE_MINILM = os.getenv("TEST_EMBEDDING_PROVIDER") == "minilm"
+RUN_INTEGRATION = os.getenv("RUN_INTEGRATION") == "1"
+USE_FAISS_STUB = os.getenv("USE_FAISS_STUB") == "1"
+
+# Serializes collection recreation across pytest-xdist workers
+VECTOR_DB_LOCK = Path(tempfile.gettempdir()) / "research-curator-vdb.lock"
+
+# Compiled email templates, shared by pytest-xdist workers and reused across runs
+JINJA_BYTECODE_CACHE_DIR = Path(tempfile.gettempdir()) / "research-curator-jinja-bcc"
+
+
+def import_variants(module: str, attr: str | None = None) -> list[Any]:
+    """Return ``module`` (or its ``attr``) from every import path that is loadable.
+
+    Parts of the tree import ``src.app.*`` while others import ``app.*``, which
+    gives two distinct module objects; patches must be applied to both.
+    """
+    objects = []
+    for name in (module, f"src.{module}"):
+        try:
+            obj = importlib.import_module(name)
+            if attr is not None:
+                obj = getattr(obj, attr)
+        except ImportError:
+            continue
+        if all(obj is not seen for seen in objects):
+            objects.append(obj)
+    return objects
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run every async test on the same loop type (uvloop when installed)."""
+    return {LOOP_NAME: new_event_loop}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``integration``-marked tests unless RUN_INTEGRATION=1."""
+    if RUN_INTEGRATION:
+        return
+    skip_integration = pytest.mark.skip(reason="Integration test (set RUN_INTEGRATION=1 to run)")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+def recreate_vector_db() -> bool:
+    """Recreate the Qdrant collection, one worker at a time under pytest-xdist."""
+    with FileLock(VECTOR_DB_LOCK):
+        init_success = initialize_vector_db(recreate=True)
+    assert init_success, "Failed to initialize vector database"
+    return init_success
+
+
+@pytest.fixture(scope="session", autouse=True)
+def embedding_dim():
+    """Dimension of the embeddings produced by the active test embedding backend.
+
+    With ``TEST_EMBEDDING_PROVIDER=minilm`` the model is loaded once per
+    session, ``TextEmbedder`` is patched to encode locally, and
+    ``QDRANT_VECTOR_SIZE`` is switched to the model's dimension so the
+    collection schema follows.
+    """
+    if not USE_MINILM:
+        yield settings.QDRANT_VECTOR_SIZE
+        return
+
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(MINILM_MODEL)
+    dimension = model.get_sentence_embedding_dimension()
+
+    async def minilm_embed_with_retry(self, text: str) -> list[float]:
+        vector = await asyncio.to_thread(model.encode, text, normalize_embeddings=True)
+        return vector.tolist()
+
+    async def minilm_embed_many_with_retry(self, texts: list[str]) -> list[list[float]]:
+        vectors = await asyncio.to_thread(model.encode, texts, normalize_embeddings=True)
+        return vectors.tolist()
+
+    monkeypatch = pytest.MonkeyPatch()
+    for embedder_cls in import_variants("app.processors.embedder", "TextEmbedder"):
+        monkeypatch.setattr(embedder_cls, "_embed_with_retry", minilm_embed_with_retry)
+        monkeypatch.setattr(embedder_cls, "_embed_many_with_retry", minilm_embed_many_with_retry)
+    for config in import_variants("app.core.config", "settings"):
+        monkeypatch.setattr(config, "QDRANT_VECTOR_SIZE", dimension)
+    yield dimension
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def disk_embedding_cache(embedding_dim):
+    """Serve embeddings from tests/.embedding_cache/ before calling the API.
+
+    Patches ``TextEmbedder._embed_with_retry`` and ``_embed_many_with_retry``
+    so every embedding code path (``embed``, ``batch_embed``, ``embed_many``,
+    ``embed_article``) goes through the cache; a batched request only sends
+    the texts missing from it. Skipped for the local MiniLM backend, which is
+    cheap to recompute.
+    """
+    if USE_MINILM:
+        yield
+        return
+
+    def disk_cached(original):
+        async def cached_embed_with_retry(self, text: str) -> list[float]:
+            embedding = load_embedding(text, self.model)
+            if embedding is None:
+                embedding = await original(self, text)
+                store_embedding(text, self.model, embedding)
+            return embedding
+
+        return cached_embed_with_retry
+
+    def disk_cached_many(original):
+        async def cached_embed_many_with_retry(self, texts: list[str]) -> list[list[float]]:
+            embeddings = [load_embedding(text, self.model) for text in texts]
+            missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            if missing:
+                fetched = await original(self, [texts[i] for i in missing])
+                for i, embedding in zip(missing, fetched, strict=True):
+                    store_embedding(texts[i], self.model, embedding)
+                    embeddings[i] = embedding
+            return embeddings
+
+        return cached_embed_many_with_retry
+
+    monkeypatch = pytest.MonkeyPatch()
+    for embedder_cls in import_variants("app.processors.embedder", "TextEmbedder"):
+        monkeypatch.setattr(
+            embedder_cls, "_embed_with_retry", disk_cached(embedder_cls._embed_with_retry)
+        )
+        monkeypatch.setattr(
+            embedder_cls,
+            "_embed_many_with_retry",
+            disk_cached_many(embedder_cls._embed_many_with_retry),
+        )
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def dns_cache():
+    """Resolve each host once per session by memoizing ``socket.getaddrinfo``.
+
+    HTTP clients (httpx, the OpenAI SDK, aiosmtplib) all resolve through it,
+    so only the first connection to a host pays for the lookup. Failed
+    lookups raise and are not cached.
+    """
+    cached_getaddrinfo = functools.lru_cache(maxsize=128)(socket.getaddrinfo)
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(socket, "getaddrinfo", cached_getaddrinfo)
+    yield cached_getaddrinfo
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def jinja_bytecode_cache():
+    """Give the shared ``EmailBuilder`` environment an on-disk Jinja bytecode cache.
+
+    Entries are keyed by template name and source checksum, so
+    ``daily_digest.html`` is compiled once and later workers or runs load
+    the cached code object; editing the template invalidates it.
+    """
+    JINJA_BYTECODE_CACHE_DIR.mkdir(exist_ok=True)
+    bytecode_cache = FileSystemBytecodeCache(str(JINJA_BYTECODE_CACHE_DIR))
+
+    monkeypatch = pytest.MonkeyPatch()
+    for builder_cls in import_variants("app.email.builder", "EmailBuilder"):
+        monkeypatch.setattr(builder_cls.env, "bytecode_cache", bytecode_cache)
+    yield bytecode_cache
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="module")
+def fake_llm():
+    """Replace LLM calls and embeddings with deterministic fakes (see tests/fakes.py).
+
+    The summarizer, evaluator, classifier and ``/api/llm`` routes get a
+    ``FakeLLMClient`` and ``TextEmbedder`` returns hash-seeded vectors,
+    bypassing the disk cache so fake vectors are never persisted. Embedders
+    created meanwhile count tokens with ``FakeEncoding`` instead of
+    downloading a tiktoken encoding, so the faked tests run offline. No-op
+    with ``RUN_INTEGRATION=1``.
+    """
+    if RUN_INTEGRATION:
+        yield
+        return
+
+    async def fake_embed_with_retry(self, text: str) -> list[float]:
+        return fake_embedding(text)
+
+    async def fake_embed_many_with_retry(self, texts: list[str]) -> list[list[float]]:
+        return [fake_embedding(text) for text in texts]
+
+    monkeypatch = pytest.MonkeyPatch()
+    for name in ("summarizer", "evaluator", "classifier"):
+        for module in import_variants(f"app.processors.{name}"):
+            monkeypatch.setattr(module, "get_llm_client", get_fake_llm_client)
+    for module in import_variants("app.api.routers.llm"):
+        monkeypatch.setattr(module, "LLMClient", FakeLLMClient)
+    for embedder_cls in import_variants("app.processors.embedder", "TextEmbedder"):
+        monkeypatch.setattr(embedder_cls, "_embed_with_retry", fake_embed_with_retry)
+        monkeypatch.setattr(embedder_cls, "_embed_many_with_retry", fake_embed_many_with_retry)
+    for module in import_variants("app.processors.embedder"):
+        monkeypatch.setattr(module, "_get_encoding", get_fake_encoding)
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="module")
+def memoized_pipeline():
+    """Reuse the LLM results of ``ProcessingPipeline._analyze`` for identical inputs.
+
+    Keyed by the pipeline settings plus the article fields (metadata
+    serialized to JSON for hashability), so API tests that post the same
+    sample article through ``/process`` and ``/batch-process`` summarize,
+    evaluate and classify it once; embeddings are already cached by the
+    embedder. Failures are not cached.
+    """
+    results: dict[tuple, Any] = {}
+
+    def memoized(original):
+        async def analyze(
+            self,
+            title: str,
+            content: str,
+            url: str,
+            source_name: str,
+            metadata: dict[str, Any],
+        ):
+            key = (
+                self.provider,
+                self.model,
+                self.summary_language,
+                self.summary_length,
+                title,
+                content,
+                url,
+                source_name,
+                json.dumps(metadata, sort_keys=True, default=str),
+            )
+            if key not in results:
+                results[key] = await original(self, title, content, url, source_name, metadata)
+            return results[key]
+
+        return analyze
+
+    monkeypatch = pytest.MonkeyPatch()
+    for pipeline_cls in import_variants("app.processors.pipeline", "ProcessingPipeline"):
+        monkeypatch.setattr(pipeline_cls, "_analyze", memoized(pipeline_cls._analyze))
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session")
+def test_articles():
+    """Semantic search test articles, loaded once from tests/data/test_articles.parquet."""
+    from _build_fixtures import load_test_articles
+
+    return load_test_articles()
+
+
+@pytest_asyncio.fixture
+async def aclient():
+    """Async HTTP client that sends requests straight into the ASGI app (no server, no threads)."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def qdrant_client():
+    """Shared Qdrant client wrapper."""
+    return get_qdrant_client()
+
+
+@pytest.fixture(scope="session")
+def embedder():
+    """Shared text embedder with caching enabled."""
+    return TextEmbedder(use_cache=True)
+
+
+@pytest.fixture(scope="session")
+def vector_ops(qdrant_client, embedder):
+    """Shared vector operations bound to the session client and embedder."""
+    return VectorOperations(qdrant_client=qdrant_client, embedder=embedder)
+
+
+@pytest.fixture
+def fresh_collection(qdrant_client):
+    """Recreate an empty collection for tests that need a clean state."""
+    return recreate_vector_db()
+
+
+@pytest.fixture(params=["fp32", "int8"] if USE_FAISS_STUB else ["qdrant"])
+def search_ops(request, embedder, vector_ops):
+    """Empty vector store for semantic search tests.
+
+    Uses the in-process FAISS backend when ``USE_FAISS_STUB=1``, run once with
+    float32 vectors and once int8-quantized so both precision levels pass the
+    same assertions. Otherwise recreates the Qdrant collection and returns the
+    shared ``vector_ops``.
+    """
+    if USE_FAISS_STUB:
+        from _faiss_backend import FAISSVectorOperations
+
+        return FAISSVectorOperations(embedder, quantizer=request.param)
+
+    recreate_vector_db()
+    return vector_ops
@@ -0,0 +1,112 @@
+"""Deterministic stand-ins for the LLM client used by API tests.
+
+The fakes only need to produce well-formed output of the right shape: plain
+text for summaries, JSON for evaluation and classification, embedding
+vectors derived from a hash of the input text (same text, same vector), and
+an offline tokenizer so ``TextEmbedder`` never downloads a tiktoken encoding.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+import numpy as np
+
+from app.core.config import settings
+
+FAKE_SUMMARY = (
+    "Transformer 아키텍처는 순환 구조 없이 어텐션 메커니즘만으로 시퀀스를 처리하는 모델로, "
+    "번역 품질과 학습 병렬성을 모두 개선했습니다."
+)
+
+FAKE_EVALUATION = {
+    "innovation": 0.9,
+    "relevance": 0.8,
+    "impact": 0.85,
+    "timeliness": 0.7,
+    "reasoning": "Deterministic test evaluation",
+}
+
+FAKE_CLASSIFICATION = {
+    "category": "paper",
+    "confidence": 0.9,
+    "keywords": ["transformer", "attention", "language model"],
+    "research_field": "Natural Language Processing",
+    "sub_fields": ["Machine Translation"],
+    "reasoning": "Deterministic test classification",
+}
+
+
+def fake_embedding(text: str, dimension: int | None = None) -> list[float]:
+    """Return a unit-length pseudo-random vector seeded by BLAKE2b(text)."""
+    seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+    vector = np.random.default_rng(seed).standard_normal(dimension or settings.QDRANT_VECTOR_SIZE)
+    vector /= np.linalg.norm(vector)
+    return vector.tolist()
+
+
+class FakeEncoding:
+    """Offline stand-in for ``tiktoken.Encoding``: one token per 4 characters."""
+
+    CHARS_PER_TOKEN = 4
+
+    def encode(self, text: str) -> list[str]:
+        step = self.CHARS_PER_TOKEN
+        return [text[i : i + step] for i in range(0, len(text), step)]
+
+    def encode_batch(self, texts: list[str], num_threads: int = 1) -> list[list[str]]:
+        return [self.encode(text) for text in texts]
+
+    def decode(self, tokens: list[str]) -> str:
+        return "".join(tokens)
+
+
+def get_fake_encoding(model: str) -> FakeEncoding:
+    """Factory with the same signature as ``app.processors.embedder._get_encoding``."""
+    return FakeEncoding()
+
+
+class FakeLLMClient:
+    """Drop-in replacement for ``LLMClient`` that never calls an external API."""
+
+    def __init__(self, provider: str = "openai", model: str | None = None, **_: Any):
+        self.provider = provider
+        self.model = model or "fake-model"
+
+    def chat_completion(
+        self,
+        messages: list[dict[str, str]],
+        response_format: str = "text",
+        **_: Any,
+    ) -> str:
+        if response_format != "json":
+            return FAKE_SUMMARY
+
+        # Classification prompts ask for a "category" field; everything else is an evaluation
+        prompt = "\n".join(m.get("content", "") for m in messages)
+        response = FAKE_CLASSIFICATION if '"category"' in prompt else FAKE_EVALUATION
+        return json.dumps(response, ensure_ascii=False)
+
+    async def achat_completion(
+        self,
+        messages: list[dict[str, str]],
+        response_format: str = "text",
+        **kwargs: Any,
+    ) -> str:
+        return self.chat_completion(messages, response_format=response_format, **kwargs)
+
+    def generate_embedding(self, text: str, model: str | None = None) -> list[float]:
+        return fake_embedding(text)
+
+    async def agenerate_embedding(self, text: str, model: str | None = None) -> list[float]:
+        return fake_embedding(text)
+
+    async def agenerate_embeddings(
+        self, texts: list[str], model: str | None = None
+    ) -> list[list[float]]:
+        return [fake_embedding(text) for text in texts]
+
+
+def get_fake_llm_client(provider: str = "openai", model: str | None = None) -> FakeLLMClient:
+    """Factory with the same signature as ``app.llm.client.get_llm_client``."""
+    return FakeLLMClient(provider=provider, model=model)
@@ -0,0 +1,91 @@
+"""
+LLM API 인프로세스 테스트
+
+/api/llm 엔드포인트의 요청/응답 스키마를 백엔드 서버나 실제 LLM 없이 검증합니다.
+실제 provider 호출은 tests/test_llm_api.py (RUN_INTEGRATION=1)에서 다룹니다.
+"""
+
+import json
+
+import pytest
+from fakes import fake_embedding
+
+# ASGITransport 기반 비동기 클라이언트(aclient)로 앱을 직접 호출, 결정적 fake LLM 사용
+pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("fake_llm")]
+
+EMBEDDING_TEXTS = [
+    "Transformer architecture in deep learning",
+    "Attention mechanism for neural networks",
+    "Reinforcement learning for robotics",
+]
+
+
+class TestChatCompletionEndpoint:
+    """채팅 완성 API 테스트"""
+
+    async def test_json_response_format(self, aclient):
+        """JSON 응답 포맷"""
+        response = await aclient.post(
+            "/api/llm/chat/completions",
+            json={
+                "provider": "openai",
+                "messages": [
+                    {"role": "user", "content": 'Classify this title as JSON with a "category" field.'}
+                ],
+                "response_format": "json",
+            },
+        )
+
+        assert response.status_code == 200
+        result = response.json()
+        assert result["provider"] == "openai"
+
+        data = json.loads(result["content"])
+        assert "category" in data
+        assert isinstance(data["keywords"], list)
+
+    async def test_invalid_provider(self, aclient):
+        """지원하지 않는 provider"""
+        response = await aclient.post(
+            "/api/llm/chat/completions",
+            json={"provider": "invalid", "messages": [{"role": "user", "content": "Hello"}]},
+        )
+
+        assert response.status_code == 422
+
+    async def test_max_tokens_out_of_range(self, aclient):
+        """max_tokens 범위 초과"""
+        response = await aclient.post(
+            "/api/llm/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hello"}], "max_tokens": 100000},
+        )
+
+        assert response.status_code == 422
+
+
+class TestEmbeddingEndpoints:
+    """임베딩 API 테스트"""
+
+    async def test_embedding(self, aclient, embedding_dim):
+        """단일 임베딩 생성"""
+        response = await aclient.post("/api/llm/embeddings", json={"text": EMBEDDING_TEXTS[0]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dimension"] == embedding_dim
+        assert data["embedding"] == fake_embedding(EMBEDDING_TEXTS[0])
+
+    async def test_batch_embeddings_in_input_order(self, aclient, embedding_dim):
+        """배치 임베딩은 입력 순서대로 반환"""
+        response = await aclient.post("/api/llm/embeddings/batch", json={"texts": EMBEDDING_TEXTS})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dimension"] == embedding_dim
+        assert data["embeddings"] == [fake_embedding(text) for text in EMBEDDING_TEXTS]
+
+    async def test_batch_embeddings_empty_list(self, aclient):
+        """빈 배치는 검증 오류"""
+        response = await aclient.post("/api/llm/embeddings/batch", json={"texts": []})
+
+        assert response.status_code == 422
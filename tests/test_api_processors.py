@@ -7,12 +7,24 @@ Step 11: API 엔드포인트 통합 테스트
 - End-to-end 워크플로우 테스트
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
 
-from src.app.api.main import app
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
-client = TestClient(app)
+
+# ASGITransport 기반 비동기 클라이언트(aclient)로 앱을 직접 호출
+# 결정적 fake LLM/임베딩 사용 + 동일한 입력의 /process 결과 재사용
+pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("fake_llm", "memoized_pipeline")]
 
 # 샘플 데이터
 SAMPLE_ARTICLE = {
@@ -23,20 +35,35 @@ SAMPLE_ARTICLE = {
 
 SAMPLE_METADATA = {"year": 2017, "citations": 50000}
 
+# 공유 요청 본문은 모듈 로드 시 한 번만 직렬화해서 재사용
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+_SUMMARIZE_KO_BODY = _dumps({**SAMPLE_ARTICLE, "language": "ko", "length": "medium"})
+_SUMMARIZE_EN_BODY = _dumps({**SAMPLE_ARTICLE, "language": "en", "length": "short"})
+_EVALUATE_BODY = _dumps({**SAMPLE_ARTICLE, "metadata": SAMPLE_METADATA})
+_EVALUATE_NO_METADATA_BODY = _dumps(SAMPLE_ARTICLE)
+_CLASSIFY_BODY = _dumps(
+    {**SAMPLE_ARTICLE, "source_name": "arXiv", "url": "https://arxiv.org/abs/1706.03762"}
+)
+_PROCESS_BODY = _dumps(
+    {
+        **SAMPLE_ARTICLE,
+        "url": "https://arxiv.org/abs/1706.03762",
+        "source_name": "arXiv",
+        "metadata": SAMPLE_METADATA,
+        "summary_language": "ko",
+        "summary_length": "medium",
+    }
+)
+
 
 class TestSummarizeEndpoint:
     """요약 생성 API 테스트"""
 
-    def test_summarize_success(self):
+    async def test_summarize_success(self, aclient):
         """정상적인 요약 생성"""
-        response = client.post(
-            "/api/processors/summarize",
-            json={
-                "title": SAMPLE_ARTICLE["title"],
-                "content": SAMPLE_ARTICLE["content"],
-                "language": "ko",
-                "length": "medium",
-            },
+        response = await aclient.post(
+            "/api/processors/summarize", content=_SUMMARIZE_KO_BODY, headers=JSON_HEADERS
         )
 
         assert response.status_code == 200
@@ -49,16 +76,10 @@ class TestSummarizeEndpoint:
         assert data["length"] == "medium"
         assert len(data["summary"]) > 0
 
-    def test_summarize_english(self):
+    async def test_summarize_english(self, aclient):
         """영어 요약 생성"""
-        response = client.post(
-            "/api/processors/summarize",
-            json={
-                "title": SAMPLE_ARTICLE["title"],
-                "content": SAMPLE_ARTICLE["content"],
-                "language": "en",
-                "length": "short",
-            },
+        response = await aclient.post(
+            "/api/processors/summarize", content=_SUMMARIZE_EN_BODY, headers=JSON_HEADERS
         )
 
         assert response.status_code == 200
@@ -66,9 +87,9 @@ class TestSummarizeEndpoint:
         assert data["language"] == "en"
         assert data["length"] == "short"
 
-    def test_summarize_missing_fields(self):
+    async def test_summarize_missing_fields(self, aclient):
         """필수 필드 누락 시 에러"""
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/summarize",
             json={"title": "Test"},
         )
@@ -79,15 +100,10 @@ class TestSummarizeEndpoint:
 class TestEvaluateEndpoint:
     """중요도 평가 API 테스트"""
 
-    def test_evaluate_success(self):
+    async def test_evaluate_success(self, aclient):
         """정상적인 중요도 평가"""
-        response = client.post(
-            "/api/processors/evaluate",
-            json={
-                "title": SAMPLE_ARTICLE["title"],
-                "content": SAMPLE_ARTICLE["content"],
-                "metadata": SAMPLE_METADATA,
-            },
+        response = await aclient.post(
+            "/api/processors/evaluate", content=_EVALUATE_BODY, headers=JSON_HEADERS
         )
 
         assert response.status_code == 200
@@ -114,14 +130,10 @@ class TestEvaluateEndpoint:
         ]:
             assert 0.0 <= data[key] <= 1.0, f"{key} out of range: {data[key]}"
 
-    def test_evaluate_without_metadata(self):
+    async def test_evaluate_without_metadata(self, aclient):
         """메타데이터 없이 평가"""
-        response = client.post(
-            "/api/processors/evaluate",
-            json={
-                "title": SAMPLE_ARTICLE["title"],
-                "content": SAMPLE_ARTICLE["content"],
-            },
+        response = await aclient.post(
+            "/api/processors/evaluate", content=_EVALUATE_NO_METADATA_BODY, headers=JSON_HEADERS
         )
 
         assert response.status_code == 200
@@ -132,16 +144,10 @@ class TestEvaluateEndpoint:
 class TestClassifyEndpoint:
     """카테고리 분류 API 테스트"""
 
-    def test_classify_success(self):
+    async def test_classify_success(self, aclient):
         """정상적인 카테고리 분류"""
-        response = client.post(
-            "/api/processors/classify",
-            json={
-                "title": SAMPLE_ARTICLE["title"],
-                "content": SAMPLE_ARTICLE["content"],
-                "source_name": "arXiv",
-                "url": "https://arxiv.org/abs/1706.03762",
-            },
+        response = await aclient.post(
+            "/api/processors/classify", content=_CLASSIFY_BODY, headers=JSON_HEADERS
         )
 
         assert response.status_code == 200
@@ -164,9 +170,9 @@ class TestClassifyEndpoint:
         assert isinstance(data["keywords"], list)
         assert len(data["keywords"]) > 0
 
-    def test_classify_minimal_input(self):
+    async def test_classify_minimal_input(self, aclient):
         """최소 입력으로 분류"""
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/classify",
             json={
                 "title": "Test Title",
@@ -182,19 +188,10 @@ class TestClassifyEndpoint:
 class TestProcessEndpoint:
     """전체 처리 파이프라인 API 테스트"""
 
-    def test_process_success(self):
+    async def test_process_success(self, aclient, embedding_dim):
         """정상적인 전체 처리"""
-        response = client.post(
-            "/api/processors/process",
-            json={
-                "title": SAMPLE_ARTICLE["title"],
-                "content": SAMPLE_ARTICLE["content"],
-                "url": "https://arxiv.org/abs/1706.03762",
-                "source_name": "arXiv",
-                "metadata": SAMPLE_METADATA,
-                "summary_language": "ko",
-                "summary_length": "medium",
-            },
+        response = await aclient.post(
+            "/api/processors/process", content=_PROCESS_BODY, headers=JSON_HEADERS
         )
 
         assert response.status_code == 200
@@ -224,7 +221,7 @@ class TestProcessEndpoint:
         # 임베딩 검증
         assert "embedding" in data
         assert isinstance(data["embedding"], list)
-        assert len(data["embedding"]) == 1536  # OpenAI embedding dimension
+        assert len(data["embedding"]) == embedding_dim
 
         # 상세 평가
         assert "innovation_score" in data
@@ -236,9 +233,9 @@ class TestProcessEndpoint:
         assert "metadata" in data
         assert "processed_at" in data
 
-    def test_process_minimal_input(self):
+    async def test_process_minimal_input(self, aclient):
         """최소 입력으로 처리"""
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/process",
             json={
                 "title": "Test Article",
@@ -256,9 +253,9 @@ class TestProcessEndpoint:
 class TestBatchProcessEndpoint:
     """배치 처리 API 테스트"""
 
-    def test_batch_process_success(self):
+    async def test_batch_process_success(self, aclient):
         """정상적인 배치 처리"""
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/batch-process",
             json={
                 "articles": [
@@ -302,9 +299,9 @@ class TestBatchProcessEndpoint:
             assert "category" in result
             assert "embedding" in result
 
-    def test_batch_process_single_article(self):
+    async def test_batch_process_single_article(self, aclient):
         """단일 아티클 배치 처리"""
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/batch-process",
             json={
                 "articles": [
@@ -323,9 +320,9 @@ class TestBatchProcessEndpoint:
         assert data["total"] == 1
         assert data["success"] == 1
 
-    def test_batch_process_empty_list(self):
+    async def test_batch_process_empty_list(self, aclient):
         """빈 리스트로 배치 처리"""
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/batch-process",
             json={
                 "articles": [],
@@ -342,10 +339,10 @@ class TestBatchProcessEndpoint:
 class TestStatisticsEndpoint:
     """통계 API 테스트"""
 
-    def test_statistics_success(self):
+    async def test_statistics_success(self, aclient):
         """정상적인 통계 계산"""
         # 먼저 배치 처리로 데이터 생성
-        batch_response = client.post(
+        batch_response = await aclient.post(
             "/api/processors/batch-process",
             json={
                 "articles": [
@@ -361,7 +358,7 @@ class TestStatisticsEndpoint:
         articles = batch_response.json()["results"]
 
         # 통계 계산
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/statistics",
             json=articles,
         )
@@ -379,9 +376,9 @@ class TestStatisticsEndpoint:
         assert data["total"] == 2
         assert isinstance(data["category_distribution"], dict)
 
-    def test_statistics_empty_list(self):
+    async def test_statistics_empty_list(self, aclient):
         """빈 리스트 통계"""
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/statistics",
             json=[],
         )
@@ -394,19 +391,33 @@ class TestStatisticsEndpoint:
 class TestEndToEndWorkflow:
     """End-to-End 워크플로우 테스트"""
 
-    def test_full_workflow(self):
+    async def test_full_workflow(self, aclient, embedding_dim):
         """전체 워크플로우: 수집 → 처리 → 통계"""
 
-        # Step 1: 단일 아티클 처리
-        process_response = client.post(
-            "/api/processors/process",
-            json={
-                "title": "GPT-4 Technical Report",
-                "content": "GPT-4 is a large multimodal model capable of processing images and text.",
-                "url": "https://openai.com/research/gpt-4",
-                "source_name": "OpenAI",
-                "metadata": {"year": 2023, "citations": 5000},
-            },
+        # Step 1 + 5: 단일 아티클 처리와 배치 처리는 서로 독립적이므로 동시에 요청
+        process_response, batch_response = await asyncio.gather(
+            aclient.post(
+                "/api/processors/process",
+                json={
+                    "title": "GPT-4 Technical Report",
+                    "content": "GPT-4 is a large multimodal model "
+                    "capable of processing images and text.",
+                    "url": "https://openai.com/research/gpt-4",
+                    "source_name": "OpenAI",
+                    "metadata": {"year": 2023, "citations": 5000},
+                },
+            ),
+            aclient.post(
+                "/api/processors/batch-process",
+                json={
+                    "articles": [
+                        {"title": "Article 1", "content": "Content 1"},
+                        {"title": "Article 2", "content": "Content 2"},
+                    ],
+                    "max_concurrent": 2,
+                },
+                timeout=60.0,
+            ),
         )
 
         assert process_response.status_code == 200
@@ -421,28 +432,16 @@ class TestEndToEndWorkflow:
         assert "GPT" in " ".join(article["keywords"]) or "model" in " ".join(article["keywords"])
 
         # Step 4: 임베딩 검증
-        assert len(article["embedding"]) == 1536
-
-        # Step 5: 배치 처리
-        batch_response = client.post(
-            "/api/processors/batch-process",
-            json={
-                "articles": [
-                    {"title": "Article 1", "content": "Content 1"},
-                    {"title": "Article 2", "content": "Content 2"},
-                ],
-                "max_concurrent": 2,
-            },
-            timeout=60.0,
-        )
+        assert len(article["embedding"]) == embedding_dim
 
+        # Step 5: 배치 처리 결과 검증
         assert batch_response.status_code == 200
         batch_data = batch_response.json()
         assert batch_data["success"] == 2
 
         # Step 6: 통계 계산
         all_articles = [article] + batch_data["results"]
-        stats_response = client.post(
+        stats_response = await aclient.post(
             "/api/processors/statistics",
             json=all_articles,
         )
@@ -455,10 +454,10 @@ class TestEndToEndWorkflow:
 class TestErrorHandling:
     """에러 핸들링 테스트"""
 
-    def test_invalid_language(self):
+    async def test_invalid_language(self, aclient):
         """잘못된 언어 코드"""
         # Pydantic이 기본값을 사용하므로 요청은 성공
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/summarize",
             json={
                 "title": "Test",
@@ -469,9 +468,9 @@ class TestErrorHandling:
         # 요청은 성공하지만 LLM이 처리
         assert response.status_code in [200, 500]
 
-    def test_missing_required_field(self):
+    async def test_missing_required_field(self, aclient):
         """필수 필드 누락"""
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/summarize",
             json={
                 "title": "Test",
@@ -481,55 +480,50 @@ class TestErrorHandling:
 
         assert response.status_code == 422
 
-    def test_invalid_json(self):
+    async def test_invalid_json(self, aclient):
         """잘못된 JSON"""
-        response = client.post(
+        response = await aclient.post(
             "/api/processors/summarize",
-            data="invalid json",
+            content="invalid json",
             headers={"Content-Type": "application/json"},
         )
 
         assert response.status_code == 422
 
-    def test_max_concurrent_validation(self):
+    async def test_max_concurrent_validation(self, aclient):
         """max_concurrent 범위 검증"""
-        # 범위 초과 (최대 10)
-        response = client.post(
-            "/api/processors/batch-process",
-            json={
-                "articles": [{"title": "Test", "content": "Test"}],
-                "max_concurrent": 20,  # 최대 10을 초과
-            },
-        )
-
-        assert response.status_code == 422
-
-        # 0 이하
-        response = client.post(
-            "/api/processors/batch-process",
-            json={
-                "articles": [{"title": "Test", "content": "Test"}],
-                "max_concurrent": 0,
-            },
+        # 범위 초과 (최대 10) / 0 이하
+        responses = await asyncio.gather(
+            *(
+                aclient.post(
+                    "/api/processors/batch-process",
+                    json={
+                        "articles": [{"title": "Test", "content": "Test"}],
+                        "max_concurrent": max_concurrent,
+                    },
+                )
+                for max_concurrent in (20, 0)
+            )
         )
 
-        assert response.status_code == 422
+        for response in responses:
+            assert response.status_code == 422
 
 
 class TestHealthCheck:
     """헬스 체크 테스트"""
 
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self, aclient):
         """루트 엔드포인트"""
-        response = client.get("/")
+        response = await aclient.get("/")
         assert response.status_code == 200
         data = response.json()
         assert "status" in data
         assert data["status"] == "running"
 
-    def test_health_endpoint(self):
+    async def test_health_endpoint(self, aclient):
         """헬스 체크 엔드포인트"""
-        response = client.get("/health")
+        response = await aclient.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
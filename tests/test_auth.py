@@ -4,17 +4,16 @@ import httpx
 
 BASE_URL = "http://localhost:8000"
 
+# Shared client: keeps the connection alive across requests (HTTP/2 when offered)
+CLIENT = httpx.Client(base_url=BASE_URL, http2=True, timeout=10.0)
+
 
 def test_magic_link():
     """Test magic link request endpoint."""
     print("\n=== Testing Magic Link Request ===")
 
     # Request magic link
-    response = httpx.post(
-        f"{BASE_URL}/auth/magic-link",
-        json={"email": "test@example.com"},
-        timeout=10.0,
-    )
+    response = CLIENT.post("/auth/magic-link", json={"email": "test@example.com"})
 
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
@@ -42,11 +41,7 @@ def test_verify_magic_link(token):
         return None
 
     # Verify magic link
-    response = httpx.get(
-        f"{BASE_URL}/auth/verify",
-        params={"token": token},
-        timeout=10.0,
-    )
+    response = CLIENT.get("/auth/verify", params={"token": token})
 
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
@@ -93,4 +88,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        CLIENT.close()
@@ -1,17 +1,21 @@
 """Tests for email builder functionality."""
 
+import json
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
 from app.db.models import CollectedArticle
+from app.email import builder as builder_module
 from app.email.builder import EmailBuilder, build_daily_digest_email
 
+TEMPLATE_PATH = Path(__file__).resolve().parents[1] / "src/app/email/templates/daily_digest.html"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_articles():
-    """Create sample articles for testing."""
+    """Create sample articles once per session (read-only; copy before mutating)."""
     return [
         CollectedArticle(
             id="1",
@@ -79,6 +83,12 @@ def sample_articles():
     ]
 
 
+@pytest.fixture(scope="module")
+def builder():
+    """One EmailBuilder per module, so its Jinja environment keeps templates compiled."""
+    return EmailBuilder()
+
+
 class TestEmailBuilder:
     """Test cases for EmailBuilder class."""
 
@@ -86,11 +96,11 @@ class TestEmailBuilder:
         """Test EmailBuilder initialization."""
         builder = EmailBuilder()
         assert builder.env is not None
-        assert "daily_digest.html" in builder.env.list_templates()
+        assert EmailBuilder().env is EmailBuilder().env
+        assert "daily_digest.html" in builder.available_templates
 
-    def test_select_top_articles(self, sample_articles):
+    def test_select_top_articles(self, builder, sample_articles):
         """Test article selection logic."""
-        builder = EmailBuilder()
 
         # Select top 3
         top_3 = builder._select_top_articles(sample_articles, 3)
@@ -107,9 +117,8 @@ class TestEmailBuilder:
         empty = builder._select_top_articles([], 5)
         assert len(empty) == 0
 
-    def test_group_by_category(self, sample_articles):
+    def test_group_by_category(self, builder, sample_articles):
         """Test article grouping by category."""
-        builder = EmailBuilder()
         papers, news, reports = builder._group_by_category(sample_articles)
 
         assert len(papers) == 2
@@ -119,39 +128,32 @@ class TestEmailBuilder:
         assert all(a.source_type == "news" for a in news)
         assert all(a.source_type == "report" for a in reports)
 
-    def test_format_article_high_importance(self, sample_articles):
-        """Test article formatting for high importance."""
-        builder = EmailBuilder()
+    @pytest.mark.parametrize(
+        ("index", "level", "stars", "label"),
+        [
+            (0, "high", "⭐⭐⭐", "높음"),
+            (4, "medium", "⭐⭐", "중간"),
+            (3, "low", "⭐", "낮음"),
+        ],
+    )
+    def test_format_article_importance(self, builder, sample_articles, index, level, stars, label):
+        """Test article formatting for each importance tier."""
+        formatted = builder._format_article(sample_articles[index])
+
+        assert formatted["importance_level"] == level
+        assert formatted["importance_stars"] == stars
+        assert formatted["importance_label"] == label
+
+    def test_format_article_paper_metadata(self, builder, sample_articles):
+        """Test article formatting of paper title, authors and citations."""
         formatted = builder._format_article(sample_articles[0])
 
         assert formatted["title"] == "Attention Is All You Need"
-        assert formatted["importance_level"] == "high"
-        assert formatted["importance_stars"] == "⭐⭐⭐"
-        assert formatted["importance_label"] == "높음"
         assert "Vaswani" in formatted["authors"]
         assert formatted["citations"] == 50000
 
-    def test_format_article_medium_importance(self, sample_articles):
-        """Test article formatting for medium importance."""
-        builder = EmailBuilder()
-        formatted = builder._format_article(sample_articles[4])
-
-        assert formatted["importance_level"] == "medium"
-        assert formatted["importance_stars"] == "⭐⭐"
-        assert formatted["importance_label"] == "중간"
-
-    def test_format_article_low_importance(self, sample_articles):
-        """Test article formatting for low importance."""
-        builder = EmailBuilder()
-        formatted = builder._format_article(sample_articles[3])
-
-        assert formatted["importance_level"] == "low"
-        assert formatted["importance_stars"] == "⭐"
-        assert formatted["importance_label"] == "낮음"
-
-    def test_format_article_summary_truncation(self):
+    def test_format_article_summary_truncation(self, builder):
         """Test summary truncation for long content."""
-        builder = EmailBuilder()
         long_article = CollectedArticle(
             id="long",
             title="Long Article",
@@ -164,30 +166,27 @@ class TestEmailBuilder:
         formatted = builder._format_article(long_article)
         assert len(formatted["summary"]) <= 200
         assert formatted["summary"].endswith("...")
+        assert formatted["summary"] == "A" * 197 + "..."
 
-    def test_format_authors_short_list(self):
+    def test_format_authors_short_list(self, builder):
         """Test author formatting for short lists."""
-        builder = EmailBuilder()
         authors = ["Author A", "Author B"]
         formatted = builder._format_authors(authors)
         assert formatted == "Author A, Author B"
 
-    def test_format_authors_long_list(self):
+    def test_format_authors_long_list(self, builder):
         """Test author formatting for long lists."""
-        builder = EmailBuilder()
         authors = ["A", "B", "C", "D", "E", "F"]
         formatted = builder._format_authors(authors)
         assert formatted == "A, B, C 외 3명"
 
-    def test_format_authors_empty(self):
+    def test_format_authors_empty(self, builder):
         """Test author formatting for empty list."""
-        builder = EmailBuilder()
         formatted = builder._format_authors([])
         assert formatted is None
 
-    def test_build_daily_digest(self, sample_articles):
+    def test_build_daily_digest(self, builder, sample_articles):
         """Test full daily digest building."""
-        builder = EmailBuilder()
         html = builder.build_daily_digest(
             user_name="테스트 사용자",
             user_email="test@example.com",
@@ -212,9 +211,8 @@ class TestEmailBuilder:
         # Low importance article should not be included (limited to 3)
         assert "Low Importance Paper" not in html
 
-    def test_build_daily_digest_empty_articles(self):
+    def test_build_daily_digest_empty_articles(self, builder):
         """Test daily digest with no articles."""
-        builder = EmailBuilder()
         html = builder.build_daily_digest(
             user_name="테스트 사용자",
             user_email="test@example.com",
@@ -225,9 +223,8 @@ class TestEmailBuilder:
         assert "테스트 사용자" in html
         assert "새로운 자료가 없습니다" in html
 
-    def test_render_template_with_context(self):
+    def test_render_template_with_context(self, builder):
         """Test template rendering with custom context."""
-        builder = EmailBuilder()
         context = {
             "service_name": "Test Service",
             "date": "2024-01-01",
@@ -248,6 +245,15 @@ class TestEmailBuilder:
         assert "john@example.com" in html
         assert "https://example.com/settings" in html
 
+    def test_stream_template_matches_render(self, builder):
+        """Test streamed template fragments join to the rendered HTML."""
+        context = {"service_name": "Test Service", "user_name": "John", "papers": []}
+
+        fragments = list(builder.stream_template("daily_digest.html", context))
+
+        assert len(fragments) > 1
+        assert "".join(fragments) == builder.render_template("daily_digest.html", context)
+
     def test_convenience_function(self, sample_articles):
         """Test the convenience function."""
         html = build_daily_digest_email(
@@ -262,12 +268,38 @@ class TestEmailBuilder:
         assert "test@test.com" in html
 
 
+def test_compiled_templates_match_source(tmp_path):
+    """Test that precompiled templates render the same HTML as the template sources."""
+    compiled_dir = builder_module.compile_templates(tmp_path / "compiled")
+    compiled_env = builder_module._build_env(compiled_dir)
+    compiled_template = compiled_env.get_template("daily_digest.html")
+    assert Path(compiled_template.filename).parent == compiled_dir
+
+    source_template = builder_module._build_env().get_template("daily_digest.html")
+
+    context = {"service_name": "Research Curator", "user_name": "Tester", "papers": [], "news": []}
+    assert compiled_template.render(context) == source_template.render(context)
+
+
+def test_stale_compiled_templates_fall_back_to_source(tmp_path):
+    """Test that compiled templates built from different sources are ignored."""
+    compiled_dir = builder_module.compile_templates(tmp_path / "compiled")
+    assert builder_module._compiled_templates_current(compiled_dir)
+
+    # Simulate editing daily_digest.html after the templates were compiled
+    checksums_path = compiled_dir / builder_module.COMPILED_CHECKSUMS_FILE
+    checksums = json.loads(checksums_path.read_text())
+    checksums["daily_digest.html"] = "0" * 64
+    checksums_path.write_text(json.dumps(checksums))
+
+    assert not builder_module._compiled_templates_current(compiled_dir)
+    template = builder_module._build_env(compiled_dir).get_template("daily_digest.html")
+    assert Path(template.filename).parent == builder_module.TEMPLATE_DIR
+
+
 def test_template_file_exists():
     """Test that the template file exists."""
-    template_path = (
-        Path(__file__).parent.parent / "src" / "app" / "email" / "templates" / "daily_digest.html"
-    )
-    assert template_path.exists(), "Template file should exist"
+    assert TEMPLATE_PATH.exists(), "Template file should exist"
 
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 """Tests for email digest orchestration."""
 
+import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
@@ -9,6 +11,30 @@ import pytest
 from app.db.models import CollectedArticle, User, UserPreference
 from app.email.digest import DigestOrchestrator, send_daily_digest
 
+# Fixed timestamp for fixtures, so they are deterministic and can be built once
+_T0 = datetime(2024, 1, 1)
+
+
+class FakeResult:
+    """Plain stand-in for a SQLAlchemy ``Result``, cheaper than a ``MagicMock``."""
+
+    def __init__(self, user: User | None = None, users: list[User] | None = None):
+        self.user = user
+        self.users = users or []
+
+    def scalar_one_or_none(self) -> User | None:
+        return self.user
+
+    def scalars(self) -> list[User]:
+        return self.users
+
+
+def mock_session(user: User | None = None, users: list[User] | None = None) -> AsyncMock:
+    """AsyncSession mock; single-user lookups return ``user`` and batch prefetches ``users``."""
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=FakeResult(user, users))
+    return session
+
 
 @pytest.fixture
 def mock_user():
@@ -17,7 +43,7 @@ def mock_user():
         id=uuid4(),
         email="test@example.com",
         name="Test User",
-        created_at=datetime.now(),
+        created_at=_T0,
     )
 
 
@@ -34,9 +60,9 @@ def mock_preferences():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_articles():
-    """Create sample articles."""
+    """Create sample articles once per session (read-only; copy before mutating)."""
     return [
         CollectedArticle(
             id=uuid4(),
@@ -45,7 +71,7 @@ def sample_articles():
             source_url=f"https://example.com/{i}",
             source_type="paper" if i % 3 == 0 else ("news" if i % 3 == 1 else "report"),
             importance_score=0.9 - (i * 0.1),
-            collected_at=datetime.now(),
+            collected_at=_T0,
         )
         for i in range(10)
     ]
@@ -57,34 +83,17 @@ class TestDigestOrchestrator:
     @pytest.mark.asyncio
     async def test_send_user_digest_success(self, mock_user, mock_preferences, sample_articles):
         """Test successful digest sending."""
-        session = AsyncMock()
+        # Mock database query: the user is loaded with its preferences joined in
+        mock_user.preference = mock_preferences
+        session = mock_session(mock_user)
         # Create mock sender
         mock_sender = AsyncMock()
         mock_sender.send_email = AsyncMock(return_value=True)
         orchestrator = DigestOrchestrator(email_sender=mock_sender)
 
-        # Mock database queries
-        async def mock_execute(stmt):
-            result = MagicMock()
-            # First call returns user, second returns preferences
-            if not hasattr(mock_execute, "call_count"):
-                mock_execute.call_count = 0
-            mock_execute.call_count += 1
-
-            if mock_execute.call_count == 1:
-                result.scalar_one_or_none.return_value = mock_user
-            else:
-                result.scalar_one_or_none.return_value = mock_preferences
-
-            return result
-
-        session.execute = mock_execute
-
         # Mock save_sent_digest
         with patch("app.email.digest.save_sent_digest", new_callable=AsyncMock) as mock_save:
-            mock_digest = MagicMock()
-            mock_digest.id = uuid4()
-            mock_save.return_value = mock_digest
+            mock_save.return_value = SimpleNamespace(id=uuid4())
 
             result = await orchestrator.send_user_digest(session, mock_user.id, sample_articles)
 
@@ -93,22 +102,16 @@ class TestDigestOrchestrator:
             assert "digest_id" in result
             assert mock_sender.send_email.called
             assert mock_save.called
+            assert session.execute.await_count == 1
 
     @pytest.mark.asyncio
     async def test_send_user_digest_user_not_found(self, sample_articles):
         """Test digest sending when user not found."""
-        session = AsyncMock()
+        session = mock_session()
         mock_sender = AsyncMock()
         orchestrator = DigestOrchestrator(email_sender=mock_sender)
 
         # Mock database to return None (user not found)
-        async def mock_execute(stmt):
-            result = MagicMock()
-            result.scalar_one_or_none.return_value = None
-            return result
-
-        session.execute = mock_execute
-
         result = await orchestrator.send_user_digest(session, uuid4(), sample_articles)
 
         assert result["success"] is False
@@ -117,26 +120,12 @@ class TestDigestOrchestrator:
     @pytest.mark.asyncio
     async def test_send_user_digest_no_preferences(self, mock_user, sample_articles):
         """Test digest sending when user has no preferences."""
-        session = AsyncMock()
+        # Mock database: user exists, no preferences joined
+        mock_user.preference = None
+        session = mock_session(mock_user)
         mock_sender = AsyncMock()
         orchestrator = DigestOrchestrator(email_sender=mock_sender)
 
-        # Mock database: user exists, no preferences
-        async def mock_execute(stmt):
-            result = MagicMock()
-            if not hasattr(mock_execute, "call_count"):
-                mock_execute.call_count = 0
-            mock_execute.call_count += 1
-
-            if mock_execute.call_count == 1:
-                result.scalar_one_or_none.return_value = mock_user
-            else:
-                result.scalar_one_or_none.return_value = None
-
-            return result
-
-        session.execute = mock_execute
-
         result = await orchestrator.send_user_digest(session, mock_user.id, sample_articles)
 
         assert result["success"] is False
@@ -145,7 +134,7 @@ class TestDigestOrchestrator:
     @pytest.mark.asyncio
     async def test_send_batch_digests_success(self, mock_user, mock_preferences, sample_articles):
         """Test successful batch digest sending."""
-        session = AsyncMock()
+        session = mock_session()
         mock_sender = AsyncMock()
         orchestrator = DigestOrchestrator(email_sender=mock_sender)
 
@@ -157,7 +146,7 @@ class TestDigestOrchestrator:
         }
 
         # Mock send_user_digest
-        async def mock_send_user_digest(sess, user_id, articles, subject=None):
+        async def mock_send_user_digest(sess, user_id, articles, subject=None, user=None):
             return {
                 "success": True,
                 "user_id": str(user_id),
@@ -180,7 +169,7 @@ class TestDigestOrchestrator:
     @pytest.mark.asyncio
     async def test_send_batch_digests_partial_failure(self, mock_user, sample_articles):
         """Test batch digest sending with some failures."""
-        session = AsyncMock()
+        session = mock_session()
         mock_sender = AsyncMock()
         orchestrator = DigestOrchestrator(email_sender=mock_sender)
 
@@ -195,7 +184,7 @@ class TestDigestOrchestrator:
 
         call_count = 0
 
-        async def mock_send_user_digest(sess, user_id, articles, subject=None):
+        async def mock_send_user_digest(sess, user_id, articles, subject=None, user=None):
             nonlocal call_count
             call_count += 1
 
@@ -228,13 +217,13 @@ class TestDigestOrchestrator:
     @pytest.mark.asyncio
     async def test_send_batch_digests_max_failures(self, sample_articles):
         """Test batch digest stops after max failures."""
-        session = AsyncMock()
+        session = mock_session()
         mock_sender = AsyncMock()
         orchestrator = DigestOrchestrator(email_sender=mock_sender)
 
         user_articles = {uuid4(): sample_articles[:2] for _ in range(10)}
 
-        async def mock_send_user_digest_fail(sess, user_id, articles, subject=None):
+        async def mock_send_user_digest_fail(sess, user_id, articles, subject=None, user=None):
             return {
                 "success": False,
                 "user_id": str(user_id),
@@ -253,24 +242,94 @@ class TestDigestOrchestrator:
             assert len(result["results"]) == 3
 
     @pytest.mark.asyncio
-    async def test_convenience_send_daily_digest(self, mock_user, mock_preferences, sample_articles):
-        """Test convenience function."""
-        session = AsyncMock()
+    async def test_send_batch_digests_prefetches_users(self, mock_preferences, sample_articles):
+        """Test batch digests load every user and preference in a single query."""
+        users = [User(id=uuid4(), email=f"user{i}@example.com", name=f"User {i}") for i in range(3)]
+        for user in users:
+            user.preference = UserPreference(user_id=user.id, daily_limit=3)
+        session = mock_session(users=users)
+        mock_sender = AsyncMock()
+        orchestrator = DigestOrchestrator(email_sender=mock_sender)
+
+        user_articles = {str(user.id): sample_articles[:3] for user in users}
+        user_articles["not-a-uuid"] = sample_articles[:3]
+
+        with patch("app.email.digest.save_sent_digest", new_callable=AsyncMock) as mock_save:
+            mock_save.return_value = SimpleNamespace(id=uuid4())
+            result = await orchestrator.send_batch_digests(session, user_articles)
 
-        async def mock_execute(stmt):
-            result = MagicMock()
-            if not hasattr(mock_execute, "call_count"):
-                mock_execute.call_count = 0
-            mock_execute.call_count += 1
+        assert session.execute.await_count == 1
+        assert result["success_count"] == 3
+        assert result["failure_count"] == 1
+        assert mock_sender.send_email.await_count == 3
+        assert {r["user_email"] for r in result["results"] if r["success"]} == {
+            user.email for user in users
+        }
 
-            if mock_execute.call_count == 1:
-                result.scalar_one_or_none.return_value = mock_user
-            else:
-                result.scalar_one_or_none.return_value = mock_preferences
+    @pytest.mark.asyncio
+    async def test_send_batch_digests_concurrency(self, sample_articles):
+        """Test batch digests run concurrently up to the limit, keeping input order."""
+        session = mock_session()
+        orchestrator = DigestOrchestrator(email_sender=AsyncMock())
+
+        user_ids = [uuid4() for _ in range(6)]
+        user_articles = dict.fromkeys(user_ids, sample_articles[:2])
+        in_flight = 0
+        peak = 0
+
+        async def mock_send_user_digest(sess, user_id, articles, subject=None, user=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"success": True, "user_id": str(user_id)}
 
-            return result
+        with patch.object(
+            orchestrator,
+            "send_user_digest",
+            side_effect=mock_send_user_digest,
+        ):
+            result = await orchestrator.send_batch_digests(session, user_articles, concurrency=3)
+
+        assert peak == 3
+        assert result["success_count"] == 6
+        assert [r["user_id"] for r in result["results"]] == [str(u) for u in user_ids]
 
-        session.execute = mock_execute
+    @pytest.mark.asyncio
+    async def test_send_batch_digests_max_failures_stops_dispatch(self, sample_articles):
+        """Test no new sends start once max failures is reached under concurrency."""
+        session = mock_session()
+        orchestrator = DigestOrchestrator(email_sender=AsyncMock())
+
+        user_articles = {uuid4(): sample_articles[:2] for _ in range(10)}
+        calls = 0
+
+        async def mock_send_user_digest_fail(sess, user_id, articles, subject=None, user=None):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"success": False, "user_id": str(user_id), "error": "Failed"}
+
+        with patch.object(
+            orchestrator,
+            "send_user_digest",
+            side_effect=mock_send_user_digest_fail,
+        ):
+            result = await orchestrator.send_batch_digests(
+                session, user_articles, max_failures=3, concurrency=2
+            )
+
+        # Two rounds of two concurrent sends; the third failure stops the workers
+        assert calls == 4
+        assert result["failure_count"] == 4
+        assert len(result["results"]) == 4
+
+    @pytest.mark.asyncio
+    async def test_convenience_send_daily_digest(self, mock_user, mock_preferences, sample_articles):
+        """Test convenience function."""
+        mock_user.preference = mock_preferences
+        session = mock_session(mock_user)
 
         with patch("app.email.digest.EmailSender") as mock_sender_class:
             mock_sender = AsyncMock()
@@ -278,9 +337,7 @@ class TestDigestOrchestrator:
             mock_sender_class.return_value = mock_sender
 
             with patch("app.email.digest.save_sent_digest", new_callable=AsyncMock) as mock_save:
-                mock_digest = MagicMock()
-                mock_digest.id = uuid4()
-                mock_save.return_value = mock_digest
+                mock_save.return_value = SimpleNamespace(id=uuid4())
 
                 result = await send_daily_digest(session, mock_user.id, sample_articles)
 
@@ -1,5 +1,6 @@
 """Tests for email sender functionality."""
 
+import asyncio
 import os
 from unittest.mock import AsyncMock, patch
 
@@ -8,6 +9,38 @@ from aiosmtplib import SMTPException
 
 from app.email.sender import EmailSender, send_batch_emails, send_email
 
+# Fields shared by every generated recipient; only the address varies
+RECIPIENT_TEMPLATE = {"subject": "Test", "html_content": "<h1>Test Email</h1>"}
+RECIPIENT_ADDRESS = "user{}@example.com".format
+
+
+def make_recipients(count: int) -> list[dict[str, str]]:
+    """Recipients user0@example.com .. user{count-1}@example.com with a shared subject and body."""
+    return [{**RECIPIENT_TEMPLATE, "to_email": RECIPIENT_ADDRESS(i)} for i in range(count)]
+
+
+@pytest.fixture(scope="class")
+def sender():
+    """EmailSender for a fake SMTP server, shared by the tests of a class (aiosmtplib is mocked)."""
+    return EmailSender(
+        smtp_host="smtp.test.com",
+        smtp_port=587,
+        smtp_user="test@test.com",
+        smtp_password="password",
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """Skip the exponential backoff between ``send_email`` retries (2-10 s per wait).
+
+    Patches the sleep of the tenacity retry policy, which every call copies, so
+    attempts are still counted but run back to back.
+    """
+    sleep = AsyncMock()
+    monkeypatch.setattr(EmailSender.send_email.retry, "sleep", sleep)
+    return sleep
+
 
 class TestEmailSender:
     """Test cases for EmailSender class."""
@@ -57,15 +90,8 @@ class TestEmailSender:
                 EmailSender()
 
     @pytest.mark.asyncio
-    async def test_send_email_success(self):
+    async def test_send_email_success(self, sender):
         """Test successful email sending."""
-        sender = EmailSender(
-            smtp_host="smtp.test.com",
-            smtp_port=587,
-            smtp_user="test@test.com",
-            smtp_password="password",
-        )
-
         with patch("app.email.sender.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
             mock_send.return_value = None
 
@@ -89,15 +115,8 @@ class TestEmailSender:
             assert call_kwargs["start_tls"] is True
 
     @pytest.mark.asyncio
-    async def test_send_email_failure(self):
+    async def test_send_email_failure(self, sender):
         """Test email sending failure."""
-        sender = EmailSender(
-            smtp_host="smtp.test.com",
-            smtp_port=587,
-            smtp_user="test@test.com",
-            smtp_password="password",
-        )
-
         with patch("app.email.sender.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
             mock_send.side_effect = SMTPException("Connection failed")
 
@@ -109,15 +128,8 @@ class TestEmailSender:
                 )
 
     @pytest.mark.asyncio
-    async def test_send_email_retry(self):
+    async def test_send_email_retry(self, sender, no_retry_backoff):
         """Test email sending with retry logic."""
-        sender = EmailSender(
-            smtp_host="smtp.test.com",
-            smtp_port=587,
-            smtp_user="test@test.com",
-            smtp_password="password",
-        )
-
         with patch("app.email.sender.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
             # Fail twice, then succeed
             mock_send.side_effect = [
@@ -134,25 +146,12 @@ class TestEmailSender:
 
             assert result is True
             assert mock_send.call_count == 3
+            assert no_retry_backoff.await_count == 2
 
     @pytest.mark.asyncio
-    async def test_send_batch_emails_success(self):
+    async def test_send_batch_emails_success(self, sender):
         """Test successful batch email sending."""
-        sender = EmailSender(
-            smtp_host="smtp.test.com",
-            smtp_port=587,
-            smtp_user="test@test.com",
-            smtp_password="password",
-        )
-
-        recipients = [
-            {
-                "to_email": f"user{i}@example.com",
-                "subject": f"Test {i}",
-                "html_content": f"<h1>Email {i}</h1>",
-            }
-            for i in range(3)
-        ]
+        recipients = make_recipients(3)
 
         with patch("app.email.sender.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
             mock_send.return_value = None
@@ -165,38 +164,16 @@ class TestEmailSender:
             assert mock_send.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_send_batch_emails_partial_failure(self):
+    async def test_send_batch_emails_partial_failure(self, sender):
         """Test batch email sending with some failures."""
-        sender = EmailSender(
-            smtp_host="smtp.test.com",
-            smtp_port=587,
-            smtp_user="test@test.com",
-            smtp_password="password",
-        )
+        recipients = make_recipients(5)
 
-        recipients = [
-            {
-                "to_email": f"user{i}@example.com",
-                "subject": f"Test {i}",
-                "html_content": f"<h1>Email {i}</h1>",
-            }
-            for i in range(5)
-        ]
+        failing = {"user1@example.com", "user3@example.com"}
 
-        call_count = 0
-
-        async def mock_send_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            # Fail on specific attempts (accounting for retries)
-            # user0: success (1 call)
-            # user1: fail 3 times (calls 2,3,4)
-            # user2: success (call 5)
-            # user3: fail 3 times (calls 6,7,8)
-            # user4: success (call 9)
-            if call_count in [2, 3, 4, 6, 7, 8]:
+        async def mock_send_side_effect(message, **kwargs):
+            # Fail every attempt (including retries) for the addresses in ``failing``
+            if message["To"] in failing:
                 raise SMTPException("Failed")
-            return None
 
         with patch("app.email.sender.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
             mock_send.side_effect = mock_send_side_effect
@@ -206,29 +183,15 @@ class TestEmailSender:
             assert result["success_count"] == 3
             assert result["failure_count"] == 2
             assert len(result["failed_emails"]) == 2
+            # 3 successful sends + 3 attempts for each of the 2 failing recipients
+            assert mock_send.call_count == 9
             # Check that user1 and user3 failed
-            failed_addresses = [f["email"] for f in result["failed_emails"]]
-            assert "user1@example.com" in failed_addresses
-            assert "user3@example.com" in failed_addresses
+            assert {f["email"] for f in result["failed_emails"]} == failing
 
     @pytest.mark.asyncio
-    async def test_send_batch_emails_max_failures(self):
+    async def test_send_batch_emails_max_failures(self, sender):
         """Test batch email sending stops after max failures."""
-        sender = EmailSender(
-            smtp_host="smtp.test.com",
-            smtp_port=587,
-            smtp_user="test@test.com",
-            smtp_password="password",
-        )
-
-        recipients = [
-            {
-                "to_email": f"user{i}@example.com",
-                "subject": f"Test {i}",
-                "html_content": f"<h1>Email {i}</h1>",
-            }
-            for i in range(10)
-        ]
+        recipients = make_recipients(10)
 
         with patch("app.email.sender.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
             # All emails fail (even after retries)
@@ -243,6 +206,61 @@ class TestEmailSender:
             # With retry logic (3 attempts per email), total calls should be 9 (3 emails × 3 retries)
             assert mock_send.call_count == 9
 
+    @pytest.mark.asyncio
+    async def test_send_batch_emails_bounded_concurrency(self, sender):
+        """Test batch email sending keeps exactly max_concurrency sends in flight."""
+        recipients = make_recipients(12)
+
+        release = asyncio.Event()
+        in_flight = 0
+        max_in_flight = 0
+
+        async def blocking_send(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await release.wait()
+            in_flight -= 1
+
+        with patch("app.email.sender.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
+            mock_send.side_effect = blocking_send
+
+            batch = asyncio.create_task(sender.send_batch_emails(recipients, max_concurrency=5))
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+            # Sends block until released, so the pool is saturated and no sixth send starts
+            assert in_flight == 5
+            release.set()
+            result = await batch
+
+            assert max_in_flight == 5
+            assert result["success_count"] == 12
+            assert mock_send.call_count == 12
+
+    @pytest.mark.asyncio
+    async def test_send_batch_emails_concurrent_throughput(self, sender):
+        """Test concurrent batch sending overlaps SMTP latency instead of adding it up."""
+        recipients = make_recipients(100)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_send(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+
+        with patch("app.email.sender.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
+            mock_send.side_effect = slow_send
+
+            result = await sender.send_batch_emails(recipients, max_concurrency=10)
+
+        assert result["success_count"] == 100
+        # Serial sending never overlaps (1 in flight); 10 workers wait out SMTP latency together
+        assert max_in_flight == 10
+
     @pytest.mark.asyncio
     async def test_convenience_send_email(self):
         """Test convenience send_email function."""
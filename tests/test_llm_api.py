@@ -1,19 +1,60 @@
-"""Test script for LLM API endpoints.
+"""Tests for the LLM API endpoints of a running backend.
 
 IMPORTANT: Backend 서버를 사전에 기동해야 합니다.
     uvicorn src.app.api.main:app --reload
+
+The tests are independent network-bound calls, so they can run in parallel:
+    RUN_INTEGRATION=1 pytest tests/test_llm_api.py -n 4
 """
 
-import json
+import os
 
 import httpx
 import numpy as np
+import pytest
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    import json
+
+    _loads = json.loads
+
+    def _pretty(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
 
 BASE_URL = "http://localhost:8000"
 LLM_BASE = f"{BASE_URL}/api/llm"
 
+HAS_ANTHROPIC_KEY = bool(os.getenv("ANTHROPIC_API_KEY"))
+
+# 실제 LLM/임베딩 API 호출 (RUN_INTEGRATION=1 일 때만 실행)
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="module")
+def client():
+    """One pooled HTTP client for every request, so connections are reused across tests.
+
+    Probes ``/health`` first with a 1 s timeout and skips the module if the
+    backend is not running, instead of every test waiting out its 30 s timeout.
+    """
+    with httpx.Client(base_url=LLM_BASE, timeout=30.0) as c:
+        try:
+            c.get(f"{BASE_URL}/health", timeout=1.0).raise_for_status()
+        except httpx.HTTPError as e:
+            pytest.skip(f"Backend not available at {BASE_URL}: {e}")
+        yield c
+
 
-def test_chat_completion_openai():
+def test_chat_completion_openai(client):
     """Test basic chat completion with OpenAI."""
     print("\n=== Testing OpenAI Chat Completion ===")
 
@@ -34,67 +75,57 @@ def test_chat_completion_openai():
         "max_tokens": 300,
     }
 
-    response = httpx.post(f"{LLM_BASE}/chat/completions", json=request_data, timeout=30.0)
+    response = client.post("/chat/completions", json=request_data)
 
     print(f"Status Code: {response.status_code}")
 
-    if response.status_code == 200:
-        result = response.json()
-        print(f"Provider: {result['provider']}")
-        print(f"Model: {result['model']}")
-        print(f"Content preview: {result['content'][:100]}...")
-
-        assert result["provider"] == "openai"
-        assert result["model"] is not None
-        assert len(result["content"]) > 0
-        print("✅ OpenAI chat completion test passed!")
-        return True
-    else:
-        print(f"❌ Failed: {response.json()}")
-        return False
+    assert response.status_code == 200, f"❌ Failed: {response.json()}"
 
+    result = response.json()
+    print(f"Provider: {result['provider']}")
+    print(f"Model: {result['model']}")
+    print(f"Content preview: {result['content'][:100]}...")
 
-def test_chat_completion_claude():
+    assert result["provider"] == "openai"
+    assert result["model"] is not None
+    assert len(result["content"]) > 0
+    print("✅ OpenAI chat completion test passed!")
+
+
+@pytest.mark.skipif(not HAS_ANTHROPIC_KEY, reason="Requires ANTHROPIC_API_KEY")
+def test_chat_completion_claude(client):
     """Test chat completion with Claude."""
     print("\n=== Testing Claude Chat Completion ===")
 
-    try:
-        request_data = {
-            "provider": "claude",
-            "messages": [
-                {
-                    "role": "user",
-                    "content": "2024년 AI 분야 키 트렌드 5가지를 알려줘.",
-                },
-            ],
-            "temperature": 0.7,
-            "max_tokens": 300,
-        }
+    request_data = {
+        "provider": "claude",
+        "messages": [
+            {
+                "role": "user",
+                "content": "2024년 AI 분야 키 트렌드 5가지를 알려줘.",
+            },
+        ],
+        "temperature": 0.7,
+        "max_tokens": 300,
+    }
 
-        response = httpx.post(f"{LLM_BASE}/chat/completions", json=request_data, timeout=30.0)
+    response = client.post("/chat/completions", json=request_data)
 
-        print(f"Status Code: {response.status_code}")
+    print(f"Status Code: {response.status_code}")
+    assert response.status_code == 200, f"❌ Failed: {response.json()}"
 
-        if response.status_code == 200:
-            result = response.json()
-            print(f"Provider: {result['provider']}")
-            print(f"Model: {result['model']}")
-            print(f"Content preview: {result['content'][:100]}...")
+    result = response.json()
+    print(f"Provider: {result['provider']}")
+    print(f"Model: {result['model']}")
+    print(f"Content preview: {result['content'][:100]}...")
 
-            assert result["provider"] == "claude"
-            assert result["model"] is not None
-            assert len(result["content"]) > 0
-            print("✅ Claude chat completion test passed!")
-            return True
-        else:
-            print(f"❌ Failed: {response.json()}")
-            return False
-    except Exception as e:
-        print(f"⚠️ Claude API not available: {e}")
-        return None
+    assert result["provider"] == "claude"
+    assert result["model"] is not None
+    assert len(result["content"]) > 0
+    print("✅ Claude chat completion test passed!")
 
 
-def test_json_response_format():
+def test_json_response_format(client):
     """Test JSON response format."""
     print("\n=== Testing JSON Response Format ===")
 
@@ -122,31 +153,28 @@ def test_json_response_format():
         "max_tokens": 300,
     }
 
-    response = httpx.post(f"{LLM_BASE}/chat/completions", json=request_data, timeout=30.0)
+    response = client.post("/chat/completions", json=request_data)
 
     print(f"Status Code: {response.status_code}")
 
-    if response.status_code == 200:
-        result = response.json()
-        content = result["content"]
-        print(f"JSON Response: {content}")
-
-        # Parse JSON to verify it's valid
-        data = json.loads(content)
-        print(f"Parsed Data: {json.dumps(data, indent=2)}")
-
-        assert "category" in data
-        assert "importance_score" in data
-        assert "keywords" in data
-        assert isinstance(data["keywords"], list)
-        print("✅ JSON response format test passed!")
-        return True
-    else:
-        print(f"❌ Failed: {response.json()}")
-        return False
+    assert response.status_code == 200, f"❌ Failed: {response.json()}"
+
+    result = response.json()
+    content = result["content"]
+    print(f"JSON Response: {content}")
+
+    # Parse JSON to verify it's valid
+    data = _loads(content)
+    print(f"Parsed Data: {_pretty(data)}")
 
+    assert "category" in data
+    assert "importance_score" in data
+    assert "keywords" in data
+    assert isinstance(data["keywords"], list)
+    print("✅ JSON response format test passed!")
 
-def test_article_summarization():
+
+def test_article_summarization(client):
     """Test Korean article summarization."""
     print("\n=== Testing Article Summarization (Korean) ===")
 
@@ -169,28 +197,25 @@ def test_article_summarization():
         "max_sentences": 4,
     }
 
-    response = httpx.post(f"{LLM_BASE}/summarize", json=request_data, timeout=30.0)
+    response = client.post("/summarize", json=request_data)
 
     print(f"Status Code: {response.status_code}")
 
-    if response.status_code == 200:
-        result = response.json()
-        print(f"Summary: {result['summary']}")
-        print(f"Original Length: {result['original_length']} characters")
-        print(f"Summary Length: {result['summary_length']} characters")
-
-        assert len(result["summary"]) > 0
-        assert result["original_length"] > 0
-        assert result["summary_length"] > 0
-        assert result["summary_length"] < result["original_length"]
-        print("✅ Article summarization test passed!")
-        return True
-    else:
-        print(f"❌ Failed: {response.json()}")
-        return False
+    assert response.status_code == 200, f"❌ Failed: {response.json()}"
 
+    result = response.json()
+    print(f"Summary: {result['summary']}")
+    print(f"Original Length: {result['original_length']} characters")
+    print(f"Summary Length: {result['summary_length']} characters")
 
-def test_embedding_generation():
+    assert len(result["summary"]) > 0
+    assert result["original_length"] > 0
+    assert result["summary_length"] > 0
+    assert result["summary_length"] < result["original_length"]
+    print("✅ Article summarization test passed!")
+
+
+def test_embedding_generation(client):
     """Test embedding generation and cosine similarity."""
     print("\n=== Testing Embedding Generation ===")
 
@@ -202,41 +227,31 @@ def test_embedding_generation():
         "Computer vision using CNNs",
     ]
 
-    embeddings = []
-    for text in texts:
-        request_data = {"text": text}
-        response = httpx.post(f"{LLM_BASE}/embeddings", json=request_data, timeout=30.0)
-
-        if response.status_code != 200:
-            print(f"❌ Failed for text: {text}")
-            print(f"Error: {response.json()}")
-            return False
-
-        result = response.json()
-        embeddings.append(result["embedding"])
+    # Embed all texts in a single round trip
+    response = client.post("/embeddings/batch", json={"texts": texts})
+    assert response.status_code == 200, f"❌ Failed: {response.json()}"
+    # Parse straight into one contiguous float32 (n, d) matrix instead of keeping lists
+    embeddings = np.asarray(response.json()["embeddings"], dtype=np.float32)
 
     print(f"Generated {len(embeddings)} embeddings")
-    print(f"Embedding dimension: {len(embeddings[0])}")
-    print(f"First embedding (first 5 values): {embeddings[0][:5]}")
+    print(f"Embedding dimension: {embeddings.shape[1]}")
+    print(f"First embedding (first 5 values): {embeddings[0, :5]}")
 
-    # Compute cosine similarities
-    def cosine_similarity(a, b):
-        return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+    # Compute all pairwise cosine similarities as one matmul over normalized rows
+    matrix = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    similarities = matrix @ matrix.T
 
     print("\nCosine Similarities:")
-    for i, text_i in enumerate(texts):
-        for j, text_j in enumerate(texts):
-            if i < j:
-                sim = cosine_similarity(embeddings[i], embeddings[j])
-                print(f"'{text_i}' vs '{text_j}': {sim:.4f}")
-
-    assert len(embeddings) == len(texts)
-    assert all(len(emb) > 0 for emb in embeddings)
+    for i, j in zip(*np.triu_indices(len(texts), k=1), strict=True):
+        print(f"'{texts[i]}' vs '{texts[j]}': {similarities[i, j]:.4f}")
+
+    assert embeddings.ndim == 2
+    assert embeddings.shape[0] == len(texts)
+    assert embeddings.shape[1] > 0
     print("✅ Embedding generation test passed!")
-    return True
 
 
-def test_temperature_comparison():
+def test_temperature_comparison(client):
     """Test different temperature values."""
     print("\n=== Testing Temperature Comparison ===")
 
@@ -259,11 +274,9 @@ def test_temperature_comparison():
             "max_tokens": 100,
         }
 
-        response = httpx.post(f"{LLM_BASE}/chat/completions", json=request_data, timeout=30.0)
+        response = client.post("/chat/completions", json=request_data)
 
-        if response.status_code != 200:
-            print(f"❌ Failed at temperature {temp}: {response.json()}")
-            return False
+        assert response.status_code == 200, f"❌ Failed at temperature {temp}: {response.json()}"
 
         result = response.json()
         results.append(result["content"])
@@ -274,10 +287,9 @@ def test_temperature_comparison():
     assert len(results) == len(temperatures)
     assert all(len(r) > 0 for r in results)
     print("✅ Temperature comparison test passed!")
-    return True
 
 
-def test_error_handling():
+def test_error_handling(client):
     """Test error handling for invalid inputs."""
     print("\n=== Testing Error Handling ===")
 
@@ -287,7 +299,7 @@ def test_error_handling():
         "provider": "invalid",
         "messages": [{"role": "user", "content": "Hello"}],
     }
-    response = httpx.post(f"{LLM_BASE}/chat/completions", json=request_data, timeout=30.0)
+    response = client.post("/chat/completions", json=request_data)
     print(f"Status Code: {response.status_code}")
 
     if response.status_code == 500:
@@ -302,7 +314,7 @@ def test_error_handling():
         "messages": [{"role": "user", "content": "Hello"}],
         "max_tokens": 100000,
     }
-    response = httpx.post(f"{LLM_BASE}/chat/completions", json=request_data, timeout=30.0)
+    response = client.post("/chat/completions", json=request_data)
     print(f"Status Code: {response.status_code}")
 
     if response.status_code == 500:
@@ -311,10 +323,9 @@ def test_error_handling():
         print("⚠️ API handled large max_tokens gracefully")
 
     print("✅ Error handling test completed!")
-    return True
 
 
-def test_article_analysis():
+def test_article_analysis(client):
     """Test research article analysis pipeline."""
     print("\n=== Testing Article Analysis ===")
 
@@ -336,80 +347,21 @@ def test_article_analysis():
         "content": test_article["content"],
     }
 
-    response = httpx.post(f"{LLM_BASE}/analyze", json=request_data, timeout=30.0)
+    response = client.post("/analyze", json=request_data)
 
     print(f"Status Code: {response.status_code}")
 
-    if response.status_code == 200:
-        result = response.json()
-        print("Analysis Result:")
-        print(json.dumps(result, indent=2, ensure_ascii=False))
-
-        assert "category" in result
-        assert "importance_score" in result
-        assert "keywords" in result
-        assert "field" in result
-        assert "summary_korean" in result
-        assert isinstance(result["keywords"], list)
-        assert 0.0 <= result["importance_score"] <= 1.0
-        print("✅ Article analysis test passed!")
-        return True
-    else:
-        print(f"❌ Failed: {response.json()}")
-        return False
-
-
-def main():
-    """Run all LLM API endpoint tests."""
-    print("🚀 Starting LLM API Endpoint Tests")
-    print(f"Base URL: {BASE_URL}")
-    print(f"LLM Endpoints: {LLM_BASE}")
-    print("\nIMPORTANT: Make sure the backend server is running:")
-    print("  uvicorn src.app.api.main:app --reload\n")
-
-    tests = [
-        ("OpenAI Chat Completion", test_chat_completion_openai),
-        ("Claude Chat Completion", test_chat_completion_claude),
-        ("JSON Response Format", test_json_response_format),
-        ("Article Summarization", test_article_summarization),
-        ("Embedding Generation", test_embedding_generation),
-        ("Temperature Comparison", test_temperature_comparison),
-        ("Error Handling", test_error_handling),
-        ("Article Analysis", test_article_analysis),
-    ]
-
-    passed = 0
-    failed = 0
-    skipped = 0
-
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            if result is True:
-                passed += 1
-            elif result is False:
-                failed += 1
-            else:  # None means skipped
-                skipped += 1
-                print(f"⚠️ Test '{test_name}' was skipped")
-        except Exception as e:
-            failed += 1
-            print(f"\n❌ Test '{test_name}' raised exception: {e}")
-
-    print("\n" + "=" * 60)
-    print("📊 Test Summary")
-    print("=" * 60)
-    print(f"Total Tests: {len(tests)}")
-    print(f"✅ Passed: {passed}")
-    print(f"❌ Failed: {failed}")
-    print(f"⚠️ Skipped: {skipped}")
-    print("=" * 60)
-
-    if failed == 0:
-        print("\n✅ All tests passed!")
-    else:
-        print(f"\n❌ {failed} test(s) failed")
+    assert response.status_code == 200, f"❌ Failed: {response.json()}"
 
+    result = response.json()
+    print("Analysis Result:")
+    print(_pretty(result))
 
-if __name__ == "__main__":
-    main()
+    assert "category" in result
+    assert "importance_score" in result
+    assert "keywords" in result
+    assert "field" in result
+    assert "summary_korean" in result
+    assert isinstance(result["keywords"], list)
+    assert 0.0 <= result["importance_score"] <= 1.0
+    print("✅ Article analysis test passed!")
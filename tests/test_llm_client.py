@@ -2,9 +2,12 @@
 
 import json
 import os
+import time
 
 import pytest
 
+import src.app.llm.client as llm_client_module
+from src.app.core.retry import RateLimiter
 from src.app.llm import LLMClient
 
 # Check if API keys are available for integration tests
@@ -32,6 +35,17 @@ class TestLLMClient:
         with pytest.raises(ValueError):
             LLMClient(provider="invalid")
 
+    def test_rate_limiter_from_settings(self, monkeypatch):
+        """Test that the client-side rate limiter follows LLM_*_PER_MINUTE."""
+        monkeypatch.setattr(llm_client_module.settings, "LLM_REQUESTS_PER_MINUTE", 0)
+        monkeypatch.setattr(llm_client_module.settings, "LLM_TOKENS_PER_MINUTE", 0)
+        assert LLMClient(provider="openai").rate_limiter is None
+
+        monkeypatch.setattr(llm_client_module.settings, "LLM_TOKENS_PER_MINUTE", 30000)
+        limiter = LLMClient(provider="openai").rate_limiter
+        assert limiter.max_tokens == 30000
+        assert limiter.time_window == 60.0
+
     @pytest.mark.skipif(not HAS_OPENAI_KEY, reason="Requires OPENAI_API_KEY")
     def test_openai_chat_completion(self):
         """Test OpenAI chat completion (requires API key)."""
@@ -106,3 +120,41 @@ class TestLLMClient:
         embedding = await client.agenerate_embedding(text)
         assert isinstance(embedding, list)
         assert len(embedding) == 1536
+
+
+class TestRateLimiter:
+    """Test proactive request/token rate limiting."""
+
+    @pytest.mark.asyncio
+    async def test_no_wait_under_limits(self):
+        """Test that calls within both budgets never wait."""
+        limiter = RateLimiter(max_calls=15, time_window=60.0, max_tokens=30000)
+        for _ in range(15):
+            await limiter.acquire(1000)
+        assert limiter.throttled == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_for_token_budget(self):
+        """Test that a call exceeding the token budget waits for the window to slide."""
+        limiter = RateLimiter(max_calls=100, time_window=0.05, max_tokens=100)
+        start = time.monotonic()
+        await limiter.acquire(60)
+        await limiter.acquire(60)
+        assert time.monotonic() - start >= 0.04
+        assert limiter.throttled == 1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_call_slot(self):
+        """Test that calls beyond max_calls wait for the oldest call to expire."""
+        limiter = RateLimiter(max_calls=2, time_window=0.05)
+        for _ in range(3):
+            await limiter.acquire()
+        assert limiter.throttled == 1
+        assert len(limiter.calls) <= 2
+
+    @pytest.mark.asyncio
+    async def test_oversized_call_passes_on_empty_window(self):
+        """Test that a single call above the whole token budget is not blocked forever."""
+        limiter = RateLimiter(max_calls=10, time_window=60.0, max_tokens=100)
+        await limiter.acquire(500)
+        assert limiter.throttled == 0
@@ -8,57 +8,69 @@ Checkpoint 3 검증:
 """
 
 import asyncio
+import math
 import time
+from types import MappingProxyType
 
 import pytest
 
 from src.app.processors import ProcessingPipeline
 
-# 테스트용 샘플 아티클
-SAMPLE_ARTICLES = [
-    {
-        "title": "Attention Is All You Need",
-        "content": "We propose the Transformer, based solely on attention mechanisms...",
-        "url": "https://arxiv.org/abs/1706.03762",
-        "source_name": "arXiv",
-        "metadata": {"year": 2017, "citations": 50000},
-    },
-    {
-        "title": "GPT-4 Technical Report",
-        "content": "GPT-4 is a large multimodal model...",
-        "url": "https://openai.com/research/gpt-4",
-        "source_name": "OpenAI",
-        "metadata": {"year": 2023, "citations": 5000},
-    },
-    {
-        "title": "BERT: Pre-training of Deep Bidirectional Transformers",
-        "content": "We introduce BERT, a new language representation model...",
-        "url": "https://arxiv.org/abs/1810.04805",
-        "source_name": "arXiv",
-        "metadata": {"year": 2018, "citations": 30000},
-    },
-    {
-        "title": "ResNet: Deep Residual Learning",
-        "content": "Deep residual learning framework...",
-        "url": "https://arxiv.org/abs/1512.03385",
-        "source_name": "arXiv",
-        "metadata": {"year": 2015, "citations": 100000},
-    },
-    {
-        "title": "Generative Adversarial Networks",
-        "content": "We propose a new framework for estimating generative models...",
-        "url": "https://arxiv.org/abs/1406.2661",
-        "source_name": "arXiv",
-        "metadata": {"year": 2014, "citations": 80000},
-    },
-]
+# 기본은 결정적 가짜 LLM/임베딩 사용, RUN_INTEGRATION=1 이면 실제 API 호출 (conftest.fake_llm)
+pytestmark = pytest.mark.usefixtures("fake_llm")
+
+# 테스트용 샘플 아티클 (읽기 전용: 테스트 간 변경 방지)
+SAMPLE_ARTICLES = tuple(
+    MappingProxyType(article)
+    for article in [
+        {
+            "title": "Attention Is All You Need",
+            "content": "We propose the Transformer, based solely on attention mechanisms...",
+            "url": "https://arxiv.org/abs/1706.03762",
+            "source_name": "arXiv",
+            "metadata": {"year": 2017, "citations": 50000},
+        },
+        {
+            "title": "GPT-4 Technical Report",
+            "content": "GPT-4 is a large multimodal model...",
+            "url": "https://openai.com/research/gpt-4",
+            "source_name": "OpenAI",
+            "metadata": {"year": 2023, "citations": 5000},
+        },
+        {
+            "title": "BERT: Pre-training of Deep Bidirectional Transformers",
+            "content": "We introduce BERT, a new language representation model...",
+            "url": "https://arxiv.org/abs/1810.04805",
+            "source_name": "arXiv",
+            "metadata": {"year": 2018, "citations": 30000},
+        },
+        {
+            "title": "ResNet: Deep Residual Learning",
+            "content": "Deep residual learning framework...",
+            "url": "https://arxiv.org/abs/1512.03385",
+            "source_name": "arXiv",
+            "metadata": {"year": 2015, "citations": 100000},
+        },
+        {
+            "title": "Generative Adversarial Networks",
+            "content": "We propose a new framework for estimating generative models...",
+            "url": "https://arxiv.org/abs/1406.2661",
+            "source_name": "arXiv",
+            "metadata": {"year": 2014, "citations": 80000},
+        },
+    ]
+)
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    """모듈 전체에서 공유하는 파이프라인 (LLM 클라이언트와 커넥션 풀 재사용)"""
+    return ProcessingPipeline(provider="openai", summary_length="medium")
 
 
 @pytest.mark.asyncio
-async def test_single_article_processing():
+async def test_single_article_processing(pipeline):
     """✅ Checkpoint 3.1: 통합 파이프라인 1개 논문 처리 성공"""
-    pipeline = ProcessingPipeline(provider="openai", summary_length="medium")
-
     start = time.time()
     result = await pipeline.process_article(
         title=SAMPLE_ARTICLES[0]["title"],
@@ -74,7 +86,7 @@ async def test_single_article_processing():
     assert len(result.summary) > 0
     assert 0.0 <= result.importance_score <= 1.0
     assert result.category in ["paper", "news", "report", "blog", "other"]
-    assert len(result.embedding) == 1536
+    assert len(result.embedding) == pipeline.embedder.get_embedding_dimension()
     assert elapsed < 30  # 30초 이내
 
     print(f"✅ 단일 처리 성공 ({elapsed:.2f}초)")
@@ -83,30 +95,106 @@ async def test_single_article_processing():
 
 
 @pytest.mark.asyncio
-async def test_batch_processing():
+@pytest.mark.parametrize("max_concurrent", [1, 3, 5])  # 순차 / 세마포어 제한 / 전체 병렬
+async def test_batch_processing(pipeline, monkeypatch, max_concurrent):
     """✅ Checkpoint 3.2: 배치 처리 5개 논문 동시 처리 성공"""
-    pipeline = ProcessingPipeline(provider="openai", summary_length="short")
+    # 요약 길이는 호출 시점에 읽으므로 이 테스트에서만 short로 변경
+    monkeypatch.setattr(pipeline, "summary_length", "short")
 
     start = time.time()
-    results = await pipeline.process_batch(SAMPLE_ARTICLES, max_concurrent=3)
+    results = await pipeline.process_batch(SAMPLE_ARTICLES, max_concurrent=max_concurrent)
     elapsed = time.time() - start
 
     # 검증
     assert len(results) == 5
     assert all(len(r.summary) > 0 for r in results)
     assert all(0.0 <= r.importance_score <= 1.0 for r in results)
-    assert all(len(r.embedding) == 1536 for r in results)
-    assert elapsed < 30  # 30초 이내
+    assert all(len(r.embedding) == pipeline.embedder.get_embedding_dimension() for r in results)
+    # 동시 처리 단위(웨이브)당 15초: max_concurrent=3 이면 기존 기준인 30초 이내
+    waves = math.ceil(len(SAMPLE_ARTICLES) / max_concurrent)
+    assert elapsed < 15 * waves
 
     print(f"✅ 배치 처리 성공 ({elapsed:.2f}초)")
     print(f"   평균 처리 시간: {elapsed/len(results):.2f}초/아티클")
 
 
 @pytest.mark.asyncio
-async def test_pipeline_utilities():
-    """파이프라인 유틸리티 함수 테스트"""
-    pipeline = ProcessingPipeline(provider="openai")
+async def test_pipeline_streaming(pipeline):
+    """세마포어 큐 방식: 먼저 끝난 아티클부터 결과 확인 (배치 전체 대기 없음)"""
+    semaphore = asyncio.Semaphore(3)
+
+    async def process(article):
+        async with semaphore:
+            return await pipeline.process_article(**article)
+
+    tasks = [asyncio.create_task(process(article)) for article in SAMPLE_ARTICLES]
+
+    titles = []
+    for next_done in asyncio.as_completed(tasks):
+        result = await next_done
+        assert len(result.summary) > 0
+        assert 0.0 <= result.importance_score <= 1.0
+        titles.append(result.title)
+
+    assert sorted(titles) == sorted(article["title"] for article in SAMPLE_ARTICLES)
+    print(f"✅ 스트리밍 처리 성공 ({len(titles)}개)")
+
+
+@pytest.mark.asyncio
+async def test_batch_processing_embeds_in_one_request(pipeline, monkeypatch):
+    """배치 처리 시 임베딩은 아티클 수와 관계없이 1회 요청으로 생성"""
+    embedder = pipeline.embedder
+    requests = []
+    embed_many_with_retry = embedder._embed_many_with_retry
+
+    async def recording_embed_many_with_retry(texts):
+        requests.append(texts)
+        return await embed_many_with_retry(texts)
+
+    # 이전 테스트의 캐시 적중 없이 모든 아티클이 요청에 포함되도록 비움
+    embedder.clear_cache()
+    monkeypatch.setattr(embedder, "_embed_many_with_retry", recording_embed_many_with_retry)
+
+    results = await pipeline.process_batch(SAMPLE_ARTICLES)
 
+    assert len(results) == 5
+    assert len(requests) == 1
+    assert len(requests[0]) == 5
+
+
+@pytest.mark.asyncio
+async def test_batch_embedding_fallback_respects_max_concurrent(pipeline, monkeypatch):
+    """일괄 임베딩 실패 시 아티클별 재시도도 max_concurrent 이내로 실행"""
+    embedder = pipeline.embedder
+    in_flight = 0
+    peak = 0
+    embed_article = embedder.embed_article
+
+    async def failing_embed_articles(articles):
+        raise RuntimeError("batch embedding unavailable")
+
+    async def tracking_embed_article(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await embed_article(**kwargs)
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(embedder, "embed_articles", failing_embed_articles)
+    monkeypatch.setattr(embedder, "embed_article", tracking_embed_article)
+
+    results = await pipeline.process_batch(SAMPLE_ARTICLES, max_concurrent=2)
+
+    assert len(results) == 5
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_utilities(pipeline):
+    """파이프라인 유틸리티 함수 테스트"""
     # 2개만 처리
     results = await pipeline.process_batch(SAMPLE_ARTICLES[:2])
 
@@ -129,10 +217,8 @@ async def test_pipeline_utilities():
 
 
 @pytest.mark.asyncio
-async def test_processed_article_to_dict():
+async def test_processed_article_to_dict(pipeline):
     """ProcessedArticle to_dict 테스트"""
-    pipeline = ProcessingPipeline(provider="openai")
-
     result = await pipeline.process_article(
         title=SAMPLE_ARTICLES[0]["title"],
         content=SAMPLE_ARTICLES[0]["content"],
@@ -154,19 +240,24 @@ async def test_processed_article_to_dict():
 
 
 if __name__ == "__main__":
+    from _event_loop import run
+
     # pytest 대신 직접 실행
     async def run_all():
         print("=" * 60)
         print("통합 파이프라인 테스트")
         print("=" * 60)
 
-        await test_single_article_processing()
-        await test_batch_processing()
-        await test_pipeline_utilities()
-        await test_processed_article_to_dict()
+        pipeline = ProcessingPipeline(provider="openai", summary_length="medium")
+        await test_single_article_processing(pipeline)
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            await test_batch_processing(pipeline, monkeypatch, max_concurrent=3)
+        await test_pipeline_streaming(pipeline)
+        await test_pipeline_utilities(pipeline)
+        await test_processed_article_to_dict(pipeline)
 
         print("\n" + "=" * 60)
         print("✅ 모든 테스트 통과!")
         print("=" * 60)
 
-    asyncio.run(run_all())
+    run(run_all())
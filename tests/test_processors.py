@@ -9,6 +9,7 @@ Checkpoint 2 검증:
 """
 
 import asyncio
+from types import MappingProxyType
 
 import pytest
 
@@ -19,20 +20,25 @@ from src.app.processors import (
     TextEmbedder,
 )
 
-# 테스트용 샘플 아티클
-SAMPLE_ARTICLE = {
-    "title": "Attention Is All You Need",
-    "content": """
-    We propose a new simple network architecture, the Transformer,
-    based solely on attention mechanisms, dispensing with recurrence
-    and convolutions entirely. Experiments on two machine translation
-    tasks show these models to be superior in quality while being
-    more parallelizable and requiring significantly less time to train.
-    """,
-    "source_name": "arXiv",
-    "url": "https://arxiv.org/abs/1706.03762",
-    "metadata": {"citations": 50000, "year": 2017},
-}
+# 기본은 결정적 가짜 LLM/임베딩 사용, RUN_INTEGRATION=1 이면 실제 API 호출 (conftest.fake_llm)
+pytestmark = pytest.mark.usefixtures("fake_llm")
+
+# 테스트용 샘플 아티클 (읽기 전용: 테스트 간 변경 방지)
+SAMPLE_ARTICLE = MappingProxyType(
+    {
+        "title": "Attention Is All You Need",
+        "content": """
+        We propose a new simple network architecture, the Transformer,
+        based solely on attention mechanisms, dispensing with recurrence
+        and convolutions entirely. Experiments on two machine translation
+        tasks show these models to be superior in quality while being
+        more parallelizable and requiring significantly less time to train.
+        """,
+        "source_name": "arXiv",
+        "url": "https://arxiv.org/abs/1706.03762",
+        "metadata": {"citations": 50000, "year": 2017},
+    }
+)
 
 
 @pytest.mark.asyncio
@@ -119,57 +125,103 @@ async def test_embedder():
     print(f"✅ 임베딩 생성 성공: {len(embedding)} dimensions")
 
 
+@pytest.mark.asyncio
+async def test_embed_many_splits_by_token_budget(monkeypatch):
+    """embed_many: 요청당 입력 수뿐 아니라 총 토큰 수 한도로도 요청 분할"""
+    embedder = TextEmbedder(use_cache=False)
+    texts = [f"{SAMPLE_ARTICLE['title']} {i}" for i in range(6)]
+    token_counts = embedder.count_tokens_batch(texts)
+
+    # 요청당 토큰 한도를 텍스트 2개 분량으로 제한
+    monkeypatch.setattr(embedder, "MAX_TOKENS_PER_REQUEST", max(token_counts) * 2)
+    requests = []
+    embed_many_with_retry = embedder._embed_many_with_retry
+
+    async def recording_embed_many_with_retry(inputs):
+        requests.append(inputs)
+        return await embed_many_with_retry(inputs)
+
+    monkeypatch.setattr(embedder, "_embed_many_with_retry", recording_embed_many_with_retry)
+
+    embeddings = await embedder.embed_many(texts)
+
+    assert len(embeddings) == len(texts)
+    assert len(requests) >= 3
+    assert [text for request in requests for text in request] == texts
+    assert all(sum(embedder.count_tokens_batch(r)) <= embedder.MAX_TOKENS_PER_REQUEST for r in requests)
+
+
+def test_count_tokens_batch_parallel_threshold(monkeypatch):
+    """count_tokens_batch: 소량은 순차 encode, 대량만 encode_batch (스레드 수는 텍스트 수 이하)"""
+    embedder = TextEmbedder(use_cache=False)
+    calls = []
+    encode_batch = embedder.tokenizer.encode_batch
+
+    def recording_encode_batch(texts, num_threads):
+        calls.append((len(texts), num_threads))
+        return encode_batch(texts, num_threads=num_threads)
+
+    monkeypatch.setattr(embedder.tokenizer, "encode_batch", recording_encode_batch)
+
+    small = [SAMPLE_ARTICLE["title"]] * (embedder.PARALLEL_TOKENIZE_MIN_TEXTS - 1)
+    assert embedder.count_tokens_batch(small) == [embedder.count_tokens(t) for t in small]
+    assert calls == []
+
+    large = [SAMPLE_ARTICLE["title"]] * embedder.PARALLEL_TOKENIZE_MIN_TEXTS
+    assert embedder.count_tokens_batch(large) == [embedder.count_tokens(t) for t in large]
+    assert len(calls) == 1 and calls[0][0] == len(large) and 1 <= calls[0][1] <= len(large)
+
+
 @pytest.mark.asyncio
 async def test_all_processors_integration():
-    """✅ Checkpoint 2 통합 테스트: 모든 프로세서 순차 실행"""
+    """✅ Checkpoint 2 통합 테스트: 모든 프로세서 실행 (독립 단계는 동시 실행)"""
     print("\n" + "=" * 60)
     print("Checkpoint 2 통합 검증")
     print("=" * 60)
 
-    # 1. 요약 생성
-    print("\n1️⃣ 요약 생성...")
+    # 1-3. 요약, 중요도 평가, 카테고리 분류는 서로 독립적이므로 동시에 실행
+    print("\n1️⃣-3️⃣ 요약 / 중요도 평가 / 카테고리 분류 (동시 실행)...")
     summarizer = ArticleSummarizer(provider="openai")
-    summary = await summarizer.summarize(
-        title=SAMPLE_ARTICLE["title"],
-        content=SAMPLE_ARTICLE["content"],
-        language="ko",
-        length="medium",
+    evaluator = ImportanceEvaluator(provider="openai")
+    classifier = ContentClassifier(provider="openai")
+    summary, eval_result, class_result = await asyncio.gather(
+        summarizer.summarize(
+            title=SAMPLE_ARTICLE["title"],
+            content=SAMPLE_ARTICLE["content"],
+            language="ko",
+            length="medium",
+        ),
+        evaluator.evaluate(
+            title=SAMPLE_ARTICLE["title"],
+            content=SAMPLE_ARTICLE["content"],
+            metadata=SAMPLE_ARTICLE["metadata"],
+        ),
+        classifier.classify(
+            title=SAMPLE_ARTICLE["title"],
+            content=SAMPLE_ARTICLE["content"],
+            source_name=SAMPLE_ARTICLE["source_name"],
+            url=SAMPLE_ARTICLE["url"],
+        ),
     )
+
     assert len(summary) > 0
     print(f"   ✅ 요약: {summary[:80]}...")
 
-    # 2. 중요도 평가
-    print("\n2️⃣ 중요도 평가...")
-    evaluator = ImportanceEvaluator(provider="openai")
-    eval_result = await evaluator.evaluate(
-        title=SAMPLE_ARTICLE["title"],
-        content=SAMPLE_ARTICLE["content"],
-        metadata=SAMPLE_ARTICLE["metadata"],
-    )
     assert 0.0 <= eval_result["final_score"] <= 1.0
     print(f"   ✅ 최종 점수: {eval_result['final_score']:.2f}")
 
-    # 3. 카테고리 분류
-    print("\n3️⃣ 카테고리 분류...")
-    classifier = ContentClassifier(provider="openai")
-    class_result = await classifier.classify(
-        title=SAMPLE_ARTICLE["title"],
-        content=SAMPLE_ARTICLE["content"],
-        source_name=SAMPLE_ARTICLE["source_name"],
-        url=SAMPLE_ARTICLE["url"],
-    )
     assert class_result["category"] == "paper"
     print(f"   ✅ 카테고리: {class_result['category']}")
 
-    # 4. 임베딩 생성
+    # 4. 임베딩 생성 (요약 결과가 필요하므로 마지막에 실행)
     print("\n4️⃣ 임베딩 생성...")
     embedder = TextEmbedder()
-    embedding = await embedder.embed_article_async(
+    embedding = await embedder.embed_article(
         title=SAMPLE_ARTICLE["title"],
         content=SAMPLE_ARTICLE["content"],
         summary=summary,
     )
-    assert len(embedding) == 1536
+    assert len(embedding) == embedder.get_embedding_dimension()
     print(f"   ✅ 임베딩: {len(embedding)} dimensions")
 
     print("\n" + "=" * 60)
@@ -178,5 +230,7 @@ async def test_all_processors_integration():
 
 
 if __name__ == "__main__":
+    from _event_loop import run
+
     # pytest 대신 직접 실행
-    asyncio.run(test_all_processors_integration())
+    run(test_all_processors_integration())
@@ -2,11 +2,38 @@
 
 from datetime import UTC, datetime, timedelta
 
+import pytest
 from jose import jwt
 
+from app.core import security
 from app.core.config import settings
 from app.core.security import create_access_token, create_magic_link_token, verify_token
 
+TEST_EMAIL = "test@example.com"
+SPECIAL_CHARS_EMAIL = "user+test@example.co.uk"
+LONG_EMAIL = "a" * 100 + "@example.com"
+UNICODE_EMAIL = "사용자@example.com"
+
+
+@pytest.fixture(scope="module")
+def token_bank():
+    """Tokens signed once per module for tests that don't check ``exp``.
+
+    Tests asserting on the expiration time create their own tokens.
+    """
+    return {
+        "access": create_access_token(TEST_EMAIL),
+        "magic_link": create_magic_link_token(TEST_EMAIL),
+    }
+
+
+@pytest.fixture(scope="module")
+def edge_tokens():
+    """Access tokens for the edge-case emails, signed once per module and keyed by email."""
+    return {
+        email: create_access_token(email) for email in (SPECIAL_CHARS_EMAIL, LONG_EMAIL, UNICODE_EMAIL)
+    }
+
 
 class TestMagicLinkToken:
     """Test suite for magic link token creation."""
@@ -105,17 +132,15 @@ class TestTokenVerification:
 
         assert verified_email == test_email
 
-    def test_verify_token_type_mismatch_magic_as_access(self):
+    def test_verify_token_type_mismatch_magic_as_access(self, token_bank):
         """Test that magic link token fails verification as access token."""
-        token = create_magic_link_token("test@example.com")
-        result = verify_token(token, expected_type="access")
+        result = verify_token(token_bank["magic_link"], expected_type="access")
 
         assert result is None
 
-    def test_verify_token_type_mismatch_access_as_magic(self):
+    def test_verify_token_type_mismatch_access_as_magic(self, token_bank):
         """Test that access token fails verification as magic link token."""
-        token = create_access_token("test@example.com")
-        result = verify_token(token, expected_type="magic_link")
+        result = verify_token(token_bank["access"], expected_type="magic_link")
 
         assert result is None
 
@@ -191,14 +216,26 @@ class TestTokenVerification:
         # This is a potential edge case - leaving as is for now
         assert result == ""
 
-    def test_verify_token_default_type_is_access(self):
+    def test_verify_token_default_type_is_access(self, token_bank):
         """Test that verify_token defaults to 'access' type."""
-        token = create_access_token("test@example.com")
-
         # Call without expected_type parameter
-        verified_email = verify_token(token)
+        verified_email = verify_token(token_bank["access"])
+
+        assert verified_email == TEST_EMAIL
+
+    def test_verify_cached_token_after_expiry(self, monkeypatch):
+        """Test that a token verified (and cached) while valid is rejected once expired."""
+        token = create_access_token("cached@example.com")
+        assert verify_token(token) == "cached@example.com"
+
+        class AfterExpiry(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.now(tz) + timedelta(days=settings.ACCESS_TOKEN_EXPIRE_DAYS + 1)
+
+        monkeypatch.setattr(security, "datetime", AfterExpiry)
 
-        assert verified_email == "test@example.com"
+        assert verify_token(token) is None
 
     def test_verify_token_with_wrong_secret(self):
         """Test that token signed with wrong secret fails verification."""
@@ -220,26 +257,20 @@ class TestTokenVerification:
 class TestTokenEdgeCases:
     """Test edge cases for token handling."""
 
-    def test_special_characters_in_email(self):
+    def test_special_characters_in_email(self, edge_tokens):
         """Test token creation and verification with special characters in email."""
-        special_email = "user+test@example.co.uk"
-        token = create_access_token(special_email)
-        verified_email = verify_token(token)
+        verified_email = verify_token(edge_tokens[SPECIAL_CHARS_EMAIL])
 
-        assert verified_email == special_email
+        assert verified_email == SPECIAL_CHARS_EMAIL
 
-    def test_very_long_email(self):
+    def test_very_long_email(self, edge_tokens):
         """Test token creation and verification with very long email."""
-        long_email = "a" * 100 + "@example.com"
-        token = create_access_token(long_email)
-        verified_email = verify_token(token)
+        verified_email = verify_token(edge_tokens[LONG_EMAIL])
 
-        assert verified_email == long_email
+        assert verified_email == LONG_EMAIL
 
-    def test_unicode_email(self):
+    def test_unicode_email(self, edge_tokens):
         """Test token creation and verification with unicode characters."""
-        unicode_email = "사용자@example.com"
-        token = create_access_token(unicode_email)
-        verified_email = verify_token(token)
+        verified_email = verify_token(edge_tokens[UNICODE_EMAIL])
 
-        assert verified_email == unicode_email
+        assert verified_email == UNICODE_EMAIL
@@ -1,75 +1,75 @@
 """Test script for users endpoints."""
 
+import asyncio
+import logging
+
 import httpx
 
+logger = logging.getLogger(__name__)
+
 BASE_URL = "http://localhost:8000"
 
 
-def get_access_token():
+async def get_access_token(client):
     """Get access token for testing."""
     # Request magic link
-    response = httpx.post(
-        f"{BASE_URL}/auth/magic-link",
+    response = await client.post(
+        "/auth/magic-link",
         json={"email": "test@example.com"},
-        timeout=10.0,
     )
     magic_token = response.json().get("token")
 
     # Verify magic link
-    response = httpx.get(
-        f"{BASE_URL}/auth/verify",
+    response = await client.get(
+        "/auth/verify",
         params={"token": magic_token},
-        timeout=10.0,
     )
-    return response.json().get("access_token"), response.json().get("user")["id"]
+    data = response.json()
+    return data.get("access_token"), data.get("user")["id"]
 
 
-def test_get_current_user(access_token):
+async def test_get_current_user(client, access_token):
     """Test GET /users/me endpoint."""
-    print("\n=== Testing GET /users/me ===")
-
-    response = httpx.get(
-        f"{BASE_URL}/users/me",
+    response = await client.get(
+        "/users/me",
         headers={"Authorization": f"Bearer {access_token}"},
-        timeout=10.0,
     )
 
+    print("\n=== Testing GET /users/me ===")
+    data = response.json()
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
+    logger.debug("Response: %s", data)
 
     if response.status_code == 200:
         print("✅ Current user info retrieved successfully")
         return True
     else:
-        print(f"❌ Failed: {response.json()}")
+        print(f"❌ Failed: {data}")
         return False
 
 
-def test_get_preferences(access_token, user_id):
+async def test_get_preferences(client, access_token, user_id):
     """Test GET /users/{user_id}/preferences endpoint."""
-    print(f"\n=== Testing GET /users/{user_id}/preferences ===")
-
-    response = httpx.get(
-        f"{BASE_URL}/users/{user_id}/preferences",
+    response = await client.get(
+        f"/users/{user_id}/preferences",
         headers={"Authorization": f"Bearer {access_token}"},
-        timeout=10.0,
     )
 
+    print(f"\n=== Testing GET /users/{user_id}/preferences ===")
+    data = response.json()
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
+    logger.debug("Response: %s", data)
 
     if response.status_code == 200:
         print("✅ Preferences retrieved successfully")
-        return response.json()
+        return data
     else:
-        print(f"❌ Failed: {response.json()}")
+        print(f"❌ Failed: {data}")
         return None
 
 
-def test_update_preferences(access_token, user_id):
+async def test_update_preferences(client, access_token, user_id):
     """Test PUT /users/{user_id}/preferences endpoint."""
-    print(f"\n=== Testing PUT /users/{user_id}/preferences ===")
-
     update_data = {
         "research_fields": ["Machine Learning", "Natural Language Processing", "Computer Vision"],
         "keywords": ["transformer", "GPT", "BERT", "attention", "neural networks"],
@@ -80,73 +80,72 @@ def test_update_preferences(access_token, user_id):
         "email_enabled": True,
     }
 
-    response = httpx.put(
-        f"{BASE_URL}/users/{user_id}/preferences",
+    response = await client.put(
+        f"/users/{user_id}/preferences",
         json=update_data,
         headers={"Authorization": f"Bearer {access_token}"},
-        timeout=10.0,
     )
 
+    print(f"\n=== Testing PUT /users/{user_id}/preferences ===")
+    data = response.json()
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
+    logger.debug("Response: %s", data)
 
     if response.status_code == 200:
         print("✅ Preferences updated successfully")
-        return True
+        return data
     else:
-        print(f"❌ Failed: {response.json()}")
-        return False
+        print(f"❌ Failed: {data}")
+        return None
 
 
-def test_get_digests(access_token, user_id):
+async def test_get_digests(client, access_token, user_id):
     """Test GET /users/{user_id}/digests endpoint."""
-    print(f"\n=== Testing GET /users/{user_id}/digests ===")
-
-    response = httpx.get(
-        f"{BASE_URL}/users/{user_id}/digests",
+    response = await client.get(
+        f"/users/{user_id}/digests",
         params={"skip": 0, "limit": 10},
         headers={"Authorization": f"Bearer {access_token}"},
-        timeout=10.0,
     )
 
+    print(f"\n=== Testing GET /users/{user_id}/digests ===")
+    data = response.json()
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
+    logger.debug("Response: %s", data)
 
     if response.status_code == 200:
-        digests_data = response.json()
-        print(f"✅ Digests retrieved: {digests_data['total']} digests found")
+        print(f"✅ Digests retrieved: {data['total']} digests found")
         return True
     else:
-        print(f"❌ Failed: {response.json()}")
+        print(f"❌ Failed: {data}")
         return False
 
 
-def main():
+async def main():
     """Run all users tests."""
     print("🚀 Starting Users Endpoint Tests")
     print(f"Base URL: {BASE_URL}")
 
-    # Get access token
-    print("\n--- Getting access token ---")
-    access_token, user_id = get_access_token()
-    print("✅ Access token obtained")
-    print(f"✅ User ID: {user_id}")
-
-    # Run tests
-    results = []
-
-    # Test 1: Get current user
-    results.append(test_get_current_user(access_token))
-
-    # Test 2: Get preferences
-    preferences = test_get_preferences(access_token, user_id)
-    results.append(preferences is not None)
-
-    # Test 3: Update preferences
-    results.append(test_update_preferences(access_token, user_id))
-
-    # Test 4: Get updated preferences
-    updated_prefs = test_get_preferences(access_token, user_id)
+    # Shared client: keeps the connection alive across requests (HTTP/2 when offered)
+    async with httpx.AsyncClient(base_url=BASE_URL, http2=True, timeout=10.0) as client:
+        # Get access token
+        print("\n--- Getting access token ---")
+        access_token, user_id = await get_access_token(client)
+        print("✅ Access token obtained")
+        print(f"✅ User ID: {user_id}")
+
+        # Tests 1, 2, 5: read-only requests, independent of each other, run concurrently
+        current_user_ok, preferences, digests_ok = await asyncio.gather(
+            test_get_current_user(client, access_token),
+            test_get_preferences(client, access_token, user_id),
+            test_get_digests(client, access_token, user_id),
+        )
+        results = [current_user_ok, preferences is not None, digests_ok]
+
+        # Test 3: Update preferences after the initial read (response carries the updated preferences)
+        updated_prefs = await test_update_preferences(client, access_token, user_id)
+        results.append(updated_prefs is not None)
+
+    # Test 4: Verify updated preferences
     if updated_prefs:
         print("\n--- Verifying updates ---")
         print(f"Research fields: {updated_prefs['research_fields']}")
@@ -154,9 +153,6 @@ def main():
         print(f"Email time: {updated_prefs['email_time']}")
         print(f"Daily limit: {updated_prefs['daily_limit']}")
 
-    # Test 5: Get digests
-    results.append(test_get_digests(access_token, user_id))
-
     # Summary
     print("\n" + "=" * 60)
     if all(results):
@@ -167,4 +163,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())